@@ -0,0 +1,45 @@
+"""
+Shared systems for the benchmark suite
+"""
+
+import numpy as np
+
+# number of atoms in the benchmark systems
+SIZES = [3, 30, 300, 3000, 10000]
+
+# water monomer [a0], O first
+_water_symbols = ["O", "H", "H"]
+_water_geometry = np.array([[0.0, 0.0, 0.0], [1.43, 1.11, 0.0], [-1.43, 1.11, 0.0]])
+
+
+def cluster(nat: int, spacing: float = 5.5, seed: int = 1):
+    r"""Symbols and geometry [a0] of a box of waters on a jittered cubic lattice, truncated to `nat` atoms.
+
+    Deterministic for a given `seed`, and no atoms are closer than about 1.5 a0.
+    """
+    nwat = -(-nat // 3)
+    side = int(np.ceil(nwat ** (1.0 / 3.0)))
+    grid = np.indices((side, side, side)).reshape(3, -1).T[:nwat] * spacing
+    grid = grid + np.random.default_rng(seed).uniform(-0.5, 0.5, grid.shape)
+
+    symbols = np.array(_water_symbols * nwat)[:nat]
+    geometry = (grid[:, None, :] + _water_geometry[None, :, :]).reshape(-1, 3)[:nat]
+    return symbols, geometry
+
+
+def cluster_molecule(nat: int, **kwargs):
+    r"""Validated :class:`~qcelemental.models.Molecule` of :func:`cluster`."""
+    import qcelemental as qcel
+
+    symbols, geometry = cluster(nat, **kwargs)
+    return qcel.models.Molecule(symbols=symbols, geometry=geometry, fix_com=True, fix_orientation=True)
+
+
+def xyz_string(nat: int) -> str:
+    r"""XYZ file contents for :func:`cluster`, in Angstrom."""
+    import qcelemental as qcel
+
+    symbols, geometry = cluster(nat)
+    geometry = geometry * qcel.constants.bohr2angstroms
+    lines = [str(nat), ""] + [f"{s:2} {x:16.10f} {y:16.10f} {z:16.10f}" for s, (x, y, z) in zip(symbols, geometry)]
+    return "\n".join(lines)
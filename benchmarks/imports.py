@@ -0,0 +1,19 @@
+"""
+Import time, each measured in a fresh interpreter
+"""
+
+
+def timeraw_import_qcelemental():
+    return "import qcelemental"
+
+
+def timeraw_import_qcelemental_models():
+    return "from qcelemental.models import Molecule, AtomicResult"
+
+
+def timeraw_first_use_periodictable():
+    return "qcelemental.periodictable.to_Z('C')", "import qcelemental"
+
+
+def timeraw_first_use_constants():
+    return "qcelemental.constants.conversion_factor('hartree', 'kcal/mol')", "import qcelemental"
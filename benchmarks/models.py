@@ -0,0 +1,75 @@
+"""
+Validation of computation records and comparison of nested data
+"""
+
+import numpy as np
+
+import qcelemental as qcel
+
+from .common import SIZES, cluster_molecule
+
+
+class AtomicResultValidation:
+    params = SIZES
+    param_names = ["nat"]
+
+    def setup(self, nat):
+        mol = cluster_molecule(nat)
+        gradient = np.random.default_rng(4).uniform(-0.01, 0.01, (nat, 3))
+        self.data = {
+            "molecule": mol.dict(),
+            "driver": "gradient",
+            "model": {"method": "UFF"},
+            "return_result": gradient,
+            "properties": {"calcinfo_natom": nat, "return_energy": -1.0, "return_gradient": gradient},
+            "provenance": {"creator": "benchmark"},
+            "success": True,
+        }
+
+    def time_AtomicResult(self, nat):
+        qcel.models.AtomicResult(**self.data)
+
+
+class OptimizationResultDict:
+    params = [10, 100]
+    param_names = ["nsteps"]
+
+    def setup(self, nsteps):
+        mol = cluster_molecule(30)
+        gradient = np.random.default_rng(4).uniform(-0.01, 0.01, (30, 3))
+        result = {
+            "molecule": mol,
+            "driver": "gradient",
+            "model": {"method": "UFF"},
+            "return_result": gradient,
+            "properties": {"calcinfo_natom": 30, "return_energy": -1.0, "return_gradient": gradient},
+            "provenance": {"creator": "benchmark"},
+            "success": True,
+        }
+        self.opt = qcel.models.OptimizationResult(
+            initial_molecule=mol,
+            final_molecule=mol,
+            trajectory=[result] * nsteps,
+            energies=[-1.0] * nsteps,
+            input_specification={"model": {"method": "UFF"}},
+            provenance={"creator": "benchmark"},
+            success=True,
+        )
+
+    def time_dict(self, nsteps):
+        self.opt.dict()
+
+    def time_serialize_json(self, nsteps):
+        self.opt.serialize("json")
+
+
+class CompareRecursive:
+    params = SIZES
+    param_names = ["nat"]
+
+    def setup(self, nat):
+        self.expected = cluster_molecule(nat).dict()
+        self.computed = cluster_molecule(nat).dict()
+
+    def time_compare_recursive(self, nat):
+        qcel.testing.compare_recursive(self.expected, self.computed, atol=1.0e-6, quiet=True)
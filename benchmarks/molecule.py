@@ -0,0 +1,46 @@
+"""
+Molecule construction and hashing
+"""
+
+import numpy as np
+
+import qcelemental as qcel
+
+from .common import SIZES, cluster, cluster_molecule, xyz_string
+
+
+class FromData:
+    params = (SIZES, ["xyz", "psi4", "dict", "numpy"])
+    param_names = ["nat", "dtype"]
+
+    def setup(self, nat, dtype):
+        if dtype == "xyz":
+            self.data = xyz_string(nat)
+        elif dtype == "psi4":
+            self.data = "units bohr\nno_com\nno_reorient\n" + "\n".join(xyz_string(nat).splitlines()[2:])
+        elif dtype == "dict":
+            self.data = cluster_molecule(nat).dict()
+            # so the dict is validated like fresh input
+            self.data.pop("validated", None)
+        elif dtype == "numpy":
+            symbols, geometry = cluster(nat)
+            self.data = np.column_stack([qcel.periodictable.to_Z_array(symbols), geometry])
+
+    def time_from_data(self, nat, dtype):
+        if dtype == "numpy":
+            qcel.models.Molecule.from_data(self.data, dtype, units="Bohr")
+        else:
+            qcel.models.Molecule.from_data(self.data, dtype)
+
+
+class Hash:
+    params = (SIZES, [1, 2])
+    param_names = ["nat", "hash_version"]
+
+    def setup(self, nat, hash_version):
+        self.mol = cluster_molecule(nat)
+
+    def time_get_hash(self, nat, hash_version):
+        # memoized on the instance, so start cold every call
+        self.mol._cache.clear()
+        self.mol.get_hash(hash_version)
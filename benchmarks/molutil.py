@@ -0,0 +1,170 @@
+"""
+Alignment and connectivity
+"""
+
+import numpy as np
+
+import qcelemental as qcel
+
+from .common import SIZES, cluster, cluster_molecule
+
+
+class Align:
+    params = (SIZES, [True, False])
+    param_names = ["nat", "atoms_map"]
+    timeout = 600
+
+    def setup(self, nat, atoms_map):
+        # the mapping search is superlinear; skip where a single run would take minutes
+        if not atoms_map and nat > 300:
+            raise NotImplementedError
+
+        self.ref = cluster_molecule(nat)
+        rng = np.random.default_rng(2)
+        perm = np.arange(nat) if atoms_map else rng.permutation(nat)
+        rot = qcel.util.random_rotation_matrix()
+        self.cmol = qcel.models.Molecule(
+            symbols=self.ref.symbols[perm],
+            geometry=(self.ref.geometry[perm] @ rot) + rng.uniform(-3.0, 3.0, 3),
+            fix_com=True,
+            fix_orientation=True,
+        )
+
+    def time_align(self, nat, atoms_map):
+        self.cmol.align(self.ref, atoms_map=atoms_map, mols_align=True, verbose=0)
+
+
+class B787:
+    params = (SIZES, ["hungarian_uno", "permutative"])
+    param_names = ["nat", "algorithm"]
+
+    def setup(self, nat, algorithm):
+        if (algorithm == "permutative" and nat > 3) or nat > 300:
+            raise NotImplementedError
+
+        symbols, self.rgeom = cluster(nat)
+        self.runiq = self.cuniq = symbols
+
+        # shuffle atoms among their own element, then rotate
+        rng = np.random.default_rng(3)
+        perm = np.arange(nat)
+        for sym in set(symbols):
+            same = np.nonzero(symbols == sym)[0]
+            perm[same] = rng.permutation(same)
+        self.cgeom = self.rgeom[perm] @ qcel.util.random_rotation_matrix()
+
+    def time_B787(self, nat, algorithm):
+        qcel.molutil.B787(
+            self.cgeom, self.rgeom, self.cuniq, self.runiq, algorithm=algorithm, mols_align=True, verbose=0
+        )
+
+
+class KabschBatch:
+    params = [100, 1000]
+    param_names = ["nordering"]
+
+    def setup(self, nordering):
+        symbols, self.rgeom = cluster(30)
+        rng = np.random.default_rng(6)
+        cgeom = self.rgeom @ qcel.util.random_rotation_matrix()
+        self.cgeoms = np.stack([cgeom[rng.permutation(30)] for _ in range(nordering)])
+
+    def time_kabsch_align_batch(self, nordering):
+        qcel.molutil.kabsch_align_batch(self.rgeom, self.cgeoms)
+
+    def time_kabsch_align(self, nordering):
+        for cgeom in self.cgeoms:
+            qcel.molutil.kabsch_align(self.rgeom, cgeom)
+
+
+class LinearSumAssignment:
+    params = ([50, 200, 500], ["lapjv", "munkres"])
+    param_names = ["n", "solver"]
+
+    def setup(self, n, solver):
+        if solver == "munkres" and n > 200:
+            raise NotImplementedError
+
+        # headless NRE-like cost of a single atom class, as screened by B787
+        rng = np.random.default_rng(8)
+        sums = rng.uniform(0.0, 100.0, n)
+        self.cost = (sums[:, None] - sums[rng.permutation(n)][None, :] + rng.normal(0.0, 1.0, (n, 1))) ** 2
+        if solver == "lapjv":
+            self.solve = qcel.util.linear_sum_assignment
+        else:
+            from qcelemental.util.scipy_hungarian import linear_sum_assignment
+
+            self.solve = linear_sum_assignment
+
+    def time_linear_sum_assignment(self, n, solver):
+        self.solve(self.cost.copy(), return_cost=True)
+
+
+class Uno:
+    params = ([6, 8], ["generator", "networkx"])
+    param_names = ["n", "method"]
+
+    def setup(self, n, method):
+        # complete bipartite graph, as for a class of n atoms all at one distance
+        self.edges = [(l, r) for l in range(n) for r in range(n)]
+        self.match = [(i, i) for i in range(n)]
+        if method == "generator":
+            self.enumerate = lambda: list(qcel.util.uno(self.edges, match=self.match))
+        else:
+            import networkx as nx
+
+            from qcelemental.util.gph_uno_bipartite import _enumMaximumMatching
+
+            g = nx.Graph()
+            for l, r in self.edges:
+                g.add_node((0, l), bipartite=0)
+                g.add_node((1, r), bipartite=1)
+                g.add_edge((0, l), (1, r))
+            starter = {(0, l): (1, r) for l, r in self.match}
+            self.enumerate = lambda: _enumMaximumMatching(g, starter)
+
+    def time_uno(self, n, method):
+        self.enumerate()
+
+    def time_uno_first(self, n, method):
+        if method == "networkx":
+            raise NotImplementedError
+        next(qcel.util.uno(self.edges, match=self.match))
+
+
+class AlignMany:
+    params = [10, 100]
+    param_names = ["nref"]
+    timeout = 600
+
+    def setup(self, nref):
+        mol = cluster_molecule(30)
+        rng = np.random.default_rng(5)
+        self.library = [
+            mol.copy(update={"geometry": mol.geometry + rng.normal(0.0, 0.2, mol.geometry.shape)}) for _ in range(nref)
+        ]
+        perm = rng.permutation(30)
+        self.cmol = qcel.models.Molecule(
+            symbols=mol.symbols[perm],
+            geometry=self.library[nref // 2].geometry[perm] @ qcel.util.random_rotation_matrix(),
+            fix_com=True,
+            fix_orientation=True,
+        )
+
+    def time_align_many(self, nref):
+        self.cmol.align_many(self.library, mols_align=True)
+
+    def time_align_each(self, nref):
+        for ref in self.library:
+            self.cmol.align(ref, verbose=0)
+
+
+class GuessConnectivity:
+    params = (SIZES, ["cells", "pairwise"])
+    param_names = ["nat", "method"]
+
+    def setup(self, nat, method):
+        self.symbols, self.geometry = cluster(nat)
+
+    def time_guess_connectivity(self, nat, method):
+        qcel.molutil.guess_connectivity(self.symbols, self.geometry, method=method)
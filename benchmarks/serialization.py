@@ -0,0 +1,72 @@
+"""
+Serialization round trips
+"""
+
+import qcelemental as qcel
+
+from .common import SIZES, cluster_molecule
+
+
+class Serialize:
+    params = (
+        SIZES,
+        ["json", "json-ext", "msgpack", "msgpack-ext", "npz-ext", "json+gzip", "msgpack-ext+gzip", "msgpack-ext+xz"],
+    )
+    param_names = ["nat", "encoding"]
+
+    def setup(self, nat, encoding):
+        self.data = cluster_molecule(nat).dict()
+        self.blob = qcel.util.serialize(self.data, encoding)
+
+    def time_serialize(self, nat, encoding):
+        qcel.util.serialize(self.data, encoding)
+
+    def time_deserialize(self, nat, encoding):
+        qcel.util.deserialize(self.blob, encoding)
+
+    def track_size(self, nat, encoding):
+        return len(self.blob)
+
+    track_size.unit = "bytes"
+
+
+class ModelRoundTrip:
+    params = (SIZES, ["json", "json-ext", "msgpack-ext", "npz-ext"])
+    param_names = ["nat", "encoding"]
+
+    def setup(self, nat, encoding):
+        self.mol = cluster_molecule(nat)
+        self.blob = self.mol.serialize(encoding)
+
+    def time_serialize(self, nat, encoding):
+        self.mol.serialize(encoding)
+
+    def time_parse_raw(self, nat, encoding):
+        qcel.models.Molecule.parse_raw(self.blob, encoding=encoding)
+
+
+class JSONBackend:
+    params = (SIZES, ["json", "json-ext"], ["json", "orjson"])
+    param_names = ["nat", "encoding", "backend"]
+
+    def setup(self, nat, encoding, backend):
+        if not qcel.util.which_import(backend, return_bool=True):
+            raise NotImplementedError(f"{backend} not installed")
+        self.default = qcel.util.get_json_backend()
+        qcel.util.set_json_backend(backend)
+
+        self.mol = cluster_molecule(nat)
+        self.data = self.mol.dict()
+        self.blob = qcel.util.serialize(self.data, encoding)
+
+    def teardown(self, nat, encoding, backend):
+        qcel.util.set_json_backend(self.default)
+
+    def time_serialize(self, nat, encoding, backend):
+        qcel.util.serialize(self.data, encoding)
+
+    def time_deserialize(self, nat, encoding, backend):
+        qcel.util.deserialize(self.blob, encoding)
+
+    def time_dict_json(self, nat, encoding, backend):
+        self.mol.dict(encoding="json")
@@ -0,0 +1,28 @@
+"""
+Unit conversions
+"""
+
+import qcelemental as qcel
+
+_pairs = [
+    ("hartree", "kcal/mol"),
+    ("hartree", "wavenumber"),
+    ("bohr", "angstrom"),
+    ("hartree/bohr", "eV/angstrom"),
+    ("atomic_unit_of_time", "fs"),
+]
+
+
+class ConversionFactor:
+    params = ["cold", "warm"]
+    param_names = ["cache"]
+
+    def setup(self, cache):
+        # build the unit registry outside the timing
+        qcel.constants.conversion_factor("bohr", "angstrom")
+
+    def time_conversion_factor(self, cache):
+        if cache == "cold":
+            qcel.constants.conversion_factor.cache_clear()
+        for pair in _pairs:
+            qcel.constants.conversion_factor(*pair)
@@ -8,6 +8,7 @@ from typing import Dict, Union
 
 from .datum import Datum, print_variables
 from .exceptions import DataUnavailableError
+from .lazy import LazySingleton
 from .periodic_table import periodictable
 
 
@@ -187,4 +188,4 @@ class CovalentRadii:
 
 
 # singleton
-covalentradii = CovalentRadii("ALVAREZ2008")
+covalentradii = LazySingleton(CovalentRadii, "ALVAREZ2008")
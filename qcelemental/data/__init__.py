@@ -1,5 +1,27 @@
-from .alvarez_2008_covalent_radii import alvarez_2008_covalent_radii
-from .mantina_2009_vanderwaals_radii import mantina_2009_vanderwaals_radii
-from .nist_2011_atomic_weights import nist_2011_atomic_weights
-from .nist_2014_codata import nist_2014_codata
-from .nist_2018_codata import nist_2018_codata
+"""
+Bundled data blobs, each imported on first access
+"""
+
+import importlib
+
+__all__ = [
+    "alvarez_2008_covalent_radii",
+    "mantina_2009_vanderwaals_radii",
+    "nist_2011_atomic_weights",
+    "nist_2014_codata",
+    "nist_2018_codata",
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # each blob module holds one dict of the same name; cache it over the submodule attribute
+    blob = getattr(importlib.import_module(f".{name}", __name__), name)
+    globals()[name] = blob
+    return blob
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -13,6 +13,7 @@ try:
 except ImportError:  # Will also trap ModuleNotFoundError
     from pydantic import Field
 
+from ..lazy import LazySingleton
 from ..models import ProtoModel
 
 
@@ -99,7 +100,7 @@ class ProcessorContext:
         return name
 
 
-context = ProcessorContext("default")
+context = LazySingleton(ProcessorContext, "default")
 
 
 @lru_cache(maxsize=1024)
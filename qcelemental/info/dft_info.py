@@ -9,6 +9,7 @@ try:
 except ImportError:  # Will also trap ModuleNotFoundError
     from pydantic import Field
 
+from ..lazy import LazySingleton
 from ..models import ProtoModel
 
 
@@ -61,7 +62,7 @@ class DFTFunctionalContext:
 
 
 # singleton
-dftfunctionalinfo = DFTFunctionalContext("default")
+dftfunctionalinfo = LazySingleton(DFTFunctionalContext, "default")
 
 
 def get(name: str) -> DFTFunctionalInfo:
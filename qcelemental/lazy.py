@@ -0,0 +1,73 @@
+"""
+Deferred construction of module-level singletons
+"""
+
+import threading
+from typing import Any, Callable
+
+__all__ = ["LazySingleton"]
+
+
+class LazySingleton:
+    r"""Stand-in for a module-level singleton that is built on first use.
+
+    On first attribute access (or ``str``/``repr``/``dir``), a real instance is built from `factory`, and the
+    stand-in takes over its ``__dict__`` and then its ``__class__``. Afterwards there is no proxy left: attribute
+    access costs the same as on an eagerly built object, identity is preserved for anyone who imported the name
+    early, and ``isinstance`` checks pass.
+
+    Parameters
+    ----------
+    factory : type
+        Class of the singleton. Must be a plain Python class with an instance ``__dict__``.
+    *args, **kwargs
+        Arguments to ``factory.__init__``.
+
+    Notes
+    -----
+    ``isinstance(obj, factory)`` is False until the singleton has been built. The initializer runs on a
+    separate instance, so it must not keep references to ``self`` (bound methods, back-references) in the state.
+
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, factory: Callable[..., Any], *args: Any, **kwargs: Any):
+        object.__setattr__(self, "_lazy_init", (factory, args, kwargs))
+
+    def _materialize(self) -> None:
+        with LazySingleton._lock:
+            # another thread may have built it while this one waited
+            if object.__getattribute__(self, "__class__") is not LazySingleton:
+                return
+
+            # build a complete instance aside, so readers racing this thread (which do not take the lock)
+            #   never see a half-initialized object. its state lands before the class switch: until then,
+            #   anything not in the state still goes through the lock via __getattr__
+            factory, args, kwargs = self.__dict__["_lazy_init"]
+            built = factory(*args, **kwargs)
+            object.__setattr__(self, "__dict__", built.__dict__)
+            object.__setattr__(self, "__class__", factory)
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached for attributes missing from the stand-in
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        self._materialize()
+        return getattr(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._materialize()
+        setattr(self, name, value)
+
+    def __dir__(self):
+        self._materialize()
+        return dir(self)
+
+    def __str__(self) -> str:
+        self._materialize()
+        return str(self)
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return repr(self)
@@ -13,12 +13,14 @@ from .basemodels import ProtoModel
 from .basis import BasisSet
 from .common_models import ComputeError, DriverEnum, FailedOperation, Provenance
 from .molecule import Molecule
+from .molecule_batch import MoleculeBatch
 from .procedures import Optimization  # scheduled for removal
 from .procedures import OptimizationInput, OptimizationResult
 from .results import Result  # scheduled for removal
 from .results import ResultInput  # scheduled for removal
 from .results import ResultProperties  # scheduled for removal
 from .results import AtomicInput, AtomicResult, AtomicResultProperties
+from .trajectory_stream import OptimizationTrajectoryReader, OptimizationTrajectoryWriter
 
 
 def qcschema_models():
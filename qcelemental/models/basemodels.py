@@ -1,24 +1,281 @@
-import json
+from collections import deque
+from decimal import Decimal
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Union
+from types import GeneratorType
+from typing import IO, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 
 try:
     from pydantic.v1 import BaseSettings  # remove when QCFractal merges `next`
-    from pydantic.v1 import BaseModel
+    from pydantic.v1 import BaseModel, Extra, ValidationError
+    from pydantic.v1.error_wrappers import ErrorWrapper
+    from pydantic.v1.errors import ExtraError
+    from pydantic.v1.fields import ModelField
+    from pydantic.v1.typing import Literal, get_args, get_origin, is_namedtuple
+    from pydantic.v1.utils import sequence_like
 except ImportError:  # Will also trap ModuleNotFoundError
     from pydantic import BaseSettings  # remove when QCFractal merges `next`
-    from pydantic import BaseModel
-
-from qcelemental.util import deserialize, serialize
+    from pydantic import BaseModel, Extra, ValidationError
+    from pydantic.error_wrappers import ErrorWrapper
+    from pydantic.errors import ExtraError
+    from pydantic.fields import ModelField
+    from pydantic.typing import Literal, get_args, get_origin, is_namedtuple
+    from pydantic.utils import sequence_like
+
+from qcelemental.util import deserialize, detect_encoding, msgpackext_dump, msgpackext_load, npzext_load, serialize
 from qcelemental.util.autodocs import AutoPydanticDocGenerator  # remove when QCFractal merges `next`
 
+from .types import TypedArray
+
+# Per-class field handling for `ProtoModel.parse_obj(trusted=True)`
+_trusted_plans: Dict[type, "_TrustedPlan"] = {}
+
+# Per-class compiled `ProtoModel.dict`
+_serializers: Dict[type, "_Serializer"] = {}
+
+# Arguments of `ProtoModel.dict` handled by the compiled serializer
+_serializer_kwargs = {"include", "exclude", "by_alias", "exclude_unset", "exclude_defaults", "exclude_none"}
+
+# Values that `BaseModel.dict` rebuilds rather than passing through
+_composite_types = (dict, list, tuple, set, frozenset, deque, GeneratorType, BaseModel)
+_scalar_types = {type(None), bool, int, float, str, np.ndarray}
+
 
 def _repr(self) -> str:
     return f'{self.__repr_name__()}({self.__repr_str__(", ")})'
 
 
+def _is_model_annotation(tp: Any) -> bool:
+    r"""Whether `tp` is a ProtoModel, possibly nested in Optional, List, and Dict."""
+    origin = get_origin(tp)
+    if origin is Union:
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        return len(args) == 1 and _is_model_annotation(args[0])
+    elif origin is list:
+        return _is_model_annotation(get_args(tp)[0])
+    elif origin is dict:
+        return _is_model_annotation(get_args(tp)[1])
+    return isinstance(tp, type) and issubclass(tp, ProtoModel)
+
+
+def _has_coerced_type(tp: Any) -> bool:
+    r"""Whether `tp` involves an Array or Enum, which trusted parsing still casts."""
+    if isinstance(tp, type) and issubclass(tp, (TypedArray, Enum)):
+        return True
+    return any(_has_coerced_type(arg) for arg in get_args(tp))
+
+
+class _TrustedPlan:
+    r"""How :meth:`ProtoModel.parse_obj` builds `cls` from trusted values, worked out once per class."""
+
+    def __init__(self, cls: type):
+        self.order = list(cls.__fields__)
+        # what becomes of payload keys that are no field, as in normal parsing
+        self.extra = cls.__config__.extra
+        # payload key -> (field, "model" | "validate" | "raw")
+        self.lookup: Dict[str, Tuple[ModelField, str]] = {}
+        # validated even when missing from the payload
+        self.always: List[ModelField] = []
+        # defaults that can be shared between instances, and fields whose defaults must be made fresh
+        self.defaults: Dict[str, Any] = {}
+        self.factories: List[ModelField] = []
+
+        for field in cls.__fields__.values():
+            if _is_model_annotation(field.outer_type_):
+                how = "model"
+            elif _has_coerced_type(field.outer_type_):
+                how = "validate"
+            else:
+                how = "raw"
+            self.lookup[field.name] = self.lookup[field.alias] = (field, how)
+
+            if field.validate_always:
+                self.always.append(field)
+            elif field.required:
+                pass
+            elif field.default_factory is None and isinstance(field.default, (type(None), bool, int, float, str)):
+                self.defaults[field.name] = field.default
+            else:
+                self.factories.append(field)
+
+
+def _construct_trusted(tp: Any, value: Any) -> Any:
+    r"""Builds the ProtoModels in `value` according to `tp`, for which :func:`_is_model_annotation` holds."""
+    if value is None or isinstance(value, BaseModel):
+        return value
+
+    origin = get_origin(tp)
+    if origin is Union:
+        return _construct_trusted(next(arg for arg in get_args(tp) if arg is not type(None)), value)
+    elif origin is list:
+        return [_construct_trusted(get_args(tp)[0], v) for v in value]
+    elif origin is dict:
+        return {k: _construct_trusted(get_args(tp)[1], v) for k, v in value.items()}
+    return tp.parse_obj(value, trusted=True)
+
+
+def _dump_value(v: Any, opts: Tuple[bool, bool, bool, bool], enum_values: bool) -> Any:
+    r"""Dumps any value as ``BaseModel.dict`` does, see :meth:`pydantic.BaseModel._get_value`."""
+    if isinstance(v, BaseModel):
+        return _dump_model(v, opts)
+    elif isinstance(v, dict):
+        return {k: _dump_value(x, opts, enum_values) for k, x in v.items()}
+    elif sequence_like(v):
+        items = (_dump_value(x, opts, enum_values) for x in v)
+        return v.__class__(*items) if is_namedtuple(v.__class__) else v.__class__(items)
+    elif enum_values and isinstance(v, Enum):
+        return v.value
+    return v
+
+
+def _dump_model(v: BaseModel, opts: Tuple[bool, bool, bool, bool]) -> Dict[str, Any]:
+    r"""Dumps a nested model, through its compiled serializer unless the model customizes ``dict``."""
+    if type(v).dict is ProtoModel.dict:
+        serializer = _get_serializer(type(v))
+        if serializer.supported:
+            return serializer(v, None, *opts)
+
+    by_alias, exclude_unset, exclude_defaults, exclude_none = opts
+    data = v.dict(
+        by_alias=by_alias,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        include=None,
+        exclude=None,
+        exclude_none=exclude_none,
+    )
+    return data["__root__"] if "__root__" in data else data
+
+
+def _compile_field(tp: Any, enum_values: bool) -> Optional[Callable]:
+    r"""Returns how values of annotation `tp` are dumped, None for those kept as they are."""
+
+    def dump_any(v, opts):
+        return _dump_value(v, opts, enum_values)
+
+    origin = get_origin(tp)
+    if origin is Literal:
+        return None
+    elif origin is Union:
+        if all(_compile_field(arg, enum_values) is None for arg in get_args(tp)):
+            return None
+        return dump_any
+    elif origin is list:
+        inner = _compile_field(get_args(tp)[0], enum_values)
+
+        def dump_list(v, opts):
+            if type(v) is not list:
+                return _dump_value(v, opts, enum_values)
+            elif inner is None:
+                return [_dump_value(x, opts, enum_values) if isinstance(x, _composite_types) else x for x in v]
+            return [None if x is None else inner(x, opts) for x in v]
+
+        return dump_list
+    elif origin is dict:
+        inner = _compile_field(get_args(tp)[1], enum_values)
+
+        def dump_dict(v, opts):
+            if type(v) is not dict:
+                return _dump_value(v, opts, enum_values)
+            elif inner is None:
+                return {
+                    k: _dump_value(x, opts, enum_values) if isinstance(x, _composite_types) else x for k, x in v.items()
+                }
+            return {k: None if x is None else inner(x, opts) for k, x in v.items()}
+
+        return dump_dict
+    elif isinstance(tp, type):
+        if issubclass(tp, BaseModel):
+
+            def dump_model(v, opts):
+                return _dump_model(v, opts) if isinstance(v, BaseModel) else _dump_value(v, opts, enum_values)
+
+            return dump_model
+        elif issubclass(tp, Enum):
+            return dump_any if enum_values else None
+        elif tp is type(None) or issubclass(tp, (str, bytes, int, float, complex, Decimal, np.ndarray)):
+            return None
+    return dump_any
+
+
+class _Serializer:
+    r"""The equivalent of :meth:`ProtoModel.dict` for `cls`, compiled once from its fields and ``Config``."""
+
+    def __init__(self, cls: type):
+        config = cls.__config__
+        self.default_excludes = frozenset(config.serialize_default_excludes)
+        self.skip_defaults = config.serialize_skip_defaults
+        self.force_skip_defaults = config.force_skip_defaults
+        # field-level include/exclude and custom roots are left to pydantic
+        self.supported = (
+            cls.__exclude_fields__ is None and cls.__include_fields__ is None and not cls.__custom_root_type__
+        )
+
+        self.fields = cls.__fields__
+        self.position = {name: i for i, name in enumerate(cls.__fields__)}
+        self.aliases = {name: field.alias for name, field in cls.__fields__.items()}
+        self.enum_values = getattr(cls.Config, "use_enum_values", False)
+        # field name -> dumper, None for values kept as they are
+        self.dumpers = {name: _compile_field(f.outer_type_, self.enum_values) for name, f in self.fields.items()}
+
+    def __call__(
+        self,
+        model: BaseModel,
+        exclude: Optional[Set[str]],
+        by_alias: bool,
+        exclude_unset: bool,
+        exclude_defaults: bool,
+        exclude_none: bool,
+    ) -> Dict[str, Any]:
+        skip = self.default_excludes | exclude if exclude else self.default_excludes
+        if self.force_skip_defaults:
+            exclude_unset = True
+        opts = (by_alias, exclude_unset, exclude_defaults, exclude_none)
+
+        values, dumpers, enum_values = model.__dict__, self.dumpers, self.enum_values
+        if exclude_unset:
+            # set fields are usually few, visit them in the order of `values`
+            try:
+                names = sorted(model.__fields_set__, key=self.position.__getitem__)
+            except KeyError:
+                names = [name for name in values if name in model.__fields_set__]
+        else:
+            names = values
+
+        data = {}
+        for name in names:
+            if name in skip or name not in values:
+                continue
+            v = values[name]
+            if exclude_none and v is None:
+                continue
+            if exclude_defaults:
+                field = self.fields.get(name)
+                if field is not None and not field.required and field.default == v:
+                    continue
+
+            if v is not None:
+                dumper = dumpers.get(name, _dump_value)
+                if dumper is _dump_value:
+                    v = _dump_value(v, opts, enum_values)
+                elif dumper is not None:
+                    v = dumper(v, opts)
+                elif type(v) not in _scalar_types and isinstance(v, _composite_types):
+                    v = _dump_value(v, opts, enum_values)
+            data[self.aliases.get(name, name) if by_alias else name] = v
+
+        return data
+
+
+def _get_serializer(cls: type) -> _Serializer:
+    serializer = _serializers.get(cls)
+    if serializer is None:
+        serializer = _serializers[cls] = _Serializer(cls)
+    return serializer
+
+
 class ProtoModel(BaseModel):
     """QCSchema extension of pydantic.BaseModel."""
 
@@ -41,7 +298,79 @@ class ProtoModel(BaseModel):
             cls.__str__ = _repr
 
     @classmethod
-    def parse_raw(cls, data: Union[bytes, str], *, encoding: Optional[str] = None) -> "ProtoModel":  # type: ignore
+    def parse_obj(cls, obj: Any, *, trusted: bool = False) -> "ProtoModel":  # type: ignore
+        r"""
+        Parses a dictionary into a Model object.
+
+        Parameters
+        ----------
+        obj
+            The field values of the Model, such as from :meth:`dict` or a deserialized blob.
+        trusted
+            If True, `obj` is taken to be the output of a valid Model, such as one reloaded from a file this
+            library wrote, and is not validated. Nested models (e.g., ``Molecule``, ``Provenance``,
+            ``AtomicResultProperties``) are built the same way, missing fields get their defaults, and other
+            values are kept as they are, except that fields involving arrays or enumerations are still cast
+            (and reshaped) by their own validators. Keys that are no field are rejected, kept, or dropped
+            according to the model's ``Config.extra``, as in normal parsing. Whole-model checks, such as
+            ``AtomicResult`` protocols and ``Molecule`` validation, are skipped.
+
+        Returns
+        -------
+        Model
+            The requested model.
+        """
+
+        if not trusted or isinstance(obj, cls):
+            return super().parse_obj(obj)
+
+        plan = _trusted_plans.get(cls)
+        if plan is None:
+            plan = _trusted_plans[cls] = _TrustedPlan(cls)
+
+        values, fields_set, validate, extras = dict(plan.defaults), set(), [], {}
+        for key, value in obj.items():
+            if key not in plan.lookup:
+                if plan.extra == Extra.forbid:
+                    raise ValidationError([ErrorWrapper(ExtraError(), loc=key)], cls)
+                elif plan.extra == Extra.allow:
+                    extras[key] = value
+                    fields_set.add(key)
+                continue
+            field, how = plan.lookup[key]
+            fields_set.add(field.name)
+            if how == "model":
+                value = _construct_trusted(field.outer_type_, value)
+            elif how == "validate":
+                validate.append(field)
+            values[field.name] = value
+
+        for field in plan.factories:
+            if field.name not in fields_set:
+                values[field.name] = field.get_default()
+        for field in plan.always:
+            if field.name not in fields_set:
+                values[field.name] = field.get_default()
+                validate.append(field)
+
+        # in field order, as validators may look up earlier fields
+        for field in sorted(validate, key=lambda f: plan.order.index(f.name)):
+            values[field.name], errors = field.validate(values[field.name], values, loc=field.alias, cls=cls)
+            if errors:
+                raise ValidationError([errors], cls)
+
+        model = cls.__new__(cls)
+        object.__setattr__(
+            model, "__dict__", {**{name: values[name] for name in plan.order if name in values}, **extras}
+        )
+        object.__setattr__(model, "__fields_set__", fields_set)
+        model._init_private_attributes()
+        return model
+
+    @classmethod
+    def parse_raw(  # type: ignore
+        cls, data: Union[bytes, str], *, encoding: Optional[str] = None, trusted: bool = False
+    ) -> "ProtoModel":
         r"""
         Parses raw string or bytes into a Model object.
 
@@ -50,7 +379,12 @@ class ProtoModel(BaseModel):
         data
             A serialized data blob to be deserialized into a Model.
         encoding
-            The type of the serialized array, available types are: {'json', 'json-ext', 'msgpack-ext', 'pickle'}
+            The type of the serialized array, available types are: {'json', 'json-ext', 'msgpack-ext', 'npz-ext', 'pickle'},
+            or those but 'npz-ext' and 'pickle' compressed as '<encoding>+<codec>' (e.g., 'msgpack-ext+zstd'). If
+            None, detected from the leading bytes (see :func:`~qcelemental.util.detect_encoding`); pickles must
+            be named.
+        trusted
+            Skip validation of data this library wrote itself, see :meth:`parse_obj`.
 
         Returns
         -------
@@ -59,24 +393,26 @@ class ProtoModel(BaseModel):
         """
 
         if encoding is None:
-            if isinstance(data, str):
-                encoding = "json"
-            elif isinstance(data, bytes):
-                encoding = "msgpack-ext"
+            if isinstance(data, (str, bytes)):
+                encoding = detect_encoding(data)
             else:
                 raise TypeError("Input is neither str nor bytes, please specify an encoding.")
 
-        if encoding.endswith(("json", "javascript", "pickle")):
+        if encoding.endswith(("json", "javascript")) and trusted:
+            obj = deserialize(data if isinstance(data, str) else data.decode(), "json")
+        elif encoding.endswith(("json", "javascript", "pickle")):
             return super().parse_raw(data, content_type=encoding)
-        elif encoding in ["msgpack-ext", "json-ext", "msgpack"]:
+        elif encoding in ["msgpack-ext", "json-ext", "msgpack", "npz-ext"] or "+" in encoding:
             obj = deserialize(data, encoding)
         else:
             raise TypeError(f"Content type '{encoding}' not understood.")
 
-        return cls.parse_obj(obj)
+        return cls.parse_obj(obj, trusted=trusted)
 
     @classmethod
-    def parse_file(cls, path: Union[str, Path], *, encoding: Optional[str] = None) -> "ProtoModel":  # type: ignore
+    def parse_file(  # type: ignore
+        cls, path: Union[str, Path], *, encoding: Optional[str] = None, lazy: bool = False, trusted: bool = False
+    ) -> "ProtoModel":
         r"""Parses a file into a Model object.
 
         Parameters
@@ -84,8 +420,17 @@ class ProtoModel(BaseModel):
         path
             The path to the file.
         encoding
-            The type of the files, available types are: {'json', 'msgpack', 'pickle'}. Attempts to
-            automatically infer the file type from the file extension if None.
+            The type of the files, available types are: {'json', 'msgpack', 'npz-ext', 'pickle'}, or compressed
+            encodings as in :meth:`parse_raw`. Attempts to automatically infer the file type from the file
+            extension if None, or for compressed files (.gz, .bz2, .xz, .zst, .lz4) from their contents.
+        lazy
+            Memory-map the file instead of reading it; requires the 'npz-ext' encoding. Array fields become
+            read-only views into the mapping whose data is paged in from disk when first touched. Validators
+            that only check shape and dtype, such as those of result arrays and wavefunction matrices, leave
+            the data untouched, so reading a few scalars from a large archived result costs about as much as
+            reading its JSON member.
+        trusted
+            Skip validation of data this library wrote itself, see :meth:`parse_obj`.
 
         Returns
         -------
@@ -94,34 +439,87 @@ class ProtoModel(BaseModel):
 
         """
         path = Path(path)
+        data = None
         if encoding is None:
             if path.suffix in [".json", ".js"]:
                 encoding = "json"
             elif path.suffix in [".msgpack"]:
                 encoding = "msgpack-ext"
+            elif path.suffix in [".npz"]:
+                encoding = "npz-ext"
             elif path.suffix in [".pickle"]:
                 encoding = "pickle"
+            elif path.suffix in [".gz", ".bz2", ".xz", ".zst", ".lz4"]:
+                data = path.read_bytes()
+                encoding = detect_encoding(data)
             else:
                 raise TypeError("Could not infer `encoding`, please provide a `encoding` for this file.")
 
-        return cls.parse_raw(path.read_bytes(), encoding=encoding)
+        if lazy:
+            if encoding != "npz-ext":
+                raise TypeError(f"Lazy loading requires the 'npz-ext' encoding, found '{encoding}'.")
+            with open(path, "rb") as handle:
+                return cls.parse_obj(npzext_load(handle), trusted=trusted)
+
+        return cls.parse_raw(path.read_bytes() if data is None else data, encoding=encoding, trusted=trusted)
+
+    @classmethod
+    def parse_stream(cls, stream: IO[bytes], *, encoding: str = "msgpack-ext", trusted: bool = False) -> "ProtoModel":
+        r"""Parses a Model object from a binary file-like object, reading array data in place.
+
+        Parameters
+        ----------
+        stream
+            A readable binary file-like object, such as an open file or ``socket.makefile("rb")``.
+            Exactly one serialized model is read.
+        encoding
+            The type of the serialized stream, available types are: {'msgpack-ext'}
+        trusted
+            Skip validation of data this library wrote itself, see :meth:`parse_obj`.
+
+        Returns
+        -------
+        Model
+            The requested model from a serialized format.
+
+        """
+        if encoding != "msgpack-ext":
+            raise TypeError(f"Content type '{encoding}' not understood for streams, valid options: 'msgpack-ext'.")
+
+        return cls.parse_obj(msgpackext_load(stream), trusted=trusted)
 
     def dict(self, **kwargs) -> Dict[str, Any]:
         encoding = kwargs.pop("encoding", None)
 
-        kwargs["exclude"] = (
-            kwargs.get("exclude", None) or set()
-        ) | self.__config__.serialize_default_excludes  # type: ignore
-        kwargs.setdefault("exclude_unset", self.__config__.serialize_skip_defaults)  # type: ignore
-        if self.__config__.force_skip_defaults:  # type: ignore
-            kwargs["exclude_unset"] = True
+        serializer = _get_serializer(type(self))
+        if (
+            serializer.supported
+            and kwargs.keys() <= _serializer_kwargs
+            and kwargs.get("include") is None
+            and isinstance(kwargs.get("exclude") or set(), (set, frozenset))
+        ):
+            data = serializer(
+                self,
+                kwargs.get("exclude"),
+                kwargs.get("by_alias", False),
+                kwargs.get("exclude_unset", serializer.skip_defaults),
+                kwargs.get("exclude_defaults", False),
+                kwargs.get("exclude_none", False),
+            )
+        else:
+            kwargs["exclude"] = (
+                kwargs.get("exclude", None) or set()
+            ) | self.__config__.serialize_default_excludes  # type: ignore
+            kwargs.setdefault("exclude_unset", self.__config__.serialize_skip_defaults)  # type: ignore
+            if self.__config__.force_skip_defaults:  # type: ignore
+                kwargs["exclude_unset"] = True
 
-        data = super().dict(**kwargs)
+            data = super().dict(**kwargs)
 
         if encoding is None:
             return data
         elif encoding == "json":
-            return json.loads(serialize(data, encoding="json"))
+            return deserialize(serialize(data, encoding="json"), encoding="json")
         else:
             raise KeyError(f"Unknown encoding type '{encoding}', valid encoding types: 'json'.")
 
@@ -140,7 +538,9 @@ class ProtoModel(BaseModel):
         Parameters
         ----------
         encoding
-            The serialization type, available types are: {'json', 'json-ext', 'msgpack-ext'}
+            The serialization type, available types are: {'json', 'json-ext', 'msgpack-ext', 'npz-ext'}, or
+            compressed as '<encoding>+<codec>' with codec {'gzip', 'bz2', 'xz', 'zstd', 'lz4'}, e.g.,
+            'msgpack-ext+zstd'. See :func:`~qcelemental.util.serialize`.
         include
             Fields to be included in the serialization.
         exclude
@@ -158,22 +558,67 @@ class ProtoModel(BaseModel):
             The serialized model.
         """
 
-        kwargs = {}
-        if include:
-            kwargs["include"] = include
-        if exclude:
-            kwargs["exclude"] = exclude
-        if exclude_unset:
-            kwargs["exclude_unset"] = exclude_unset
-        if exclude_defaults:
-            kwargs["exclude_defaults"] = exclude_defaults
-        if exclude_none:
-            kwargs["exclude_none"] = exclude_none
-
-        data = self.dict(**kwargs)
+        data = self._serialization_dict(
+            include=include,
+            exclude=exclude,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
 
         return serialize(data, encoding=encoding)
 
+    def serialize_to(
+        self,
+        stream: IO[bytes],
+        encoding: str = "msgpack-ext",
+        *,
+        include: Optional[Set[str]] = None,
+        exclude: Optional[Set[str]] = None,
+        exclude_unset: Optional[bool] = None,
+        exclude_defaults: Optional[bool] = None,
+        exclude_none: Optional[bool] = None,
+    ) -> None:
+        r"""Writes a serialized representation of the model to a binary file-like object.
+
+        Arrays are written in chunks directly from their memory, so peak memory stays at about the size of the
+        model rather than model plus blob. The output is identical to :py:meth:`serialize` for the same encoding.
+
+        Parameters
+        ----------
+        stream
+            A writeable binary file-like object, such as an open file or ``socket.makefile("wb")``.
+        encoding
+            The serialization type, available types are: {'msgpack-ext'}
+        include
+            Fields to be included in the serialization.
+        exclude
+            Fields to be excluded in the serialization.
+        exclude_unset
+            If True, skips fields that have default values provided.
+        exclude_defaults
+            If True, skips fields that have set or defaulted values equal to the default.
+        exclude_none
+            If True, skips fields that have value ``None``.
+
+        """
+        if encoding != "msgpack-ext":
+            raise KeyError(f"Encoding '{encoding}' not understood for streams, valid options: 'msgpack-ext'")
+
+        data = self._serialization_dict(
+            include=include,
+            exclude=exclude,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+
+        msgpackext_dump(data, stream)
+
+    def _serialization_dict(self, **options: Optional[Union[Set[str], bool]]) -> Dict[str, Any]:
+        kwargs = {k: v for k, v in options.items() if v}
+        return self.dict(**kwargs)
+
     def json(self, **kwargs):
         # Alias JSON here from BaseModel to reflect dict changes
         return self.serialize("json", **kwargs)
@@ -5,16 +5,16 @@ import collections
 import hashlib
 import json
 import warnings
-from functools import partial
+from functools import partial, wraps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
 try:
-    from pydantic.v1 import ConstrainedFloat, ConstrainedInt, Field, constr, validator
+    from pydantic.v1 import ConstrainedFloat, ConstrainedInt, Field, PrivateAttr, constr, validator
 except ImportError:  # Will also trap ModuleNotFoundError
-    from pydantic import ConstrainedFloat, ConstrainedInt, Field, constr, validator
+    from pydantic import ConstrainedFloat, ConstrainedInt, Field, PrivateAttr, constr, validator
 
 try:
     import nglview
@@ -23,6 +23,7 @@ except ModuleNotFoundError:
     pass
 
 # molparse imports separated b/c https://github.com/python/mypy/issues/7203
+from ..exceptions import NotAnElementError, ValidationError
 from ..molparse.from_arrays import from_arrays
 from ..molparse.from_schema import from_schema
 from ..molparse.from_string import from_string
@@ -31,17 +32,28 @@ from ..molparse.to_string import to_string
 from ..periodic_table import periodictable
 from ..physical_constants import constants
 from ..testing import compare, compare_values
-from ..util import deserialize, measure_coordinates, msgpackext_loads, provenance_stamp, which_import
+from ..util import (
+    deserialize,
+    measure_coordinates,
+    msgpackext_loads,
+    nuclear_repulsion_matrix,
+    provenance_stamp,
+    which_import,
+)
 from .basemodels import ProtoModel, qcschema_draft
 from .common_models import Provenance, qcschema_molecule_default
 from .types import Array
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     try:
         from pydantic.v1.typing import ReprArgs
     except ImportError:  # Will also trap ModuleNotFoundError
         from pydantic.typing import ReprArgs
 
+    from .align import AlignmentMill
+
 # Rounding quantities for hashing
 GEOMETRY_NOISE = 8
 MASS_NOISE = 6
@@ -54,6 +66,18 @@ _extension_map = {
     ".psimol": "psi4",
     ".psi4": "psi4",
     ".msgpack": "msgpack-ext",
+    ".npz": "npz-ext",
+}
+
+# fields checked through their own arguments of Molecule.from_arrays_fast, never passed through
+_FAST_ARGUMENT_FIELDS = {
+    "atomic_numbers_": "atomic_numbers",
+    "masses_": "masses",
+    "mass_numbers_": "mass_numbers",
+    "real_": "real",
+    "fragments_": "fragments",
+    "fragment_charges_": "fragment_charges",
+    "fragment_multiplicities_": "fragment_multiplicities",
 }
 
 
@@ -77,6 +101,55 @@ def float_prep(array, around):
     return array
 
 
+def _mass_number(symbol: str, mass: float, mtol: float = 1.0e-3) -> int:
+    r"""Mass number of the nuclide of `symbol` whose mass is within `mtol` of `mass`, else -1,
+    as :py:func:`qcelemental.molparse.reconcile_nucleus` assigns it."""
+    A = int(round(mass))
+    try:
+        if abs(periodictable.to_mass(f"{symbol}{A}") - mass) <= mtol:
+            return A
+    except NotAnElementError:
+        pass
+    return -1
+
+
+class _CachedList(tuple):
+    r"""Cached list result of a :func:`_memoize` method, handed out as a fresh list on each lookup."""
+
+
+def _memoize(func):
+    r"""
+    Caches the result of a derived-quantity method on the (immutable) Molecule instance, keyed by name and arguments.
+    Computed arrays are made read-only so that a caller cannot corrupt later lookups; arrays that are
+    stored fields of the Molecule are returned untouched. Lists (e.g., of fragment arrays) are cached as
+    tuples, with computed arrays in them read-only, and each caller gets a fresh list.
+    """
+
+    def _freeze(arr, stored):
+        if isinstance(arr, np.ndarray) and not any(arr is v for v in stored):
+            arr.flags.writeable = False
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            ret = self._cache[key]
+        except KeyError:
+            ret = func(self, *args, **kwargs)
+            stored = [v for v in self.__dict__.values() if v is not None]
+            if isinstance(ret, list):
+                stored += [v for field in stored if isinstance(field, list) for v in field]
+                for arr in ret:
+                    _freeze(arr, stored)
+                ret = _CachedList(ret)
+            else:
+                _freeze(ret, stored)
+            self._cache[key] = ret
+        return list(ret) if isinstance(ret, _CachedList) else ret
+
+    return wrapper
+
+
 class NonnegativeInt(ConstrainedInt):
     ge = 0
 
@@ -307,6 +380,9 @@ class Molecule(ProtoModel):
         description="Additional information to bundle with the molecule. Use for schema development and scratch space.",
     )
 
+    # Memoized derived quantities. Private, so never validated or serialized.
+    _cache: Dict[Any, Any] = PrivateAttr(default_factory=dict)
+
     class Config(ProtoModel.Config):
         serialize_skip_defaults = True
         repr_style = lambda self: [
@@ -383,6 +459,9 @@ class Molecule(ProtoModel):
         elif validate or geometry_prep:
             values["geometry"] = float_prep(values["geometry"], geometry_noise)
 
+        # Fields were edited in place above, so drop anything memoized along the way
+        self._cache.clear()
+
     @validator("geometry")
     def _must_be_3n(cls, v, values, **kwargs):
         n = len(values["symbols"])
@@ -451,13 +530,15 @@ class Molecule(ProtoModel):
         ]
 
     @property
+    @_memoize
     def masses(self) -> Array[float]:
         masses = self.__dict__.get("masses_")
         if masses is None:
-            masses = np.array([periodictable.to_mass(x) for x in self.symbols])
+            masses = periodictable.to_mass_array(self.symbols)
         return masses
 
     @property
+    @_memoize
     def real(self) -> Array[bool]:
         real = self.__dict__.get("real_")
         if real is None:
@@ -472,17 +553,19 @@ class Molecule(ProtoModel):
         return atom_labels
 
     @property
+    @_memoize
     def atomic_numbers(self) -> Array[np.int16]:
         atomic_numbers = self.__dict__.get("atomic_numbers_")
         if atomic_numbers is None:
-            atomic_numbers = np.array([periodictable.to_Z(x) for x in self.symbols])
+            atomic_numbers = periodictable.to_Z_array(self.symbols)
         return atomic_numbers
 
     @property
+    @_memoize
     def mass_numbers(self) -> Array[np.int16]:
         mass_numbers = self.__dict__.get("mass_numbers_")
         if mass_numbers is None:
-            mass_numbers = np.array([periodictable.to_A(x) for x in self.symbols])
+            mass_numbers = periodictable.to_A_array(self.symbols)
         return mass_numbers
 
     @property
@@ -492,6 +575,7 @@ class Molecule(ProtoModel):
         return connectivity
 
     @property
+    @_memoize
     def fragments(self) -> List[Array[np.int32]]:
         fragments = self.__dict__.get("fragments_")
         if fragments is None:
@@ -593,6 +677,12 @@ class Molecule(ProtoModel):
 
         return self.get_hash() == other.get_hash()
 
+    def copy(self, **kwargs) -> "Molecule":
+        # pydantic carries private attributes into the copy, but `update` may invalidate them
+        ret = super().copy(**kwargs)
+        object.__setattr__(ret, "_cache", {})
+        return ret
+
     def dict(self, *args, **kwargs):
         kwargs["by_alias"] = True
         kwargs["exclude_unset"] = True
@@ -795,28 +885,86 @@ class Molecule(ProtoModel):
             return_data=return_data,
         )
 
-    def get_hash(self):
+    @_memoize
+    def get_hash(self, hash_version: int = 1) -> str:
         r"""
         Returns the hash of the molecule.
+
+        Parameters
+        ----------
+        hash_version
+            Hashing scheme. Version 1 (default) digests the JSON text of the rounded
+            :py:attr:`hash_fields`. Version 2 digests the same rounded quantities as canonical
+            little-endian bytes, which is much faster for large molecules. The two versions
+            give different hashes for the same molecule, so stored hashes should record which
+            version produced them.
+
         """
+        if hash_version == 1:
+            m = hashlib.sha1()
+            concat = ""
+
+            for field in self.hash_fields:
+                data = getattr(self, field)
+                if field == "geometry":
+                    data = float_prep(data, GEOMETRY_NOISE)
+                elif field in [
+                    "fragment_charges",
+                    "molecular_charge",
+                    "fragment_multiplicities",
+                    "molecular_multiplicity",
+                ]:
+                    data = float_prep(data, CHARGE_NOISE)
+                elif field == "masses":
+                    data = float_prep(data, MASS_NOISE)
+
+                concat += json.dumps(data, default=lambda x: x.ravel().tolist())
+
+            m.update(concat.encode("utf-8"))
+            return m.hexdigest()
+
+        elif hash_version == 2:
+            return _binary_hashes(self, float_prep(self.geometry, GEOMETRY_NOISE)[None])[0]
 
-        m = hashlib.sha1()
-        concat = ""
+        else:
+            raise ValueError(f"Molecule hash version {hash_version} not understood, valid versions: {{1, 2}}.")
 
-        for field in self.hash_fields:
-            data = getattr(self, field)
-            if field == "geometry":
-                data = float_prep(data, GEOMETRY_NOISE)
-            elif field in ["fragment_charges", "molecular_charge", "fragment_multiplicities", "molecular_multiplicity"]:
-                data = float_prep(data, CHARGE_NOISE)
-            elif field == "masses":
-                data = float_prep(data, MASS_NOISE)
+    @classmethod
+    def get_hashes(cls, molecules: Iterable["Molecule"], hash_version: int = 2) -> List[str]:
+        r"""
+        Returns the hashes of many molecules at once.
 
-            concat += json.dumps(data, default=lambda x: x.ravel().tolist())
+        Parameters
+        ----------
+        molecules
+            Molecules to hash.
+        hash_version
+            Hashing scheme as in :py:meth:`get_hash`. Defaults to the binary version 2, for which
+            geometries of molecules with the same number of atoms are rounded together as one array.
 
-        m.update(concat.encode("utf-8"))
-        return m.hexdigest()
+        Returns
+        -------
+        List[str]
+            Hashes in the order of `molecules`, each equal to ``mol.get_hash(hash_version)``.
 
+        """
+        molecules = list(molecules)
+        if hash_version != 2:
+            return [mol.get_hash(hash_version) for mol in molecules]
+
+        # Molecules differing only in geometry share a topology, digested once for the whole group
+        by_topology: Dict[Any, List[int]] = collections.defaultdict(list)
+        for imol, mol in enumerate(molecules):
+            by_topology[_topology_key(mol)].append(imol)
+
+        hashes: List[str] = [""] * len(molecules)
+        for indices in by_topology.values():
+            geoms = float_prep(np.stack([molecules[imol].geometry for imol in indices]), GEOMETRY_NOISE)
+            for imol, mol_hash in zip(indices, _binary_hashes(molecules[indices[0]], geoms)):
+                hashes[imol] = mol_hash
+        return hashes
+
+    @_memoize
     def get_molecular_formula(self, order: str = "alphabetical", chgmult: bool = False) -> str:
         r"""
         Returns the molecular formula for a molecule.
@@ -988,6 +1136,230 @@ class Molecule(ProtoModel):
 
         return cls(orient=orient, validate=validate, **input_dict)
 
+    @classmethod
+    def from_arrays_fast(
+        cls,
+        symbols: Union[List[str], np.ndarray],
+        geometry: Union[List[float], np.ndarray],
+        *,
+        atomic_numbers: Optional[Union[List[int], np.ndarray]] = None,
+        masses: Optional[Union[List[float], np.ndarray]] = None,
+        mass_numbers: Optional[Union[List[int], np.ndarray]] = None,
+        real: Optional[Union[List[bool], np.ndarray]] = None,
+        fragments: Optional[List[Union[List[int], np.ndarray]]] = None,
+        fragment_charges: Optional[List[float]] = None,
+        fragment_multiplicities: Optional[List[float]] = None,
+        molecular_charge: Optional[float] = None,
+        molecular_multiplicity: Optional[float] = None,
+        name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "Molecule":
+        r"""
+        Constructs a molecule from already-canonical arrays with only cheap, vectorized checks.
+
+        This is a high-throughput alternative to ``Molecule(**kwargs)`` for trusted sources (e.g., conformer
+        generators) that skips the ``from_schema``/``to_schema`` round trip and pydantic validation. The
+        returned Molecule is marked ``validated=True`` and has the same fields, hash, and serialization
+        as one built through the validating constructor from the same data, except that its provenance
+        names this routine.
+
+        Parameters
+        ----------
+        symbols
+            (nat,) Element symbols.
+        geometry
+            (nat, 3) or (3 * nat,) Cartesian coordinates [a0]. Rounded as in the validating constructor.
+        atomic_numbers
+            (nat,) Atomic numbers. If provided, checked against `symbols`.
+        masses
+            (nat,) Atomic masses [u]. If not provided, most common isotope masses are used.
+        mass_numbers
+            (nat,) Mass numbers. Only stored alongside non-default `masses`. If not provided, inferred from
+            `masses` where they match a known nuclide, else -1, as by the validating constructor.
+        real
+            (nat,) Whether each atom is real (True) or ghost (False). If not provided, all atoms are real.
+        fragments
+            Atom indices of each fragment; together they must cover every atom exactly once, in order
+            (i.e., contiguous fragments, as the validating constructor would otherwise reorder atoms).
+            If not provided, all atoms form one fragment.
+        fragment_charges
+            Charge of each fragment. Required with more than one fragment.
+        fragment_multiplicities
+            Multiplicity of each fragment. Required with more than one fragment.
+        molecular_charge
+            Total charge. Defaults to the sum of `fragment_charges` or 0.
+        molecular_multiplicity
+            Total multiplicity. Defaults to high-spin coupling of `fragment_multiplicities` or 1.
+        name
+            Molecule name. Defaults to the molecular formula.
+        **kwargs
+            Any other Molecule fields (e.g., ``comment``, ``connectivity``, ``fix_com``), by name or alias.
+            ``atom_labels`` and ``connectivity`` are converted as in the validating constructor; the rest are
+            stored as given.
+
+        Returns
+        -------
+        Molecule
+            A constructed molecule class.
+
+        Raises
+        ------
+        qcelemental.ValidationError
+            If the arrays are inconsistent in shape, element identity, fragment partitioning, or charge and
+            multiplicity.
+
+        Notes
+        -----
+        Unlike the validating constructor, atoms are not checked for being too close together, and charge and
+        multiplicity are not filled in by the chgmult rules, only checked for electron-count parity.
+
+        """
+        from ..molutil import molecular_formula_from_symbols
+
+        if np.lib.NumpyVersion(np.__version__) >= "2.0.0b1":
+            symbols = np.char.chararray.title(np.asarray(symbols, dtype=str))
+        else:
+            symbols = np.core.defchararray.title(np.asarray(symbols, dtype=str))
+        nat = symbols.shape[0]
+
+        geometry = np.asarray(geometry, dtype=float)
+        if geometry.size != 3 * nat:
+            raise ValidationError(f"Geometry must be castable to shape (N,3) for N={nat} symbols: {geometry.shape}")
+        geometry = float_prep(geometry.reshape(nat, 3), GEOMETRY_NOISE)
+        if not np.all(np.isfinite(geometry)):
+            raise ValidationError("Geometry must be finite.")
+
+        try:
+            default_Z = periodictable.to_Z_array(symbols)
+            default_masses = periodictable.to_mass_array(symbols)
+        except NotAnElementError as err:
+            raise ValidationError(f"Symbols not all elements: {err.message}")
+
+        if atomic_numbers is not None and not np.array_equal(np.asarray(atomic_numbers), default_Z):
+            raise ValidationError("Atomic numbers do not match symbols.")
+
+        values: Dict[str, Any] = {}
+
+        if masses is not None:
+            masses = np.asarray(masses, dtype=float)
+            if masses.shape != (nat,):
+                raise ValidationError(f"Masses must be same number of entries as Symbols: {masses.shape}")
+            if not np.allclose(masses, default_masses):
+                values["masses_"] = masses
+                if mass_numbers is None:
+                    values["mass_numbers_"] = np.array(
+                        [_mass_number(sym, mass) for sym, mass in zip(symbols.tolist(), masses.tolist())],
+                        dtype=np.int16,
+                    )
+                else:
+                    values["mass_numbers_"] = np.asarray(mass_numbers, dtype=np.int16)
+                    if values["mass_numbers_"].shape != (nat,):
+                        raise ValidationError("Mass numbers must be same number of entries as Symbols.")
+
+        if real is not None:
+            real = np.asarray(real, dtype=bool)
+            if real.shape != (nat,):
+                raise ValidationError(f"Real must be same number of entries as Symbols: {real.shape}")
+            if not np.all(real):
+                values["real_"] = real
+        else:
+            real = np.ones(nat, dtype=bool)
+
+        if fragments is None or len(fragments) == 1:
+            if fragments is not None and not np.array_equal(np.sort(fragments[0]), np.arange(nat)):
+                raise ValidationError("Fragments must cover every atom exactly once.")
+            if fragments is not None and not np.array_equal(fragments[0], np.arange(nat)):
+                raise ValidationError("Fragments must be contiguous; reordering atoms is left to the constructor.")
+            if molecular_charge is None:
+                molecular_charge = 0.0 if fragment_charges is None else fragment_charges[0]
+            if molecular_multiplicity is None:
+                molecular_multiplicity = 1 if fragment_multiplicities is None else fragment_multiplicities[0]
+            fragment_charges = [molecular_charge]
+            fragment_multiplicities = [molecular_multiplicity]
+        else:
+            fragments = [np.asarray(fr, dtype=np.int32) for fr in fragments]
+            if not np.array_equal(np.sort(np.concatenate(fragments)), np.arange(nat)):
+                raise ValidationError("Fragments must cover every atom exactly once.")
+            if not np.array_equal(np.concatenate(fragments), np.arange(nat)):
+                raise ValidationError("Fragments must be contiguous; reordering atoms is left to the constructor.")
+            if fragment_charges is None or fragment_multiplicities is None:
+                raise ValidationError("Fragment charges and multiplicities are required for multiple fragments.")
+            if not (len(fragment_charges) == len(fragment_multiplicities) == len(fragments)):
+                raise ValidationError("Fragment charges and multiplicities must be same number of entries as Fragments")
+
+            fragment_charges = [float(c) for c in fragment_charges]
+            if molecular_charge is None:
+                molecular_charge = sum(fragment_charges)
+            elif abs(sum(fragment_charges) - molecular_charge) > 1.0e-6:
+                raise ValidationError(f"Fragment charges {fragment_charges} do not sum to {molecular_charge}.")
+            if molecular_multiplicity is None:
+                molecular_multiplicity = sum(m - 1 for m in fragment_multiplicities) + 1
+
+            values["fragments_"] = fragments
+
+        molecular_charge = float(molecular_charge)
+        fragment_multiplicities = [float(m) for m in fragment_multiplicities] + [float(molecular_multiplicity)]
+        if any(m < 1.0 for m in fragment_multiplicities):
+            raise ValidationError(f"Multiplicity must be positive: {fragment_multiplicities}")
+        fragment_multiplicities = [(int(m) if m.is_integer() else m) for m in fragment_multiplicities]
+        molecular_multiplicity = fragment_multiplicities.pop()
+
+        parity = [(np.sum(default_Z * real) - molecular_charge, molecular_multiplicity)]
+        if "fragments_" in values:
+            values["fragment_charges_"] = fragment_charges
+            values["fragment_multiplicities_"] = fragment_multiplicities
+            for fr, chg, mult in zip(fragments, fragment_charges, fragment_multiplicities):
+                parity.append((np.sum(default_Z[fr] * real[fr]) - chg, mult))
+
+        for nel, mult in parity:
+            if float(nel).is_integer() and float(mult).is_integer() and (int(nel) + int(mult) - 1) % 2:
+                raise ValidationError(
+                    f"Inconsistent or unspecified chg/mult: {int(nel)} electrons, multiplicity {mult}"
+                )
+
+        field_names = {
+            **{name: name for name in cls.__fields__},
+            **{f.alias: name for name, f in cls.__fields__.items()},
+        }
+        unknown = set(kwargs) - set(field_names)
+        if unknown:
+            raise ValidationError(f"Unknown Molecule fields: {sorted(unknown)}")
+        for key, val in kwargs.items():
+            field = field_names[key]
+            if field in _FAST_ARGUMENT_FIELDS:
+                raise ValidationError(
+                    f"Molecule field {key} must be passed as argument {_FAST_ARGUMENT_FIELDS[field]}."
+                )
+            if field == "atom_labels_" and val is not None:
+                val = np.asarray(val, dtype=str)
+                if val.shape != (nat,):
+                    raise ValidationError(f"Atom labels must be same number of entries as Symbols: {val.shape}")
+            elif field == "connectivity_" and val is not None:
+                val = sorted((min(at1, at2), max(at1, at2), float(bo)) for at1, at2, bo in val)
+                if any(at1 < 0 or at2 >= nat for at1, at2, _ in val):
+                    raise ValidationError("Connectivity indices must be atoms of the Molecule.")
+                val = [(int(at1), int(at2), bo) for at1, at2, bo in val]
+            values[field] = val
+
+        values.update(
+            {
+                "schema_name": "qcschema_molecule",
+                "schema_version": 2,
+                "validated": True,
+                "symbols": symbols,
+                "geometry": geometry,
+                "name": molecular_formula_from_symbols(symbols, order="alphabetical") if name is None else name,
+                "molecular_charge": molecular_charge,
+                "molecular_multiplicity": molecular_multiplicity,
+                "fix_com": values.get("fix_com", False),
+                "fix_orientation": values.get("fix_orientation", False),
+                "provenance": values.get("provenance", Provenance.construct(**provenance_stamp(__name__))),
+                "extras": values.get("extras", {}),
+            }
+        )
+
+        return cls.construct(_fields_set=set(values), **values)
+
     @classmethod
     def from_file(cls, filename: str, dtype: Optional[str] = None, *, orient: bool = False, **kwargs):
         r"""
@@ -1034,6 +1406,10 @@ class Molecule(ProtoModel):
             with open(filename, "rb") as infile_bytes:
                 data = deserialize(infile_bytes.read(), encoding="msgpack-ext")
             dtype = "dict"
+        elif dtype == "npz-ext":
+            with open(filename, "rb") as infile_bytes:
+                data = deserialize(infile_bytes.read(), encoding="npz-ext")
+            dtype = "dict"
         else:
             raise KeyError("Dtype not understood '{}'.".format(dtype))
 
@@ -1060,7 +1436,7 @@ class Molecule(ProtoModel):
 
         if dtype in ["xyz", "xyz+", "psi4"]:
             stringified = self.to_string(dtype)
-        elif dtype in ["json", "json-ext", "msgpack", "msgpack-ext"]:
+        elif dtype in ["json", "json-ext", "msgpack", "msgpack-ext", "npz-ext"]:
             stringified = self.serialize(dtype)
         elif dtype in ["numpy"]:
             elements = np.array(self.atomic_numbers).reshape(-1, 1)
@@ -1070,7 +1446,7 @@ class Molecule(ProtoModel):
         else:
             raise KeyError(f"Dtype `{dtype}` is not valid")
 
-        flags = "wb" if dtype.startswith("msgpack") else "w"
+        flags = "wb" if dtype.startswith(("msgpack", "npz")) else "w"
 
         with open(filename, flags) as handle:
             handle.write(stringified)
@@ -1173,21 +1549,35 @@ class Molecule(ProtoModel):
             Nuclear repulsion energy in entire molecule or in fragment.
 
         """
-        if real_only:
-            Zeff = [z * int(real) for z, real in zip(cast(Iterable[int], self.atomic_numbers), self.real)]
-        else:
-            Zeff = self.atomic_numbers
-        atoms = list(range(self.geometry.shape[0]))
+        Zeff = self._effective_charges(real_only)
+        atoms = slice(None) if ifr is None else self.fragments[ifr]
 
-        if ifr is not None:
-            atoms = self.fragments[ifr]
+        return float(nuclear_repulsion_matrix(self.geometry[atoms], Zeff[atoms])[0, 0])
 
-        nre = 0.0
-        for iat1, at1 in enumerate(atoms):
-            for at2 in atoms[:iat1]:
-                dist = np.linalg.norm(self.geometry[at1] - self.geometry[at2])
-                nre += Zeff[at1] * Zeff[at2] / dist
-        return nre
+    def nuclear_repulsion_energy_matrix(self, real_only: bool = True) -> Array[float]:
+        r"""Nuclear repulsion energy partitioned by fragment in one pass.
+
+        Parameters
+        ----------
+        real_only
+            Only include real atoms in the sum.
+
+        Returns
+        -------
+        nrem : np.ndarray
+            (nfr, nfr) symmetric array. Diagonal element ``[i, i]`` is the NRE within
+            the `i`-th fragment (equal to ``nuclear_repulsion_energy(ifr=i)``), and
+            off-diagonal element ``[i, j]`` is the NRE between fragments `i` and `j`.
+            The total NRE is the sum of the upper triangle, including the diagonal.
+
+        """
+        return nuclear_repulsion_matrix(self.geometry, self._effective_charges(real_only), self.fragments)
+
+    def _effective_charges(self, real_only: bool) -> np.ndarray:
+        Zeff = np.asarray(self.atomic_numbers, dtype=float)
+        if real_only:
+            Zeff = Zeff * np.asarray(self.real, dtype=bool)
+        return Zeff
 
     def nelectrons(self, ifr: int = None, real_only: bool = True) -> int:
         r"""Number of electrons.
@@ -1294,6 +1684,8 @@ class Molecule(ProtoModel):
         uno_cutoff: float = 1.0e-3,
         run_mirror: bool = False,
         generic_ghosts: bool = False,
+        executor: Optional["Executor"] = None,
+        nprocs: Optional[int] = None,
     ) -> Tuple["Molecule", Dict[str, Any]]:
         r"""Finds shift, rotation, and atom reordering of `concern_mol` (self)
         that best aligns with `ref_mol`.
@@ -1334,6 +1726,13 @@ class Molecule(ProtoModel):
             when harvesting from a printout with a generic ghost symbol), set this to True to
             place all real=False atoms into the same space for alignment. Only allowed when
             ``atoms_map=True``.
+        executor
+            Executor, such as a :py:class:`concurrent.futures.ProcessPoolExecutor`, across whose
+            workers the candidate atom orderings are aligned. The result does not depend on the
+            number of workers. See :py:func:`qcelemental.molutil.B787`.
+        nprocs
+            Number of worker processes for a process pool created for the call if `executor`
+            is not given.
         verbose
             Print level.
 
@@ -1353,20 +1752,10 @@ class Molecule(ProtoModel):
         from ..molutil.align import B787
 
         rgeom = np.array(ref_mol.geometry)
-        runiq = np.asarray(
-            [
-                hashlib.sha1((sym + str(mas)).encode("utf-8")).hexdigest()
-                for sym, mas in zip(cast(Iterable[str], ref_mol.symbols), ref_mol.masses)
-            ]
-        )
+        runiq = ref_mol._align_hashes()
         concern_mol = self
         cgeom = np.array(concern_mol.geometry)
-        cuniq = np.asarray(
-            [
-                hashlib.sha1((sym + str(mas)).encode("utf-8")).hexdigest()
-                for sym, mas in zip(cast(Iterable[str], concern_mol.symbols), concern_mol.masses)
-            ]
-        )
+        cuniq = concern_mol._align_hashes()
 
         if generic_ghosts:
             if not mols_align:
@@ -1389,32 +1778,12 @@ class Molecule(ProtoModel):
             run_to_completion=run_to_completion,
             run_mirror=run_mirror,
             uno_cutoff=uno_cutoff,
+            executor=executor,
+            nprocs=nprocs,
         )
 
-        aupdate = {
-            "symbols": solution.align_atoms(concern_mol.symbols),
-            "geometry": solution.align_coordinates(concern_mol.geometry, reverse=False),
-            "masses": solution.align_atoms(concern_mol.masses),
-            "real": solution.align_atoms(concern_mol.real),
-            "atom_labels": solution.align_atoms(concern_mol.atom_labels),
-            "atomic_numbers": solution.align_atoms(concern_mol.atomic_numbers),
-            "mass_numbers": solution.align_atoms(concern_mol.mass_numbers),
-        }
-        adict = {**concern_mol.dict(), **aupdate}
-
-        # preserve intrinsic symmetry with lighter truncation
-        amol = Molecule(validate=True, **adict, geometry_noise=13)
-
-        # TODO -- can probably do more with fragments in amol now that
-        #         Mol is something with non-contig frags. frags now discarded.
+        amol = concern_mol._apply_alignment(solution, verbose=verbose)
 
-        assert compare_values(
-            concern_mol.nuclear_repulsion_energy(),
-            amol.nuclear_repulsion_energy(),
-            "Q: concern_mol-->returned_mol NRE uncorrupted",
-            atol=1.0e-4,
-            quiet=(verbose > 1),
-        )
         if mols_align:
             assert compare_values(
                 ref_mol.nuclear_repulsion_energy(),
@@ -1432,6 +1801,129 @@ class Molecule(ProtoModel):
 
         return amol, {"rmsd": rmsd, "mill": solution}
 
+    def align_many(
+        self,
+        ref_mols: List["Molecule"],
+        *,
+        verbose: int = 0,
+        atoms_map: bool = False,
+        run_resorting: bool = False,
+        mols_align: Union[bool, float] = False,
+        uno_cutoff: float = 1.0e-3,
+        run_mirror: bool = False,
+        exhaustive: bool = False,
+        executor: Optional["Executor"] = None,
+        nprocs: Optional[int] = None,
+    ) -> Tuple["Molecule", List[Dict[str, Any]]]:
+        r"""Finds which of `ref_mols` `concern_mol` (self) aligns with best, and the shift, rotation,
+        and atom reordering that achieve it.
+
+        Wraps :py:func:`qcelemental.molutil.B787_batch` for :py:class:`qcelemental.models.Molecule`.
+        Quantities of `concern_mol` are computed once for all references, and references that provably
+        cannot beat the best RMSD found are not aligned unless `exhaustive`. Suitable for matching a
+        conformer against a library of known conformers.
+
+        Parameters
+        ----------
+        ref_mols
+            Molecules to match. Those with different atoms than `concern_mol` are not aligned.
+        atoms_map
+            Whether atom1 of each of `ref_mols` corresponds to atom1 of `concern_mol`, etc.
+        mols_align
+            If `True` or float, RMSD [A] tolerance below which a reference is taken as a match, ending the
+            search. `True` means 1.0e-3.
+        run_resorting
+            Run the resorting machinery even if unnecessary because `atoms_map=True`.
+        uno_cutoff
+            Reduced cost below which atom pairings of the Hungarian step count as equally good, so that
+            every atom ordering among them is tried. See :py:func:`qcelemental.molutil.B787`.
+        run_mirror
+            Run alternate geometries potentially allowing best match to each of `ref_mols`
+            from mirror image of `concern_mol`.
+        exhaustive
+            Align to every reference rather than stopping once the best is certain.
+        executor
+            Executor, such as a :py:class:`concurrent.futures.ProcessPoolExecutor`, across whose
+            workers the candidate atom orderings of each reference are aligned. References are
+            still taken one at a time. See :py:meth:`align`.
+        nprocs
+            Number of worker processes for a process pool created for each reference aligned, if
+            `executor` is not given.
+        verbose
+            Print level.
+
+        Returns
+        -------
+        mol : Molecule
+        table : List[Dict[str, Any]]
+            Molecule is internal geometry of `self` optimally aligned and atom-ordered
+            to the best-matching of `ref_mols`, None if no reference has the same atoms.
+            Each entry of the ranked `table` has the `index` into `ref_mols`, the `rmsd` [A]
+            (None if that reference was not aligned), the AlignmentMill `mill`, and a
+            `lower_bound` [A] to the RMSD. See :py:func:`qcelemental.molutil.B787_batch`.
+
+        """
+        from ..molutil.align import B787_batch
+
+        table = B787_batch(
+            cgeom=np.array(self.geometry),
+            rgeoms=[np.array(ref_mol.geometry) for ref_mol in ref_mols],
+            cuniq=self._align_hashes(),
+            runiqs=[ref_mol._align_hashes() for ref_mol in ref_mols],
+            verbose=verbose,
+            atoms_map=atoms_map,
+            run_resorting=run_resorting,
+            mols_align=mols_align,
+            uno_cutoff=uno_cutoff,
+            run_mirror=run_mirror,
+            exhaustive=exhaustive,
+            executor=executor,
+            nprocs=nprocs,
+        )
+
+        amol = None
+        if table and table[0]["mill"] is not None:
+            amol = self._apply_alignment(table[0]["mill"], verbose=verbose)
+
+        return amol, table
+
+    def _align_hashes(self) -> np.ndarray:
+        """Hashes of symbol and mass, which identify the atoms that alignment may exchange."""
+        return np.asarray(
+            [
+                hashlib.sha1((sym + str(mas)).encode("utf-8")).hexdigest()
+                for sym, mas in zip(cast(Iterable[str], self.symbols), self.masses)
+            ]
+        )
+
+    def _apply_alignment(self, solution: "AlignmentMill", *, verbose: int = 0) -> "Molecule":
+        """Molecule transformed and atom-ordered by `solution`, with fragment information discarded."""
+        aupdate = {
+            "symbols": solution.align_atoms(self.symbols),
+            "geometry": solution.align_coordinates(self.geometry, reverse=False),
+            "masses": solution.align_atoms(self.masses),
+            "real": solution.align_atoms(self.real),
+            "atom_labels": solution.align_atoms(self.atom_labels),
+            "atomic_numbers": solution.align_atoms(self.atomic_numbers),
+            "mass_numbers": solution.align_atoms(self.mass_numbers),
+        }
+        adict = {**self.dict(), **aupdate}
+
+        # preserve intrinsic symmetry with lighter truncation
+        amol = Molecule(validate=True, **adict, geometry_noise=13)
+
+        # TODO -- can probably do more with fragments in amol now that
+        #         Mol is something with non-contig frags. frags now discarded.
+
+        assert compare_values(
+            self.nuclear_repulsion_energy(),
+            amol.nuclear_repulsion_energy(),
+            "Q: concern_mol-->returned_mol NRE uncorrupted",
+            atol=1.0e-4,
+            quiet=(verbose > 1),
+        )
+        return amol
+
     def scramble(
         self,
         *,
@@ -1562,9 +2054,80 @@ class Molecule(ProtoModel):
         return cmol, {"rmsd": rmsd, "mill": perturbation}
 
 
+def _topology_key(mol: Molecule) -> Tuple[Any, ...]:
+    """Hashable key of the stored, unrounded non-geometry :py:attr:`Molecule.hash_fields` of `mol`. Equal keys give
+    equal version-2 hash fields; a few equal topologies may get different keys, which costs only a repeated digest.
+    """
+
+    def _key(data):
+        if isinstance(data, np.ndarray):
+            return (data.dtype.str, data.shape, data.tobytes())
+        elif isinstance(data, (list, tuple)):
+            return tuple(_key(item) for item in data)
+        return data
+
+    return tuple(
+        _key(mol.__dict__.get(f"{field}_", mol.__dict__.get(field))) for field in mol.hash_fields if field != "geometry"
+    )
+
+
+def _binary_hash_fields(mol: Molecule) -> Dict[str, bytes]:
+    """Canonical little-endian bytes of the rounded non-geometry :py:attr:`Molecule.hash_fields` of `mol`."""
+
+    def _f8(data, around):
+        return np.ascontiguousarray(float_prep(np.asarray(data, dtype=float), around), dtype="<f8").tobytes()
+
+    return {
+        "symbols": "\0".join(mol.symbols).encode("utf-8"),
+        "masses": _f8(mol.masses, MASS_NOISE),
+        "molecular_charge": _f8([mol.molecular_charge], CHARGE_NOISE),
+        "molecular_multiplicity": _f8([mol.molecular_multiplicity], CHARGE_NOISE),
+        "real": np.asarray(mol.real, dtype="u1").tobytes(),
+        "fragments": np.concatenate(
+            [np.array([len(fr) for fr in mol.fragments])] + [np.asarray(fr) for fr in mol.fragments]
+        )
+        .astype("<i8")
+        .tobytes(),
+        "fragment_charges": _f8(mol.fragment_charges, CHARGE_NOISE),
+        "fragment_multiplicities": _f8(mol.fragment_multiplicities, CHARGE_NOISE),
+        "connectivity": b"\xff" if mol.connectivity is None else np.array(mol.connectivity, dtype="<f8").tobytes(),
+    }
+
+
+def _binary_hashes(
+    mol: Molecule, rounded_geometries: np.ndarray, fields: Optional[Dict[str, bytes]] = None
+) -> List[str]:
+    """Version-2 molecule hashes from canonical little-endian bytes of the rounded :py:attr:`Molecule.hash_fields`.
+    `rounded_geometries` is a (k, nat, 3) stack of ``float_prep(geometry, GEOMETRY_NOISE)`` arrays, each hashed with
+    the non-geometry fields of `mol` (or precomputed `fields`), so batches sharing a topology digest it only once.
+    """
+
+    def _update(m, field, payload):
+        m.update(field.encode("utf-8"))
+        m.update(len(payload).to_bytes(8, "little"))
+        m.update(payload)
+
+    if fields is None:
+        fields = _binary_hash_fields(mol)
+
+    igeom = mol.hash_fields.index("geometry")
+    prefix = hashlib.sha1(b"qcschema_molecule_hash_v2")
+    for field in mol.hash_fields[:igeom]:
+        _update(prefix, field, fields[field])
+
+    hashes = []
+    for geom in np.ascontiguousarray(rounded_geometries, dtype="<f8"):
+        m = prefix.copy()
+        _update(m, "geometry", geom.tobytes())
+        for field in mol.hash_fields[igeom + 1 :]:
+            _update(m, field, fields[field])
+        hashes.append(m.hexdigest())
+    return hashes
+
+
 def _filter_defaults(dicary):
     nat = len(dicary["symbols"])
-    default_mass = np.array([periodictable.to_mass(e) for e in dicary["symbols"]])
+    default_mass = periodictable.to_mass_array(dicary["symbols"])
 
     dicary.pop("atomic_numbers")
 
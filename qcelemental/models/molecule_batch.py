@@ -0,0 +1,268 @@
+"""
+Molecule Batch Object Model
+"""
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Union
+
+import numpy as np
+
+try:
+    from pydantic.v1 import Field, validator
+except ImportError:  # Will also trap ModuleNotFoundError
+    from pydantic import Field, validator
+
+from ..util import compute_angle, compute_dihedral, compute_distance
+from .basemodels import ProtoModel
+from .molecule import GEOMETRY_NOISE, Molecule, _binary_hashes, float_prep
+from .types import Array
+
+if TYPE_CHECKING:
+    try:
+        from pydantic.v1.typing import ReprArgs
+    except ImportError:  # Will also trap ModuleNotFoundError
+        from pydantic.typing import ReprArgs
+
+__all__ = ["MoleculeBatch"]
+
+# Molecule fields (other than geometry) that must agree for molecules to share a batch
+_topology_fields = [
+    "symbols",
+    "masses",
+    "real",
+    "atom_labels",
+    "atomic_numbers",
+    "mass_numbers",
+    "connectivity",
+    "fragments",
+    "fragment_charges",
+    "fragment_multiplicities",
+    "molecular_charge",
+    "molecular_multiplicity",
+]
+
+
+class MoleculeBatch(ProtoModel):
+    r"""
+    An ensemble of conformers (e.g., a conformer search or MD snapshots) of a single molecular topology.
+
+    The shared topology is stored once as the :attr:`~qcelemental.models.MoleculeBatch.molecule` template
+    and the per-conformer coordinates as one contiguous (nconf, nat, 3) array. Indexing returns an ordinary
+    :class:`~qcelemental.models.Molecule` whose geometry is a view into the batch, while hashing, nuclear
+    repulsion, orientation, and measurement are evaluated for all conformers at once.
+
+    """
+
+    molecule: Molecule = Field(  # type: ignore
+        ...,
+        description="Template supplying every field except geometry (symbols, masses, fragments, charges, etc.) "
+        "to all conformers. The template's own geometry is not used by the batch.",
+    )
+    geometries: Array[float] = Field(  # type: ignore
+        ...,
+        description="The conformer Cartesian XYZ coordinates [a0] as one (nconf, nat, 3) array with atom order "
+        "matching :attr:`~qcelemental.models.MoleculeBatch.molecule`. Serialized storage is flat, "
+        "(nconf*nat*3,), and is reshaped on load.",
+        shape=["nconf", "nat", 3],
+        units="a0",
+    )
+
+    class Config(ProtoModel.Config):
+        serialize_skip_defaults = True
+
+    @validator("geometries")
+    def _must_be_nconf_nat_3(cls, v, values, **kwargs):
+        if "molecule" not in values:
+            return v
+        nat = len(values["molecule"].symbols)
+        try:
+            v = v.reshape(-1, nat, 3)
+        except (ValueError, AttributeError):
+            raise ValueError(f"Geometries must be castable to shape (nconf, {nat}, 3)!")
+        return v
+
+    def __repr_args__(self) -> "ReprArgs":
+        return [
+            ("formula", self.molecule.get_molecular_formula(chgmult=True)),
+            ("nconf", len(self)),
+        ]
+
+    ### Non-Pydantic API functions
+
+    def __len__(self) -> int:
+        return self.geometries.shape[0]
+
+    def __getitem__(self, iconf: int) -> Molecule:
+        r"""The `iconf`-th conformer as a :class:`~qcelemental.models.Molecule` sharing the batch topology."""
+        return self.molecule.copy(update={"geometry": self.geometries[iconf]})
+
+    def molecules(self) -> Iterator[Molecule]:
+        r"""Iterates over the conformers as :class:`~qcelemental.models.Molecule` objects."""
+        for iconf in range(len(self)):
+            yield self[iconf]
+
+    @classmethod
+    def from_molecules(cls, molecules: Iterable[Molecule]) -> "MoleculeBatch":
+        r"""
+        Constructs a batch from molecules that differ only in geometry.
+
+        Parameters
+        ----------
+        molecules
+            Conformers with identical symbols, masses, ghosting, labels, connectivity, fragmentation,
+            charges, and multiplicities.
+
+        Returns
+        -------
+        MoleculeBatch
+            Batch whose template is the first of `molecules`.
+
+        """
+        molecules = list(molecules)
+        if not molecules:
+            raise ValueError("MoleculeBatch requires at least one Molecule.")
+
+        template = molecules[0]
+        for imol, mol in enumerate(molecules[1:], start=1):
+            for field in _topology_fields:
+                ref, val = getattr(template, field), getattr(mol, field)
+                if field == "fragments":
+                    same = len(ref) == len(val) and all(np.array_equal(r, v) for r, v in zip(ref, val))
+                else:
+                    same = np.array_equal(np.asarray(ref, dtype=object), np.asarray(val, dtype=object))
+                if not same:
+                    raise ValueError(f"Molecule {imol} differs from Molecule 0 in `{field}`; cannot batch.")
+
+        return cls(molecule=template, geometries=np.stack([mol.geometry for mol in molecules]))
+
+    def get_hash(self, hash_version: int = 2) -> List[str]:
+        r"""
+        Returns the hash of each conformer.
+
+        Parameters
+        ----------
+        hash_version
+            Hashing scheme as in :py:meth:`Molecule.get_hash`. For the default binary version 2, the shared
+            topology is digested once for the whole batch.
+
+        Returns
+        -------
+        List[str]
+            Hashes in conformer order, each equal to ``batch[i].get_hash(hash_version)``.
+
+        """
+        if hash_version == 2:
+            return _binary_hashes(self.molecule, float_prep(self.geometries, GEOMETRY_NOISE))
+        return [mol.get_hash(hash_version) for mol in self.molecules()]
+
+    def nuclear_repulsion_energy(self, ifr: int = None, real_only: bool = True, *, chunk: int = 2**20) -> np.ndarray:
+        r"""Nuclear repulsion energy of every conformer.
+
+        Parameters
+        ----------
+        ifr
+            If not `None`, only compute for the `ifr`-th (0-indexed) fragment.
+        real_only
+            Only include real atoms in the sum.
+        chunk
+            Approximate number of atom pairs, over all conformers, evaluated at once. Atoms are taken in
+            square blocks of about ``sqrt(chunk)``, and conformers in groups filling up `chunk`, so working
+            memory is bounded by `chunk` whatever the number of atoms.
+
+        Returns
+        -------
+        nre : np.ndarray
+            (nconf,) Nuclear repulsion energy in entire molecule or in fragment for each conformer.
+
+        """
+        mol = self.molecule
+        Zeff = mol._effective_charges(real_only)
+        atoms = np.arange(len(mol.symbols)) if ifr is None else np.asarray(mol.fragments[ifr])
+        atoms = atoms[Zeff[atoms] != 0.0]
+        block = max(1, int(np.sqrt(chunk)))
+
+        nre = np.zeros(len(self))
+        for start1 in range(0, len(atoms), block):
+            blk1 = atoms[start1 : start1 + block]
+            for start2 in range(0, start1 + 1, block):
+                blk2 = atoms[start2 : start2 + block]
+
+                # within a diagonal block, count each pair once and skip self-pairs
+                zz = np.outer(Zeff[blk1], Zeff[blk2])
+                if start1 == start2:
+                    zz = np.tril(zz, k=-1)
+
+                step = max(1, chunk // zz.size)
+                for start in range(0, len(self), step):
+                    geoms = self.geometries[start : start + step]
+                    diff = geoms[:, blk1, None, :] - geoms[:, None, blk2, :]
+                    dist = np.sqrt(np.einsum("cijk,cijk->cij", diff, diff))
+                    epair = np.divide(zz, dist, out=np.zeros_like(dist), where=(zz != 0.0))
+                    nre[start : start + step] += epair.sum(axis=(1, 2))
+        return nre
+
+    def orient(self) -> "MoleculeBatch":
+        r"""
+        Centers each conformer and orients it via the inertia tensor, as :py:meth:`Molecule.orient_molecule`
+        does for a single molecule, returning a new batch.
+        """
+        masses = np.asarray(self.molecule.masses, dtype=float)
+
+        geoms = self.geometries - np.einsum("a,cak->ck", masses, self.geometries)[:, None, :] / np.sum(masses)
+
+        # inertia tensors sum_a m_a (r_a^2 I - r_a r_a^T) for all conformers
+        r2 = np.einsum("a,cak,cak->c", masses, geoms, geoms)
+        tensors = r2[:, None, None] * np.eye(3) - np.einsum("a,cak,cal->ckl", masses, geoms, geoms)
+        _, evecs = np.linalg.eigh(tensors)
+        geoms = np.einsum("cak,ckl->cal", geoms, evecs)
+
+        # phase: first atom off each plane is positive
+        offplane = np.abs(geoms) >= 10 ** (-GEOMETRY_NOISE)
+        first = np.argmax(offplane, axis=1)
+        lead = np.take_along_axis(geoms, first[:, None, :], axis=1)[:, 0, :]
+        flip = offplane.any(axis=1) & (lead < 0)
+        geoms = np.where(flip[:, None, :], -geoms, geoms)
+
+        return self.copy(update={"geometries": float_prep(geoms, GEOMETRY_NOISE)})
+
+    def measure(self, measurements: Union[List[int], List[List[int]]], *, degrees: bool = True) -> np.ndarray:
+        r"""
+        Takes measurements of every conformer from the indices provided.
+
+        Parameters
+        ----------
+        measurements
+            Either a single list of indices or multiple. Return a distance, angle, or dihedral depending if
+            2, 3, or 4 indices is provided, respectively. Values are returned in Bohr (distance) or degree.
+        degrees
+            Returns degrees by default, radians otherwise.
+
+        Returns
+        -------
+        np.ndarray
+            (nconf,) values for a single measurement or (nconf, nmeas) values for multiple.
+        """
+        nat = self.geometries.shape[1]
+
+        single = False
+        if isinstance(measurements[0], (int, np.integer)):
+            measurements = [measurements]
+            single = True
+
+        ret = []
+        for num, m in enumerate(measurements):
+            if any(x >= nat for x in m):
+                raise ValueError(f"An index of measurement {num} is out of bounds.")
+
+            points = [self.geometries[:, x] for x in m]
+            if len(m) == 2:
+                ret.append(compute_distance(*points))
+            elif len(m) == 3:
+                ret.append(compute_angle(*points, degrees=degrees))
+            elif len(m) == 4:
+                ret.append(compute_dihedral(*points, degrees=degrees))
+            else:
+                raise KeyError(f"Unrecognized number of arguments for measurement {num}, found {len(m)}, expected 2-4.")
+
+        if single:
+            return ret[0]
+        else:
+            return np.stack(ret, axis=1)
@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
 
 try:
     from typing import Literal
@@ -12,7 +14,7 @@ try:
 except ImportError:  # Will also trap ModuleNotFoundError
     from pydantic import Field, conlist, constr, validator
 
-from ..util import provenance_stamp
+from ..util import provenance_stamp, serialize
 from .basemodels import ProtoModel
 from .common_models import (
     ComputeError,
@@ -35,6 +37,140 @@ if TYPE_CHECKING:
         from pydantic.typing import ReprArgs
 
 
+# Top-level key of the shared Molecule topologies written by `serialize(..., dedup_molecules=True)`
+_topologies_key = "molecule_topologies"
+
+
+def _freeze(value: Any) -> Any:
+    r"""A hashable stand-in for a serialized value, equal only for values that serialize identically."""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    elif isinstance(value, np.ndarray):
+        return (np.ndarray, value.dtype.str, value.shape, value.tobytes())
+    elif isinstance(value, float):
+        return (float, value.hex())
+    return (type(value), value)
+
+
+def _map_path(node: Any, path: Tuple[str, ...], fn: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Any:
+    r"""Applies `fn` to the Molecule dictionaries at `path` under `node`, where "*" matches every item."""
+    if node is None:
+        return None
+    elif not path:
+        return fn(node)
+
+    key, rest = path[0], path[1:]
+    if key == "*":
+        if isinstance(node, dict):
+            return {k: _map_path(v, rest, fn) for k, v in node.items()}
+        return [_map_path(v, rest, fn) for v in node]
+    elif key not in node:
+        return node
+    return {**node, key: _map_path(node[key], rest, fn)}
+
+
+def _dedup_molecules(data: Dict[str, Any], paths: List[Tuple[str, ...]]) -> Dict[str, Any]:
+    r"""Replaces the Molecules at `paths` with a geometry and a reference into a table of their other fields."""
+    topologies: List[Dict[str, Any]] = []
+    index: Dict[Any, int] = {}
+
+    def compact(molecule):
+        topology = {k: v for k, v in molecule.items() if k != "geometry"}
+        try:
+            itop = index.setdefault(_freeze(topology), len(topologies))
+        except TypeError:  # not hashable, left as it is
+            return molecule
+        if itop == len(topologies):
+            topologies.append(topology)
+        return {"topology": itop, "geometry": molecule["geometry"]}
+
+    for path in paths:
+        data = _map_path(data, path, compact)
+    data[_topologies_key] = topologies
+    return data
+
+
+def _expand_molecules(data: Dict[str, Any], paths: List[Tuple[str, ...]]) -> Dict[str, Any]:
+    r"""Inverts :func:`_dedup_molecules`."""
+    data = dict(data)
+    topologies = data.pop(_topologies_key)
+
+    def expand(molecule):
+        if "topology" not in molecule:
+            return molecule
+        return {**topologies[molecule["topology"]], "geometry": molecule["geometry"]}
+
+    for path in paths:
+        data = _map_path(data, path, expand)
+    return data
+
+
+class _DedupMoleculesMixin:
+    r"""Serialization of procedure results that stores the Molecule fields repeated between steps once."""
+
+    # Locations of the Molecules in the serialized model, "*" matching every item of a list or dictionary
+    _molecule_paths: List[Tuple[str, ...]] = []
+
+    @classmethod
+    def parse_obj(cls, obj: Any, **kwargs: Any) -> ProtoModel:
+        if isinstance(obj, dict) and _topologies_key in obj:
+            obj = _expand_molecules(obj, cls._molecule_paths)
+        return super().parse_obj(obj, **kwargs)  # type: ignore
+
+    def serialize(
+        self,
+        encoding: str,
+        *,
+        include: Optional[Set[str]] = None,
+        exclude: Optional[Set[str]] = None,
+        exclude_unset: Optional[bool] = None,
+        exclude_defaults: Optional[bool] = None,
+        exclude_none: Optional[bool] = None,
+        dedup_molecules: bool = False,
+    ) -> Union[bytes, str]:
+        r"""Generates a serialized representation of the model
+
+        Parameters
+        ----------
+        encoding
+            The serialization type, see :meth:`ProtoModel.serialize`.
+        include
+            Fields to be included in the serialization.
+        exclude
+            Fields to be excluded in the serialization.
+        exclude_unset
+            If True, skips fields that have default values provided.
+        exclude_defaults
+            If True, skips fields that have set or defaulted values equal to the default.
+        exclude_none
+            If True, skips fields that have value ``None``.
+        dedup_molecules
+            If True, every Molecule (initial, final, and those of each trajectory step) is stored as its geometry
+            and an index into a ``molecule_topologies`` list holding each distinct set of the remaining fields
+            (symbols, masses, fragments, etc.) once. ``parse_raw``, ``parse_file``, and ``parse_obj`` expand such
+            data transparently.
+
+        Returns
+        -------
+        ~typing.Union[bytes, str]
+            The serialized model.
+        """
+
+        data = self._serialization_dict(  # type: ignore
+            include=include,
+            exclude=exclude,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+        if dedup_molecules:
+            data = _dedup_molecules(data, self._molecule_paths)
+
+        return serialize(data, encoding=encoding)
+
+
 class TrajectoryProtocolEnum(str, Enum):
     """
     Which gradient evaluations to keep in an optimization trajectory.
@@ -103,9 +239,11 @@ class OptimizationInput(ProtoModel):
         ]
 
 
-class OptimizationResult(OptimizationInput):
+class OptimizationResult(_DedupMoleculesMixin, OptimizationInput):
     """QCSchema results model for geometry optimization."""
 
+    _molecule_paths = [("initial_molecule",), ("final_molecule",), ("trajectory", "*", "molecule")]
+
     schema_name: constr(  # type: ignore
         strip_whitespace=True, regex=qcschema_optimization_output_default
     ) = qcschema_optimization_output_default
@@ -238,7 +376,7 @@ class TorsionDriveInput(ProtoModel):
         return value
 
 
-class TorsionDriveResult(TorsionDriveInput):
+class TorsionDriveResult(_DedupMoleculesMixin, TorsionDriveInput):
     """Results from running a torsion drive.
 
     Notes
@@ -246,6 +384,10 @@ class TorsionDriveResult(TorsionDriveInput):
     * This class is still provisional and may be subject to removal and re-design.
     """
 
+    _molecule_paths = [("initial_molecule", "*"), ("final_molecules", "*")] + [
+        ("optimization_history", "*", "*") + path for path in OptimizationResult._molecule_paths
+    ]
+
     schema_name: constr(strip_whitespace=True, regex=qcschema_torsion_drive_output_default) = qcschema_torsion_drive_output_default  # type: ignore
     schema_version: int = 1
 
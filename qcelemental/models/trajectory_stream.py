@@ -0,0 +1,180 @@
+"""
+Append-only trajectory streams for running geometry optimizations
+"""
+from typing import IO, Any, Dict, List, Optional, Union
+
+from ..util import msgpackext_dump, msgpackext_load
+from .procedures import OptimizationInput, OptimizationResult
+from .results import AtomicResult
+
+__all__ = ["OptimizationTrajectoryWriter", "OptimizationTrajectoryReader"]
+
+_stream_schema = "qcschema_optimization_trajectory_stream"
+
+# OptimizationResult fields a writer may set in `update`
+_result_fields = {"final_molecule", "stdout", "stderr", "success", "error", "provenance"}
+
+
+class OptimizationTrajectoryWriter:
+    r"""
+    Writes a geometry optimization to a binary stream one gradient evaluation at a time.
+
+    The stream is a sequence of ``msgpack-ext`` records: a header holding the optimization input, one record
+    per :meth:`append` with the step's :class:`~qcelemental.models.AtomicResult` and energy, and a record per
+    :meth:`update` of the result-only fields (e.g., ``final_molecule``, ``success``). Records are only ever
+    appended, so checkpointing an optimization of n steps costs O(n) I/O overall, and a
+    :class:`OptimizationTrajectoryReader` can follow the stream while it is written.
+
+    Parameters
+    ----------
+    stream
+        A writeable binary file-like object, such as ``open(path, "wb")``. To continue an existing stream, such
+        as after a restart, open it with ``open(path, "ab")`` and pass no `input_data`.
+    input_data
+        The optimization being run, written as the header of a new stream.
+
+    """
+
+    def __init__(self, stream: IO[bytes], input_data: Optional[Union[OptimizationInput, Dict[str, Any]]] = None):
+        self.stream = stream
+
+        if input_data is not None:
+            if not isinstance(input_data, OptimizationInput):
+                input_data = OptimizationInput(**input_data)
+            self._write({"schema_name": _stream_schema, "schema_version": 1, "input": input_data.dict()})
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        msgpackext_dump(record, self.stream)
+        self.stream.flush()
+
+    def append(self, result: Union[AtomicResult, Dict[str, Any]], energy: Optional[float] = None) -> None:
+        r"""
+        Appends a gradient evaluation to the trajectory.
+
+        Parameters
+        ----------
+        result
+            The result of the step.
+        energy
+            The energy of the step for the ``energies`` field. Defaults to ``result.properties.return_energy``.
+
+        """
+        if not isinstance(result, AtomicResult):
+            result = AtomicResult(**result)
+
+        if energy is None:
+            energy = result.properties.return_energy
+            if energy is None:
+                raise ValueError("Step energy not given and not found in `result.properties.return_energy`.")
+
+        self._write({"step": result.dict(), "energy": float(energy)})
+
+    def update(self, **fields: Any) -> None:
+        r"""
+        Sets result fields of the optimization, usually once it has finished.
+
+        Parameters
+        ----------
+        **fields
+            Any of ``final_molecule``, ``stdout``, ``stderr``, ``success``, ``error``, and ``provenance``, as
+            models or dictionaries. Later updates of a field replace earlier ones.
+
+        """
+        unknown = set(fields) - _result_fields
+        if unknown:
+            raise KeyError(f"Cannot update fields {sorted(unknown)}, valid fields: {sorted(_result_fields)}.")
+
+        self._write({"update": {k: v.dict() if hasattr(v, "dict") else v for k, v in fields.items()}})
+
+
+class OptimizationTrajectoryReader:
+    r"""
+    Reads a stream written by :class:`OptimizationTrajectoryWriter`, possibly while it is being written.
+
+    Each call to :meth:`read` picks up the records appended since the previous call, so following a live
+    optimization costs only the new steps. A record cut short at the end of the stream (i.e., one still being
+    written) is left for the next :meth:`read` if the stream is seekable.
+
+    Parameters
+    ----------
+    stream
+        A readable binary file-like object, such as ``open(path, "rb")``.
+    trusted
+        Skip validation of the steps, see :meth:`ProtoModel.parse_obj`.
+
+    """
+
+    def __init__(self, stream: IO[bytes], *, trusted: bool = False):
+        self.stream = stream
+        self.trusted = trusted
+
+        self.input_data: Optional[Dict[str, Any]] = None
+        self.trajectory: List[AtomicResult] = []
+        self.energies: List[float] = []
+        self.updates: Dict[str, Any] = {}
+
+        self.read()
+
+    def read(self) -> int:
+        r"""
+        Reads the records appended since the last call.
+
+        Returns
+        -------
+        int
+            The number of new trajectory steps.
+
+        """
+        nsteps = len(self.trajectory)
+
+        while True:
+            position = self.stream.tell() if self.stream.seekable() else None
+            try:
+                record = msgpackext_load(self.stream)
+            except EOFError:
+                if position is not None:
+                    self.stream.seek(position)
+                break
+
+            if "step" in record:
+                self.trajectory.append(AtomicResult.parse_obj(record["step"], trusted=self.trusted))
+                self.energies.append(record["energy"])
+            elif "update" in record:
+                self.updates.update(record["update"])
+            elif record.get("schema_name") == _stream_schema:
+                self.input_data = record["input"]
+            else:
+                raise ValueError(f"Record with keys {sorted(record)} not understood in an optimization trajectory.")
+
+        return len(self.trajectory) - nsteps
+
+    @property
+    def complete(self) -> bool:
+        r"""Whether the writer has recorded whether the optimization succeeded."""
+        return "success" in self.updates
+
+    def result(self) -> OptimizationResult:
+        r"""
+        The optimization as read so far.
+
+        Fields not yet set by :meth:`OptimizationTrajectoryWriter.update` are filled in as for a running
+        optimization: ``final_molecule`` is the molecule of the last step (None before the first), ``success``
+        is False, and ``provenance`` is that of the input.
+
+        Returns
+        -------
+        OptimizationResult
+            The validated optimization.
+
+        """
+        if self.input_data is None:
+            raise ValueError("Optimization trajectory stream has no header.")
+
+        data = {k: v for k, v in self.input_data.items() if k != "schema_name"}
+        data["trajectory"] = self.trajectory
+        data["energies"] = self.energies
+        data["final_molecule"] = self.trajectory[-1].molecule if self.trajectory else None
+        data["success"] = False
+        data.update(self.updates)
+
+        return OptimizationResult(**data)
@@ -6,7 +6,7 @@ import numpy as np
 
 from ..exceptions import ValidationError
 from ..physical_constants import constants
-from ..util import provenance_stamp, unnp, update_with_error
+from ..util import close_contacts, provenance_stamp, unnp, update_with_error
 from .chgmult import validate_and_fill_chgmult
 from .nucleus import reconcile_nucleus
 from .regex import VERSION_PATTERN
@@ -595,19 +595,10 @@ def validate_and_fill_geometry(geom=None, tooclose=0.1, copy=True):
     """Check `geom` for overlapping atoms. Return flattened"""
 
     npgeom = np.array(geom, copy=copy, dtype=float).reshape((-1, 3))
+    if not np.all(np.isfinite(npgeom)):
+        raise ValidationError("""Geometry must be finite: {}""".format(npgeom.tolist()))
 
-    # Upper triangular
-    metric = tooclose**2
-    tooclose_inds = []
-    for x in range(npgeom.shape[0]):
-        diffs = npgeom[x] - npgeom[x + 1 :]
-        dists = np.einsum("ij,ij->i", diffs, diffs)
-
-        # Record issues
-        if np.any(dists < metric):
-            indices = np.where(dists < metric)[0]
-            tooclose_inds.extend([(x, y, dist) for y, dist in zip(indices + x + 1, dists[indices] ** 0.5)])
-
+    tooclose_inds = close_contacts(npgeom, tooclose)
     if tooclose_inds:
         raise ValidationError(
             """Following atoms are too close: {}""".format([(i, j, dist) for i, j, dist in tooclose_inds])
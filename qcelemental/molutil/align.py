@@ -1,7 +1,10 @@
 import collections
+import concurrent.futures
 import itertools
+import multiprocessing
+import os
 import time
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -9,18 +12,13 @@ from ..exceptions import ValidationError
 from ..models import AlignmentMill
 from ..physical_constants import constants
 from ..testing import compare_values
-from ..util import distance_matrix, linear_sum_assignment, random_rotation_matrix, uno, which_import
+from ..util import distance_matrix, linear_sum_assignment, nuclear_repulsion_matrix, random_rotation_matrix, uno
 
 
 def _nre(Z, geom):
     """Nuclear repulsion energy"""
 
-    nre = 0.0
-    for at1 in range(geom.shape[0]):
-        for at2 in range(at1):
-            dist = np.linalg.norm(geom[at1] - geom[at2])
-            nre += Z[at1] * Z[at2] / dist
-    return nre
+    return nuclear_repulsion_matrix(geom, Z)[0, 0]
 
 
 def _pseudo_nre(Zhash, geom):
@@ -31,6 +29,54 @@ def _pseudo_nre(Zhash, geom):
     return _nre(pZ, geom)
 
 
+def _inverse_distance_matrix(geom):
+    """Headless (all Z = 1) NRE matrix of `geom`, with zero diagonal."""
+
+    with np.errstate(divide="ignore"):
+        nremat = np.reciprocal(distance_matrix(geom, geom))
+    nremat[nremat == np.inf] = 0.0
+    return nremat
+
+
+def _mirror_superimposable(cgeom, cuniq, verbose=1):
+    """Whether `cgeom` can be aligned onto its (xz-plane) mirror image."""
+
+    mcgeom = np.copy(cgeom)
+    mcgeom[:, 1] *= -1.0
+    exact = 1.0e-6
+    mrmsd, msolution = B787(
+        mcgeom,
+        cgeom,
+        cuniq,
+        cuniq,
+        do_plot=False,
+        verbose=0,
+        atoms_map=False,
+        mols_align=exact,
+        run_mirror=False,
+        uno_cutoff=0.1,
+    )
+    superimposable = mrmsd < exact
+    if verbose >= 1 and superimposable:
+        print(
+            "Not testing for mirror-image matches (despite `run_mirror`) since system and its mirror are superimposable"
+        )
+    return superimposable
+
+
+def _rmsd_lower_bound(rgeom, cgeom, runiq, cuniq):
+    """Lower bound to the RMSD [A] of any alignment of `cgeom` onto `rgeom`, from the distances of the atoms
+    of each class to the centroid. Rotation, mirroring, and reordering within a class preserve these
+    distances, and matching them in sorted order is the best any reordering can do.
+
+    """
+    rrad = np.linalg.norm(rgeom - rgeom.mean(axis=0), axis=1)
+    crad = np.linalg.norm(cgeom - cgeom.mean(axis=0), axis=1)
+    rord = np.lexsort((rrad, runiq))
+    cord = np.lexsort((crad, cuniq))
+    return np.linalg.norm(rrad[rord] - crad[cord]) * constants.bohr2angstroms / np.sqrt(rgeom.shape[0])
+
+
 def B787(
     cgeom: np.ndarray,
     rgeom: np.ndarray,
@@ -45,6 +91,12 @@ def B787(
     algorithm: str = "hungarian_uno",
     uno_cutoff: float = 1.0e-3,
     run_mirror: bool = False,
+    *,
+    cnremat: Optional[np.ndarray] = None,
+    rnremat: Optional[np.ndarray] = None,
+    mirror_superimposable: Optional[bool] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    nprocs: Optional[int] = None,
 ):
     r"""Use Kabsch algorithm to find best alignment of geometry `cgeom` onto
     `rgeom` while sampling atom mappings restricted by `runiq` and `cuniq`.
@@ -94,6 +146,29 @@ def B787(
         Run alternate geometries potentially allowing best match to `rgeom`
         from mirror image of `cgeom`. Only run if system confirmed to
         be nonsuperimposable upon mirror reflection.
+    cnremat
+        (nat, nat) headless NRE matrix of `cgeom` for `algorithm='hungarian_uno'`,
+        if already computed. See :py:func:`B787_batch`.
+    rnremat
+        (nat, nat) headless NRE matrix of `rgeom`, if already computed.
+    mirror_superimposable
+        Whether `cgeom` is superimposable upon its mirror image, if already known.
+        Only used with `run_mirror`.
+    executor
+        Executor, such as a :py:class:`concurrent.futures.ProcessPoolExecutor`, across
+        whose workers the candidate atom orderings are Kabsch-aligned in chunks. The
+        chunks are fixed in size and their results are scanned in order, so the returned
+        alignment is identical to the serial one regardless of worker count. Under
+        `mols_align`, chunks past the first converged one are cancelled or never
+        dispatched. Each chunk skips orderings that provably cannot beat the best RMSD
+        known when it runs; threads share that bound live, while other executors get
+        it as of submission, along with all candidate orderings.
+    nprocs
+        Number of worker processes. If `executor` is not given and `nprocs` > 1, a
+        process pool of this size is created for the call. Its workers receive the
+        candidate orderings once and share the best RMSD bound in shared memory. With
+        `executor`, sets how many chunks are kept in flight (twice `nprocs`, default by
+        CPU count).
 
     Returns
     -------
@@ -119,26 +194,10 @@ def B787(
         # use aligner to check if system and its (xz-plane) mirror image are
         #   superimposible and hence whether its worth doubling the number of Kabsch
         #   runs below to check for mirror-image matches
-        mcgeom = np.copy(cgeom)
-        mcgeom[:, 1] *= -1.0
-        exact = 1.0e-6
-        mrmsd, msolution = B787(
-            mcgeom,
-            cgeom,
-            cuniq,
-            cuniq,
-            do_plot=False,
-            verbose=0,
-            atoms_map=False,
-            mols_align=exact,
-            run_mirror=False,
-            uno_cutoff=0.1,
-        )
-        superimposable = mrmsd < exact
-        if verbose >= 1 and superimposable:
-            print(
-                "Not testing for mirror-image matches (despite `run_mirror`) since system and its mirror are superimposable"
-            )
+        if mirror_superimposable is None:
+            superimposable = _mirror_superimposable(cgeom, cuniq, verbose=verbose)
+        else:
+            superimposable = mirror_superimposable
 
     # initialization
     best_rmsd = 100.0  # [A]
@@ -169,76 +228,97 @@ def B787(
     if verbose >= 1:
         print("Start RMSD = {:8.4f} [A] (naive)".format(start_rmsd))
 
-    def _plausible_atom_orderings_wrapper(
-        runiq, cuniq, rgeom, cgeom, run_resorting, algorithm="hungarian_uno", verbose=1, uno_cutoff=1.0e-3
-    ):
-        """Wrapper to _plausible_atom_orderings that bypasses it (`run_resorting=False`) when
-        atoms of R & C known to be ordered. Easier to put logic here because _plausible is generator.
+    t0 = time.time()
+    if run_resorting:
+        classes = _plausible_atom_ordering_classes(
+            runiq,
+            cuniq,
+            rgeom,
+            cgeom,
+            algorithm=algorithm,
+            verbose=verbose,
+            uno_cutoff=uno_cutoff,
+            cnremat=cnremat,
+            rnremat=rnremat,
+            lazy=(executor is None and not (nprocs is not None and nprocs > 1)),
+        )
+    else:
+        classes = [(np.arange(nat), np.arange(nat)[None, :])]
 
-        """
-        if run_resorting:
-            return _plausible_atom_orderings(
-                runiq, cuniq, rgeom, cgeom, algorithm=algorithm, verbose=verbose, uno_cutoff=uno_cutoff
-            )
-        else:
-            return [np.arange(rgeom.shape[0])]
+    if run_mirror and not superimposable:
+        icgeom = np.copy(cgeom)
+        icgeom[:, 1] *= -1.0
+        presentations = [(cgeom, False, " "), (icgeom, True, "m")]
+    else:
+        presentations = [(cgeom, False, " ")]
+    geoms = [geom for geom, _, _ in presentations]
+
+    # orderings that cannot beat the best RMSD found (bound) and cannot converge (floor) are skipped.
+    #   a pool made here gets the candidates and a bound in shared memory once, through its initializer
+    floor = 0.0 if run_to_completion else a_convergence
+    pool = None
+    if executor is None and nprocs is not None and nprocs > 1:
+        bound = multiprocessing.RawValue("d", np.inf)
+        executor = pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=nprocs,
+            initializer=_init_kabsch_worker,
+            initargs=(rgeom, geoms, classes, bound, floor),
+        )
+        fn, args = _pooled_kabsch_orderings, ()
+    else:
+        bound = _RMSDBound()
+        fn, args = _kabsch_orderings, (rgeom, geoms, classes, bound, floor)
+    nahead = 2 * (nprocs or os.cpu_count() or 1)
 
-    t0 = time.time()
+    # orderings are Kabsch-aligned in chunks that double in size, so an early
+    #   RMSD convergence wastes at most as many trials as it ran
     tc = 0.0
-    for ordering in _plausible_atom_orderings_wrapper(
-        runiq, cuniq, rgeom, cgeom, run_resorting, algorithm=algorithm, verbose=verbose, uno_cutoff=uno_cutoff
-    ):
+    converged = False
+    chunks = _evaluate_chunks(fn, args, _ordering_chunks(), executor=executor, nahead=nahead)
+    try:
         t1 = time.time()
-        ocount += 1
-        npordd = np.asarray(ordering)
-        _, RR, TT = kabsch_align(rgeom, cgeom[npordd, :], weight=None)
-
-        temp_solution = AlignmentMill(shift=TT, rotation=RR, atommap=npordd, mirror=False)
-        tgeom = temp_solution.align_coordinates(cgeom, reverse=False)
-        if verbose >= 4:
-            print("temp geom diff\n", tgeom - rgeom)
-        temp_rmsd = np.linalg.norm(tgeom - rgeom) * constants.bohr2angstroms / np.sqrt(rgeom.shape[0])
-        temp_rmsd = np.around(temp_rmsd, decimals=8)
-        t2 = time.time()
-        tc += t2 - t1
-
-        if temp_rmsd < best_rmsd:
-            best_rmsd = temp_rmsd
-            hold_solution = temp_solution
-            if verbose >= 1:
-                print("<<<  trial {:8}  {} yields RMSD {}  >>>".format(ocount, npordd, temp_rmsd))
-            if not run_to_completion and best_rmsd < a_convergence:
+        for (start, stop), rmsds in chunks:
+            tc += time.time() - t1
+            if rmsds.size == 0:
                 break
-        else:
-            if verbose >= 3:
-                print("     trial {:8}  {} yields RMSD {}".format(ocount, npordd, temp_rmsd))
 
-        if run_mirror and not superimposable:
+            # trials in order, each ordering followed by its mirror presentation, if any.
+            #   only those improving on all before them need a look, unless printing all
+            rmsds = np.around(rmsds, decimals=8).ravel()
+            improved = rmsds < np.minimum.accumulate(np.concatenate(([best_rmsd], rmsds)))[:-1]
+
+            for itrial in range(rmsds.size) if verbose >= 3 else np.flatnonzero(improved):
+                iord, ipres = divmod(int(itrial), len(presentations))
+                geom, mirror, tag = presentations[ipres]
+                npordd = _ordering_product(classes, start + iord, start + iord + 1)[0]
+                temp_rmsd = rmsds[itrial]
+                label = ocount + iord * len(presentations) + 1
+
+                if improved[itrial]:
+                    best_rmsd = temp_rmsd
+                    _, RRs, TTs = kabsch_align_batch(rgeom, geom[None, npordd, :])
+                    hold_solution = (RRs[0], TTs[0], npordd, mirror)
+                    if verbose >= 1:
+                        print("<<<  trial {:8}{} {} yields RMSD {}  >>>".format(label, tag, npordd, temp_rmsd))
+                    if not run_to_completion and best_rmsd < a_convergence:
+                        converged = True
+                        ocount += int(itrial) + 1
+                        break
+                else:
+                    print("     trial {:8}{} {} yields RMSD {}".format(label, tag, npordd, temp_rmsd))
+
+            if converged:
+                break
+            ocount += rmsds.size
+            bound.value = min(bound.value, best_rmsd)
             t1 = time.time()
-            ocount += 1
-            icgeom = np.copy(cgeom)
-            icgeom[:, 1] *= -1.0
-            _, RR, TT = kabsch_align(rgeom, icgeom[npordd, :], weight=None)
-
-            temp_solution = AlignmentMill(shift=TT, rotation=RR, atommap=npordd, mirror=True)
-            tgeom = temp_solution.align_coordinates(cgeom, reverse=False)
-            if verbose >= 4:
-                print("temp geom diff\n", tgeom - rgeom)
-            temp_rmsd = np.linalg.norm(tgeom - rgeom) * constants.bohr2angstroms / np.sqrt(rgeom.shape[0])
-            temp_rmsd = np.around(temp_rmsd, decimals=8)
-            t2 = time.time()
-            tc += t2 - t1
-
-            if temp_rmsd < best_rmsd:
-                best_rmsd = temp_rmsd
-                hold_solution = temp_solution
-                if verbose >= 1:
-                    print("<<<  trial {:8}m {} yields RMSD {}  >>>".format(ocount - 1, npordd, temp_rmsd))
-                if not run_to_completion and best_rmsd < a_convergence:
-                    break
-            else:
-                if verbose >= 3:
-                    print("     trial {:8}m {} yields RMSD {}".format(ocount - 1, npordd, temp_rmsd))
+    finally:
+        chunks.close()
+        if pool is not None:
+            pool.shutdown()
+
+    RR, TT, npordd, mirror = hold_solution
+    hold_solution = AlignmentMill(shift=TT, rotation=RR, atommap=npordd, mirror=mirror)
 
     t3 = time.time()
     if verbose >= 1:
@@ -293,7 +373,148 @@ def B787(
     return final_rmsd, hold_solution
 
 
-def _plausible_atom_orderings(ref, current, rgeom, cgeom, algorithm="hungarian_uno", verbose=1, uno_cutoff=1.0e-3):
+def B787_batch(
+    cgeom: np.ndarray,
+    rgeoms: List[np.ndarray],
+    cuniq: np.ndarray,
+    runiqs: List[np.ndarray],
+    *,
+    verbose: int = 0,
+    atoms_map: bool = False,
+    run_resorting: bool = False,
+    mols_align: Union[bool, float] = False,
+    algorithm: str = "hungarian_uno",
+    uno_cutoff: float = 1.0e-3,
+    run_mirror: bool = False,
+    exhaustive: bool = False,
+    executor: Optional[concurrent.futures.Executor] = None,
+    nprocs: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    r"""Aligns geometry `cgeom` onto each of several reference geometries as
+    :py:func:`B787` does, returning the references ranked by RMSD.
+
+    Invariants of `cgeom` (its headless NRE matrix and, with `run_mirror`,
+    whether it is superimposable upon its mirror image) are computed once for
+    all references. A cheap lower bound to the RMSD against each reference,
+    from the sorted distances of each class of atoms to the centroid, orders
+    the search and stops it once no remaining reference can beat the best RMSD
+    found, or, with `mols_align`, once a reference aligns within tolerance.
+
+    Parameters
+    ----------
+    cgeom
+        (nat, 3) array of concern/changeable geometry [a0].
+    rgeoms
+        (nat, 3) arrays of reference geometries [a0].
+    cuniq
+        (nat,) array of str indicating which rows (atoms) in `cgeom` are shuffleable.
+        See :py:func:`B787`.
+    runiqs
+        (nat,) arrays of str for each of `rgeoms`. References whose atom classes
+        differ from `cuniq` are not aligned.
+    verbose
+        Quantity of printing. 0 to silence.
+    atoms_map
+        Whether atom1 of every reference already corresponds to atom1 of `cgeom` and so on.
+    run_resorting
+        Run the resorting machinery even if unnecessary because `atoms_map=True`.
+    mols_align
+        If `True` or float, RMSD [A] below which a reference is taken as a match,
+        ending the search (`True` means 1.0e-3). Unlike for :py:func:`B787`, no
+        match is asserted.
+    algorithm
+        {'hungarian_uno', 'permutative'}
+        See :py:func:`B787`.
+    uno_cutoff
+        See :py:func:`B787`.
+    run_mirror
+        Also try mirror images of `cgeom`. See :py:func:`B787`.
+    exhaustive
+        Align every compatible reference rather than stopping early.
+    executor
+        Executor across whose workers the candidate atom orderings of each
+        reference are aligned. See :py:func:`B787`.
+    nprocs
+        Number of worker processes. If `executor` is not given and `nprocs` > 1, a
+        process pool of this size is created for each reference aligned, so that its
+        workers receive that reference's candidate orderings once. See :py:func:`B787`.
+
+    Returns
+    -------
+    list of dict
+        One entry per reference, with fields `index` into `rgeoms`, `rmsd` [A]
+        (None if not aligned), `mill` (the AlignmentMill from `cgeom` to the
+        aligned geometry, or None), and `lower_bound` [A] to the RMSD (inf if
+        the atom classes differ). Aligned references come first by increasing
+        RMSD, then the others by increasing lower bound.
+
+    """
+    if mols_align is True:
+        a_convergence = 1.0e-3
+    elif mols_align is False:
+        a_convergence = 0.0
+    else:
+        a_convergence = mols_align
+
+    cgeom = np.asarray(cgeom)
+    csorted = sorted(cuniq)
+    table = []
+    for iref, (rgeom, runiq) in enumerate(zip(rgeoms, runiqs)):
+        rgeom = np.asarray(rgeom)
+        if rgeom.shape == cgeom.shape and sorted(runiq) == csorted:
+            lower_bound = 0.0 if atoms_map else _rmsd_lower_bound(rgeom, cgeom, runiq, cuniq)
+        else:
+            lower_bound = np.inf
+        table.append({"index": iref, "rmsd": None, "mill": None, "lower_bound": lower_bound})
+
+    cnremat = _inverse_distance_matrix(cgeom) if algorithm == "hungarian_uno" else None
+    superimposable = _mirror_superimposable(cgeom, cuniq, verbose=verbose) if run_mirror else None
+
+    best_rmsd = np.inf
+    for row in sorted(table, key=lambda row: row["lower_bound"]):
+        if row["lower_bound"] == np.inf:
+            break
+        if not exhaustive and (best_rmsd < a_convergence or row["lower_bound"] > best_rmsd + 1.0e-6):
+            break
+
+        rgeom = np.asarray(rgeoms[row["index"]])
+        row["rmsd"], row["mill"] = B787(
+            cgeom,
+            rgeom,
+            cuniq,
+            runiqs[row["index"]],
+            verbose=max(0, verbose - 1),
+            atoms_map=atoms_map,
+            run_resorting=run_resorting,
+            mols_align=a_convergence,
+            algorithm=algorithm,
+            uno_cutoff=uno_cutoff,
+            run_mirror=run_mirror,
+            cnremat=cnremat,
+            rnremat=_inverse_distance_matrix(rgeom) if algorithm == "hungarian_uno" else None,
+            mirror_superimposable=superimposable,
+            executor=executor,
+            nprocs=nprocs,
+        )
+        best_rmsd = min(best_rmsd, row["rmsd"])
+        if verbose >= 1:
+            print(f"Reference {row['index']:6}: RMSD {row['rmsd']:.8f} [A] (bound {row['lower_bound']:.8f})")
+
+    return sorted(table, key=lambda row: (0, row["rmsd"]) if row["rmsd"] is not None else (1, row["lower_bound"]))
+
+
+def _plausible_atom_ordering_classes(
+    ref,
+    current,
+    rgeom,
+    cgeom,
+    algorithm="hungarian_uno",
+    verbose=1,
+    uno_cutoff=1.0e-3,
+    cnremat=None,
+    rnremat=None,
+    lazy=False,
+):
     r"""
 
     Parameters
@@ -304,10 +525,18 @@ def _plausible_atom_orderings(ref, current, rgeom, cgeom, algorithm="hungarian_u
     current : list
         Hashes encoding distinguishable non-coord characteristics of trial
         molecule. Namely, atomic symbol, mass, basis sets?.
+    cnremat, rnremat : np.ndarray, optional
+        Headless NRE matrices of `cgeom` and `rgeom` from :py:func:`_inverse_distance_matrix`,
+        computed here if not given.
+    lazy : bool, optional
+        Draw the candidates of the first class only as needed, see :py:class:`_CandidateStream`.
 
     Returns
     -------
-    iterator of tuples
+    list of tuples
+        For each atom class, (nclass,) array of its atom indices in `ref` and
+        (ncandidates, nclass) array of candidate atom indices in `current` for them.
+        Classes are ordered largest first.
 
     """
     if sorted(ref) != sorted(current):
@@ -382,12 +611,10 @@ def _plausible_atom_orderings(ref, current, rgeom, cgeom, algorithm="hungarian_u
         if verbose >= 1:
             print("Hungarian time [s] for space:         {:.3}".format(t01 - t00))
 
-        # find _all_ best matches btwn R & C atoms through Uno algorithm, seeded from Hungarian sol'n
+        # find _all_ best matches btwn R & C atoms through Uno algorithm, seeded from Hungarian sol'n.
+        #   matches are generated only as candidates are drawn
         edges = np.argwhere(reducedcost < uno_cutoff)
         gooduns = uno(edges, ptsCR)
-        t02 = time.time()
-        if verbose >= 1:
-            print("Uno time [s] for space:               {:.3}".format(t02 - t01))
 
         for gu in gooduns:
             gu2 = gu[:]
@@ -405,30 +632,152 @@ def _plausible_atom_orderings(ref, current, rgeom, cgeom, algorithm="hungarian_u
         algofn = filter_permutative
 
     if algorithm == "hungarian_uno":
-        ccdistmat = distance_matrix(cgeom, cgeom)
-        rrdistmat = distance_matrix(rgeom, rgeom)
-        with np.errstate(divide="ignore"):
-            ccnremat = np.reciprocal(ccdistmat)
-            rrnremat = np.reciprocal(rrdistmat)
-        ccnremat[ccnremat == np.inf] = 0.0
-        rrnremat[rrnremat == np.inf] = 0.0
+        ccnremat = _inverse_distance_matrix(cgeom) if cnremat is None else cnremat
+        rrnremat = _inverse_distance_matrix(rgeom) if rnremat is None else rnremat
         algofn = filter_hungarian_uno
 
-        # Ensure (optional dependency) networkx exists
-        if not which_import("networkx", return_bool=True):
-            raise ModuleNotFoundError(
-                """Python module networkx not found. Solve by installing it: `conda install networkx` or `pip install networkx`"""
-            )  # pragma: no cover
-
     # collect candidate atom orderings from algofn for each of the atom classes,
-    #   recombine the classes with each other in every permutation (could maybe
-    #   add Hungarian here, too) as generator back to permutation_kabsch
-    for cpmut in itertools.product(*itertools.starmap(algofn, connect.items())):
-        atpat = [None] * len(ref)
-        for igp, group in enumerate(cpmut):
-            for iidx, idx in enumerate(list(connect.keys())[igp]):
-                atpat[idx] = group[iidx]
-        yield atpat
+    #   to be recombined with each other in every permutation. the largest class
+    #   leads the product, so its candidates can be drawn as the search reaches them
+    classes = []
+    for rgp, cgp in sorted(connect.items(), key=lambda gp: -len(gp[0])):
+        if lazy and not classes:
+            candidates = _CandidateStream(algofn(rgp, cgp), len(rgp))
+        else:
+            candidates = np.array(list(algofn(rgp, cgp)), dtype=int).reshape(-1, len(rgp))
+        classes.append((np.array(rgp), candidates))
+    return classes
+
+
+class _CandidateStream:
+    """Candidate atom orderings of a class, drawn from `generator` only as far as needed."""
+
+    def __init__(self, generator, natom):
+        self.generator = generator
+        self.rows = []
+        self.array = np.zeros((0, natom), dtype=int)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, idx):
+        return self.array[idx]
+
+    def fill(self, count):
+        """Draws candidates until `count` are held or none remain. Returns the number held."""
+
+        if count > len(self.rows):
+            self.rows.extend(itertools.islice(self.generator, count - len(self.rows)))
+            self.array = np.array(self.rows, dtype=int).reshape(len(self.rows), self.array.shape[1])
+        return len(self.rows)
+
+
+def _ordering_chunks():
+    """Ranges (start, stop) of orderings in chunks doubling from 8 to 1024."""
+
+    start, size = 0, 8
+    while True:
+        yield start, start + size
+        start, size = start + size, min(2 * size, 1024)
+
+
+def _ordering_product(classes, start, stop):
+    """(k, nat) array of orderings `start` to `stop` of the product, in
+    :py:func:`itertools.product` order, over the candidates of each of `classes`,
+    k falling short of `stop - start` where the product ends."""
+
+    nat = sum(len(ridx) for ridx, _ in classes)
+    idx = np.arange(start, stop)
+
+    inner = 1
+    for _, candidates in classes[1:]:
+        inner *= len(candidates)
+    lead = classes[0][1]
+    if isinstance(lead, _CandidateStream):
+        available = lead.fill(-(-stop // inner) if inner else 0)
+    else:
+        available = len(lead)
+    idx = idx[idx < available * inner]
+
+    orderings = np.empty((len(idx), nat), dtype=int)
+    for ridx, candidates in reversed(classes):
+        idx, digit = np.divmod(idx, max(len(candidates), 1))
+        orderings[:, ridx] = candidates[digit]
+    return orderings
+
+
+class _RMSDBound:
+    """Best RMSD [A] found so far, shared by B787 with the evaluations of its chunks of orderings."""
+
+    def __init__(self, value=np.inf):
+        self.value = value
+
+
+def _kabsch_orderings(rgeom, geoms, classes, bound, floor, start, stop):
+    """(k, len(geoms)) array of RMSDs [A] of Kabsch-aligning orderings
+    `start` to `stop` of each of `geoms` onto `rgeom`, lowering `bound.value` to the best.
+
+    Orderings whose RMSD is provably above both `bound.value` and `floor` [A] can neither
+    improve on the best found nor converge, so are not aligned and get RMSD inf. The proof is
+    a lower bound from each atom's distance to the centroid, which rotations preserve.
+
+    """
+    orderings = _ordering_product(classes, start, stop)
+    rdist = np.linalg.norm(rgeom - rgeom.mean(axis=0), axis=1)
+
+    rmsds = np.full((len(orderings), len(geoms)), np.inf)
+    for igeom, geom in enumerate(geoms):
+        cdist = np.linalg.norm(geom - geom.mean(axis=0), axis=1)
+        lower = np.sqrt(np.mean((cdist[orderings] - rdist) ** 2, axis=1)) * constants.bohr2angstroms
+        keep = np.flatnonzero(lower <= max(bound.value, floor) + 1.0e-6)
+        if keep.size:
+            rmsds[keep, igeom] = kabsch_align_batch(rgeom, geom[orderings[keep], :])[0]
+
+    if rmsds.size:
+        bound.value = min(bound.value, rmsds.min())
+    return rmsds
+
+
+# arguments of _kabsch_orderings in workers of the process pool B787 makes
+_worker_args = None
+
+
+def _init_kabsch_worker(*args):
+    """Keeps the arguments of :py:func:`_kabsch_orderings` in a pool worker, so the candidate
+    orderings are sent once per worker rather than with every chunk."""
+
+    global _worker_args
+    _worker_args = args
+
+
+def _pooled_kabsch_orderings(start, stop):
+    """:py:func:`_kabsch_orderings` with the arguments kept by :py:func:`_init_kabsch_worker`."""
+
+    return _kabsch_orderings(*_worker_args, start, stop)
+
+
+def _evaluate_chunks(fn, args, chunks, executor=None, nahead=1):
+    """Yields `(start, stop), fn(*args, start, stop)` for each of `chunks` in order. With
+    `executor`, keeps up to `nahead` chunks in flight and cancels those pending when closed."""
+
+    if executor is None:
+        for start, stop in chunks:
+            yield (start, stop), fn(*args, start, stop)
+        return
+
+    pending = collections.deque()
+    try:
+        for start, stop in chunks:
+            pending.append(((start, stop), executor.submit(fn, *args, start, stop)))
+            if len(pending) >= nahead:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
 
 
 def kabsch_align(rgeom: np.ndarray, cgeom: np.ndarray, weight: Optional[np.ndarray] = None):
@@ -501,6 +850,63 @@ def kabsch_align(rgeom: np.ndarray, cgeom: np.ndarray, weight: Optional[np.ndarr
     return rmsd, RR, TT
 
 
+def kabsch_align_batch(rgeom: np.ndarray, cgeoms: np.ndarray):
+    r"""Finds optimal translations and rotations to align each of a stack of
+    geometries `cgeoms` onto `rgeom` via Kabsch algorithm. Equivalent to
+    :py:func:`kabsch_align` without weights on each geometry in turn, but
+    the SVDs run as one call over the (k, 3, 3) stack of covariance matrices.
+
+    Parameters
+    ----------
+    rgeom
+        (nat, 3) array of reference/target/unchanged geometry. Assumed [a0]
+        for RMSD purposes.
+    cgeoms
+        (k, nat, 3) array of concern/changeable geometries, such as the
+        concern geometry under k atom orderings. Assumed [a0] for RMSD
+        purposes. Each must have same Natom, units, and 1-to-1 atom
+        ordering as rgeom.
+
+    Returns
+    -------
+    ~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray
+        First item is (k,) RMSDs [A] between `rgeom` and the optimally aligned
+        geometries computed.
+        Second item is (k, 3, 3) rotation matrices to optimal alignment.
+        Third item is (k, 3) translation vectors [a0] to optimal alignment.
+
+    """
+    rgeom = np.asarray(rgeom, dtype=float)
+    cgeoms = np.asarray(cgeoms, dtype=float)
+    N = rgeom.shape[0]
+
+    Rcentroid = rgeom.sum(axis=0) / N
+    Ccentroids = cgeoms.sum(axis=1) / N
+    R = rgeom - Rcentroid
+    C = cgeoms - Ccentroids[:, None, :]
+
+    # rotation RR minimizing || R - C RR || in row convention, with the sign of
+    #   the last singular vector flipped where needed to exclude reflections
+    U, _, Vt = np.linalg.svd(np.einsum("kai,aj->kij", C, R))
+    d = np.sign(np.linalg.det(U @ Vt))
+    d[d == 0.0] = 1.0
+    U[:, :, 2] *= d[:, None]
+    RR = U @ Vt
+
+    # can hit a mixed non-identity translation/rotation, so head off
+    same = np.all(np.abs(rgeom - cgeoms) <= 1.0e-8 + 1.0e-5 * np.abs(cgeoms), axis=(1, 2))
+    RR[same] = np.identity(3)
+
+    TT = Ccentroids - np.einsum("kij,j->ki", RR, Rcentroid)
+    TT[same] = 0.0
+
+    # residual of the transformation as AlignmentMill.align_coordinates applies it
+    resid = (cgeoms - TT[:, None, :]) @ RR - rgeom
+    rmsd = np.linalg.norm(resid, axis=(1, 2)) * constants.bohr2angstroms / np.sqrt(N)
+
+    return rmsd, RR, TT
+
+
 def kabsch_quaternion(P, Q):
     """Computes the optimal rotation matrix U which mapping a set of points P
     onto the set of points Q according to the minimization of || Q - U * P ||,
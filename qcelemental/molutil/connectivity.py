@@ -4,12 +4,18 @@ import numpy as np
 
 from ..covalent_radii import covalentradii
 from ..exceptions import NotAnElementError
+from ..util.neighbors import cell_list_pairs
 
 __all__ = ["guess_connectivity"]
 
 
 def guess_connectivity(
-    symbols: np.ndarray, geometry: np.ndarray, threshold: float = 1.2, default_connectivity: Optional[float] = None
+    symbols: np.ndarray,
+    geometry: np.ndarray,
+    threshold: float = 1.2,
+    default_connectivity: Optional[float] = None,
+    *,
+    method: str = "cells",
 ) -> List[Union[Tuple[int, int], Tuple[int, int, float]]]:
     r"""
     Finds connected atoms based off of a covalent radii metric.
@@ -24,6 +30,11 @@ def guess_connectivity(
         Tunes the covalent radii metric safety factor.
     default_connectivity
         Provides a default connectivity value
+    method
+        Neighbor search algorithm. ``"cells"`` (default) bins atoms into a cubic grid with edge equal to the
+        largest possible bond cutoff so only atoms in adjacent cells are compared, which scales linearly with
+        the number of atoms. ``"pairwise"`` compares every pair of atoms and is kept as a reference.
+        Both give identical results.
 
     Returns
     -------
@@ -33,14 +44,31 @@ def guess_connectivity(
     """
 
     geometry = np.asarray(geometry, dtype=float).reshape(-1, 3)
-    radii = []
-    for s in symbols:
+
+    uniq, inverse = np.unique(np.asarray(symbols, dtype=str), return_inverse=True)
+    uniq_radii = []
+    for s in uniq:
         try:
-            radii.append(covalentradii.get(s, missing=1.8))
+            uniq_radii.append(covalentradii.get(s, missing=1.8))
         except NotAnElementError:
-            radii.append(1.8)
+            uniq_radii.append(1.8)
+    radii = np.array(uniq_radii, dtype=float)[inverse.reshape(-1)]
+
+    if method == "cells":
+        con = _connectivity_cells(geometry, radii, threshold)
+    elif method == "pairwise":
+        con = _connectivity_pairwise(geometry, radii, threshold)
+    else:
+        raise ValueError(f"Connectivity method '{method}' not understood, valid options: 'cells', 'pairwise'.")
+
+    if default_connectivity:
+        con = [(x[0], x[1], default_connectivity) for x in con]
 
-    radii = np.array(radii)
+    return con
+
+
+def _connectivity_pairwise(geometry: np.ndarray, radii: np.ndarray, threshold: float) -> List[Tuple[int, int]]:
+    """Bonded pairs (i < j) by comparing each atom against every later atom. O(N^2)."""
 
     # Upper triangular
     con = []
@@ -54,9 +82,32 @@ def guess_connectivity(
         where += x + 1
 
         for atom2 in where:
-            con.append((x, atom2))
-
-    if default_connectivity:
-        con = [(x[0], x[1], default_connectivity) for x in con]
+            con.append((x, int(atom2)))
 
     return con
+
+
+def _connectivity_cells(geometry: np.ndarray, radii: np.ndarray, threshold: float) -> List[Tuple[int, int]]:
+    """Bonded pairs (i < j) found with a cell list whose edge is the largest possible cutoff. O(N)."""
+
+    edge = 2.0 * (radii.max() if len(radii) else 0.0) * threshold
+    if not edge > 0.0:
+        return []
+
+    pairs_i, pairs_j = [], []
+    for iat, jat in cell_list_pairs(geometry, edge):
+        diffs = geometry[iat] - geometry[jat]
+        dists = np.einsum("ij,ij->i", diffs, diffs)
+        np.sqrt(dists, out=dists)
+
+        bonded = dists < (radii[iat] + radii[jat]) * threshold
+        pairs_i.append(iat[bonded])
+        pairs_j.append(jat[bonded])
+
+    if not pairs_i:
+        return []
+    iat = np.concatenate(pairs_i)
+    jat = np.concatenate(pairs_j)
+    srt = np.lexsort((jat, iat))
+
+    return list(zip(iat[srt].tolist(), jat[srt].tolist()))
@@ -12,7 +12,7 @@ import pytest
 import qcelemental as qcel
 from qcelemental.testing import compare, compare_molrecs, compare_recursive, compare_values
 
-from ..tests.addons import drop_qcsk, using_networkx
+from ..tests.addons import drop_qcsk
 
 pp = pprint.PrettyPrinter(width=120)
 
@@ -40,7 +40,6 @@ H    -0.8103758    2.3643033   -2.0618643
 """
 
 
-@using_networkx
 def test_scramble_descrambles_plain():
     s22_12 = qcel.models.Molecule.from_data(ss22_12)
 
@@ -87,7 +86,6 @@ Cl    -0.845465     1.497406    -0.341118
 )
 
 
-@using_networkx
 def test_scramble_descrambles_chiral():
     chiral.scramble(
         do_shift=True, do_rotate=True, do_resort=True, do_plot=False, verbose=0, do_mirror=False, do_test=True
@@ -140,7 +138,6 @@ units ang
 ref_rmsd = math.sqrt(2.0 * 0.2 * 0.2 / 3.0)  # RMSD always in Angstroms
 
 
-@using_networkx
 def test_error_bins_b787():
     oco10 = qcel.models.Molecule.from_data(soco10)
     oco12 = qcel.models.Molecule.from_data(s18ooc12)
@@ -151,7 +148,6 @@ def test_error_bins_b787():
     assert "atom subclasses unequal" in str(e.value)
 
 
-@using_networkx
 def test_error_nat_b787():
     oco10 = qcel.models.Molecule.from_data(soco10)
     oco12 = qcel.models.Molecule.from_data(sooco12)
@@ -176,7 +172,6 @@ def test_mill_rot_error():
     assert "Rotation must be castable to shape" in str(e.value)
 
 
-@using_networkx
 def test_b787():
     oco10 = qcel.molparse.from_string(soco10)
     oco12 = qcel.molparse.from_string(sooc12)
@@ -197,7 +192,6 @@ def test_b787():
     assert compare_values(ref_rmsd, rmsd, "known rmsd B787", atol=1.0e-6)
 
 
-@using_networkx
 def test_b787_atomsmap():
     oco10 = qcel.molparse.from_string(soco10)
     oco12 = qcel.molparse.from_string(soco12)
@@ -210,7 +204,6 @@ def test_b787_atomsmap():
     assert compare_values(ref_rmsd, rmsd, "known rmsd B787", atol=1.0e-6)
 
 
-@using_networkx
 def test_model_b787():
     oco10 = qcel.models.Molecule.from_data(soco10)
     oco12 = qcel.models.Molecule.from_data(sooc12)
@@ -227,7 +220,6 @@ def test_error_kabsch():
     assert "for kwarg 'weight'" in str(e.value)
 
 
-@using_networkx
 def test_kabsch_identity():
     oco10 = qcel.molparse.from_string(soco10)
     oco12 = qcel.molparse.from_string(soco10)
@@ -285,7 +277,6 @@ trop_gs_c2v = qcel.models.Molecule.from_data(
 )
 
 
-@using_networkx
 def test_tropolone_b787():
     mol, data = trop_cs.align(trop_gs_c2v, do_plot=False, verbose=0, uno_cutoff=0.5)
     assert compare_values(0.1413, data["rmsd"], "cs<-->c2v tropolones align", atol=1.0e-2)
@@ -486,7 +477,6 @@ Rotation:
     assert compare_values(c4_hooh_hess, p2chess, atol=1.0e-4)
 
 
-@using_networkx
 def test_vector_gradient_align():
     # fmt: off
 
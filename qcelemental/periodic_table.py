@@ -4,9 +4,12 @@ Periodic table class
 
 import collections
 from decimal import Decimal
-from typing import Union
+from typing import Iterable, Union
+
+import numpy as np
 
 from .exceptions import NotAnElementError
+from .lazy import LazySingleton
 
 
 class PeriodicTable:
@@ -65,6 +68,15 @@ class PeriodicTable:
         for EE, m, A in zip(self._EE, self.mass, self.A):
             self._el2a2mass[EE][A] = float(m)
 
+        # Lookup tables for the bulk `to_*_array` functions, indexed by position in `EA`
+        self._eliso2idx = {eliso: idx for idx, eliso in enumerate(self.EA)}
+        self._z2idx = np.array([self._eliso2idx[self._z2el[z]] for z in range(max(self.Z) + 1)])
+        self._idx2mass = np.array([float(m) for m in self.mass])
+        self._idx2a = np.array(self.A, dtype=int)
+        self._idx2z = np.array([self._el2z[EE] for EE in self._EE], dtype=int)
+        self._idx2el = np.array(self._EE)
+        self._idx_is_el = np.isin(np.array(self.EA), self.E)
+
     def _resolve_atom_to_key(self, atom: Union[int, str], strict: bool = False) -> str:
         """Given `atom` as element name, element symbol, nuclide symbol, atomic number, or atomic number string,
         return valid `self._eliso2mass` key, regardless of case. Raises `NotAnElementError` if unidentifiable.
@@ -97,6 +109,32 @@ class PeriodicTable:
 
         return eliso
 
+    def _resolve_atoms_to_indices(self, atoms: Iterable[Union[int, str]], strict: bool = False) -> np.ndarray:
+        """Given array-like `atoms` of identifiers accepted by :py:func:`_resolve_atom_to_key`, return the
+        array of positions in `self.EA` for use with the lookup tables. Each distinct identifier is resolved
+        once, and integer arrays are resolved as atomic numbers by table lookup alone.
+
+        """
+        atoms = np.asarray(atoms)
+
+        if np.issubdtype(atoms.dtype, np.integer):
+            if atoms.size and (atoms.min() < 0 or atoms.max() >= len(self._z2idx)):
+                bad = atoms[(atoms < 0) | (atoms >= len(self._z2idx))]
+                raise NotAnElementError(bad.flat[0], strict=strict)
+            return self._z2idx[atoms]
+
+        uniq, inverse = np.unique(atoms, return_inverse=True)
+        uniq_idx = np.empty(len(uniq), dtype=int)
+        for iu, atom in enumerate(uniq.tolist()):
+            idx = self._eliso2idx.get(atom)
+            if idx is None:
+                idx = self._eliso2idx[self._resolve_atom_to_key(atom)]
+            if strict and not self._idx_is_el[idx]:
+                raise NotAnElementError(self.EA[idx], strict=strict)
+            uniq_idx[iu] = idx
+
+        return uniq_idx[inverse.reshape(atoms.shape)]
+
     def to_mass(self, atom: Union[int, str], *, return_decimal: bool = False) -> Union[float, "Decimal"]:
         r"""Get atomic mass of `atom`.
 
@@ -244,6 +282,104 @@ class PeriodicTable:
     to_symbol = to_E
     to_name = to_element
 
+    def to_mass_array(self, atoms: Iterable[Union[int, str]]) -> np.ndarray:
+        r"""Get atomic masses of all `atoms` at once. Array counterpart of :py:func:`to_mass`.
+
+        Parameters
+        ----------
+        atoms
+            Array-like of identifiers for elements or nuclides, e.g., `H`, `D`, `H2`, `He`, `hE4`.
+            Integer arrays are interpreted as atomic numbers.
+
+        Returns
+        -------
+        np.ndarray
+            Atomic masses [u] as float, of the same shape as `atoms`.
+
+        Raises
+        ------
+        NotAnElementError
+            If any of `atoms` cannot be resolved into an element or nuclide.
+
+        """
+        return self._idx2mass[self._resolve_atoms_to_indices(atoms)]
+
+    def to_A_array(self, atoms: Iterable[Union[int, str]]) -> np.ndarray:
+        r"""Get mass numbers of all `atoms` at once. Array counterpart of :py:func:`to_A`.
+
+        Parameters
+        ----------
+        atoms
+            Array-like of identifiers for elements or nuclides, e.g., `H`, `D`, `H2`, `He`, `hE4`.
+            Integer arrays are interpreted as atomic numbers.
+
+        Returns
+        -------
+        np.ndarray
+            Mass numbers as int, of the same shape as `atoms`.
+
+        Raises
+        ------
+        NotAnElementError
+            If any of `atoms` cannot be resolved into an element or nuclide.
+
+        """
+        return self._idx2a[self._resolve_atoms_to_indices(atoms)]
+
+    def to_Z_array(self, atoms: Iterable[Union[int, str]], strict: bool = False) -> np.ndarray:
+        r"""Get atomic numbers of all `atoms` at once. Array counterpart of :py:func:`to_Z`.
+
+        Parameters
+        ----------
+        atoms
+            Array-like of identifiers for elements or nuclides, e.g., `H`, `D`, `H2`, `He`, `hE4`.
+            Integer arrays are interpreted as atomic numbers.
+        strict
+            Allow only element identification in `atoms`, not nuclide.
+
+        Returns
+        -------
+        np.ndarray
+            Atomic numbers as int, of the same shape as `atoms`.
+
+        Raises
+        ------
+        NotAnElementError
+            If any of `atoms` cannot be resolved into an element or nuclide.
+            If `strict=True` and any of `atoms` resolves into nuclide, not element.
+
+        """
+        return self._idx2z[self._resolve_atoms_to_indices(atoms, strict=strict)]
+
+    def to_E_array(self, atoms: Iterable[Union[int, str]], strict: bool = False) -> np.ndarray:
+        r"""Get element symbols of all `atoms` at once. Array counterpart of :py:func:`to_E`.
+
+        Parameters
+        ----------
+        atoms
+            Array-like of identifiers for elements or nuclides, e.g., `H`, `D`, `H2`, `He`, `hE4`.
+            Integer arrays are interpreted as atomic numbers.
+        strict
+            Allow only element identification in `atoms`, not nuclide.
+
+        Returns
+        -------
+        np.ndarray
+            Element symbols as str, capitalized, of the same shape as `atoms`.
+
+        Raises
+        ------
+        NotAnElementError
+            If any of `atoms` cannot be resolved into an element or nuclide.
+            If `strict=True` and any of `atoms` resolves into nuclide, not element.
+
+        """
+        return self._idx2el[self._resolve_atoms_to_indices(atoms, strict=strict)]
+
+    to_mass_number_array = to_A_array
+    to_atomic_number_array = to_Z_array
+    to_symbol_array = to_E_array
+
     def to_period(self, atom: Union[int, str]) -> int:
         r"""Get period (horizontal row in periodic table) of `atom`.
 
@@ -500,4 +636,4 @@ def write_c_header(filename: str = "masses.h") -> None:
 # el2z["GH"] = 0
 
 # singleton
-periodictable = PeriodicTable()
+periodictable = LazySingleton(PeriodicTable)
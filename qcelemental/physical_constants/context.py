@@ -8,6 +8,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Union
 
 from ..datum import Datum, print_variables
+from ..lazy import LazySingleton
 from .ureg import build_units_registry
 
 if TYPE_CHECKING:
@@ -531,4 +532,4 @@ def write_fortran_header(context, filename="physconst.fh", prefix="pc_", kind=No
 
 
 # singleton
-constants = PhysicalConstantsContext("CODATA2014")
+constants = LazySingleton(PhysicalConstantsContext, "CODATA2014")
@@ -24,6 +24,21 @@ using_msgpack = pytest.mark.skipif(
     reason="Not detecting module msgpack. Install package if necessary and add to envvar PYTHONPATH",
 )
 
+using_orjson = pytest.mark.skipif(
+    which_import("orjson", return_bool=True) is False,
+    reason="Not detecting module orjson. Install package if necessary and add to envvar PYTHONPATH",
+)
+
+using_zstd = pytest.mark.skipif(
+    not (which_import("compression.zstd", return_bool=True) or which_import("zstandard", return_bool=True)),
+    reason="Not detecting module zstandard. Install package if necessary and add to envvar PYTHONPATH",
+)
+
+using_lz4 = pytest.mark.skipif(
+    which_import("lz4", return_bool=True) is False,
+    reason="Not detecting module lz4. Install package if necessary and add to envvar PYTHONPATH",
+)
+
 using_networkx = pytest.mark.skipif(
     which_import("networkx", return_bool=True) is False,
     reason="Not detecting module networkx. Install package if necessary and add to envvar PYTHONPATH",
@@ -44,6 +59,13 @@ serialize_extensions = [
     "json-ext",
     pytest.param("msgpack", marks=using_msgpack),
     pytest.param("msgpack-ext", marks=using_msgpack),
+    "npz-ext",
+    "json+gzip",
+    "json-ext+xz",
+    pytest.param("msgpack+bz2", marks=using_msgpack),
+    pytest.param("msgpack-ext+gzip", marks=using_msgpack),
+    pytest.param("msgpack-ext+zstd", marks=[using_msgpack, using_zstd]),
+    pytest.param("msgpack-ext+lz4", marks=[using_msgpack, using_lz4]),
 ]
 
 
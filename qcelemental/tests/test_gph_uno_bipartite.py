@@ -2,6 +2,9 @@
 # * split off from gph_uno_bipartite.py file for test suite. see that file for attributions.
 # * AmbiguousSolution errors seem to have cropped up, though not in the alignment usage.
 
+import itertools
+
+import numpy as np
 import pytest
 
 from qcelemental.util.gph_uno_bipartite import _enumMaximumMatching, _enumMaximumMatching2, uno
@@ -9,7 +12,6 @@ from qcelemental.util.gph_uno_bipartite import _enumMaximumMatching, _enumMaximu
 from .addons import using_networkx, using_scipy
 
 
-@using_networkx
 def test_example4(alg=1):
     # fmt: off
     edges = [(0, 0),
@@ -75,7 +77,6 @@ def test_example4(alg=1):
     _check("Example 4b (provided match)", ans, ref, verbose=2)
 
 
-@using_networkx
 def test_example3(alg=1):
     # fmt: off
     match = [(1, 2), (3, 4), (5, 6), (7, 8)]
@@ -214,6 +215,61 @@ def test_example2(alg):
     print("Example 2 passed")
 
 
+def _brute_maximum_matchings(edges):
+    edges = sorted(set(map(tuple, edges)))
+    for size in range(min(len({e[0] for e in edges}), len({e[1] for e in edges})), 0, -1):
+        found = [
+            sorted(sub)
+            for sub in itertools.combinations(edges, size)
+            if len({e[0] for e in sub}) == size and len({e[1] for e in sub}) == size
+        ]
+        if found:
+            return found
+    return []
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_uno_random(seed):
+    rng = np.random.default_rng(seed)
+    nl, nr = rng.integers(2, 7, size=2)
+    edges = np.argwhere(rng.random((nl, nr)) < 0.5).tolist()
+
+    ans = list(uno(edges))
+    assert len(ans) == len({tuple(m) for m in ans})
+    _check(f"random {seed}", ans, _brute_maximum_matchings(edges))
+
+
+@using_networkx
+@pytest.mark.parametrize("seed", range(4))
+def test_uno_random_networkx(seed):
+    import networkx as nx
+
+    rng = np.random.default_rng(seed)
+    edges = np.argwhere(rng.random((6, 6)) < 0.6).tolist()
+    g = nx.Graph()
+    for l, r in edges:
+        g.add_node((0, l), bipartite=0)
+        g.add_node((1, r), bipartite=1)
+        g.add_edge((0, l), (1, r))
+    top = [n for n in g if n[0] == 0]
+    match = [(l[1], r[1]) for l, r in nx.bipartite.maximum_matching(g, top_nodes=top).items() if l[0] == 0]
+
+    ref = [sorted((min(e)[1], max(e)[1]) for e in mm) for mm in _enumMaximumMatching(g)]
+
+    ans = list(uno(edges, match=match))
+    assert ans[0] == sorted(match)
+    _check(f"networkx {seed}", ans, ref)
+
+
+def test_uno_lazy():
+    # 12! perfect matchings of complete K12,12 are drawn only as far as asked
+    edges = [(l, r) for l in range(12) for r in range(12)]
+    first = list(itertools.islice(uno(edges, match=[(i, i) for i in range(12)]), 3))
+    assert first[0] == [(i, i) for i in range(12)]
+    assert len({tuple(m) for m in first}) == 3
+    assert all(sorted(r for _, r in m) == list(range(12)) for m in first)
+
+
 # Apparently, an AmbiguousSolution
 # def test_example1(alg=1):
 #    g=nx.Graph()
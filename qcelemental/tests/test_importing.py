@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -165,3 +166,77 @@ def test_parse_version():
 def test_safe_version(inp, out):
     v = qcel.util.safe_version(inp)
     assert v == out
+
+
+def test_import_is_lazy():
+    # a fresh interpreter, since this one has long since touched the singletons
+    script = """
+import sys, time
+t0 = time.perf_counter()
+import qcelemental
+elapsed = time.perf_counter() - t0
+singletons = [qcelemental.periodictable, qcelemental.constants, qcelemental.covalentradii, qcelemental.vdwradii]
+print(elapsed)
+print(sorted(m for m in sys.modules if m.startswith(("qcelemental.data.", "qcelemental.info"))))
+print([type(s).__name__ for s in singletons])
+"""
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.splitlines()
+    print(f"import qcelemental: {float(out[0]):.3f} s")
+
+    assert out[1] == "[]"
+    assert out[2] == "['LazySingleton', 'LazySingleton', 'LazySingleton', 'LazySingleton']"
+
+
+def test_lazy_singleton():
+    from qcelemental.lazy import LazySingleton
+    from qcelemental.vanderwaals_radii import VanderWaalsRadii
+
+    lazy = LazySingleton(VanderWaalsRadii, "MANTINA2009")
+    alias = lazy
+    assert not isinstance(lazy, VanderWaalsRadii)
+
+    assert str(lazy) == "VanderWaalsRadii(context='MANTINA2009')"
+    assert isinstance(alias, VanderWaalsRadii)
+    assert alias.get("C") == qcel.vdwradii.get("C")
+
+
+def test_lazy_singleton_error():
+    from qcelemental.covalent_radii import CovalentRadii
+    from qcelemental.lazy import LazySingleton
+
+    lazy = LazySingleton(CovalentRadii, "ALVAREZ2099")
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            lazy.get("C")
+    assert type(lazy) is LazySingleton
+
+
+def test_lazy_singleton_threads():
+    import threading
+    import time
+
+    from qcelemental.lazy import LazySingleton
+
+    class Slow:
+        def __init__(self):
+            self.first = 1
+            time.sleep(0.05)
+            self.second = 2
+
+        def total(self):
+            return self.first + self.second
+
+    lazy = LazySingleton(Slow)
+    results = []
+
+    def read():
+        results.append((lazy.first, lazy.second, lazy.total()))
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    assert results == [(1, 2, 3)] * 8
+    assert type(lazy) is Slow
@@ -1,10 +1,14 @@
+import mmap
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
 
 import qcelemental as qcel
-from qcelemental.models import basis
+from qcelemental.models import basemodels, basis
+from qcelemental.testing import compare_recursive
 
-from .addons import drop_qcsk
+from .addons import drop_qcsk, serialize_extensions, using_msgpack
 
 center_data = {
     "bs_sto3g_h": {
@@ -271,6 +275,49 @@ def test_wavefunction_build(wavefunction_data_fixture, request):
     assert ret
 
 
+@using_msgpack
+def test_wavefunction_stream(wavefunction_data_fixture, tmp_path):
+    ret = qcel.models.AtomicResult(**wavefunction_data_fixture)
+
+    with open(tmp_path / "wfn.msgpack", "wb") as handle:
+        ret.serialize_to(handle)
+    assert (tmp_path / "wfn.msgpack").read_bytes() == ret.serialize("msgpack-ext")
+
+    with open(tmp_path / "wfn.msgpack", "rb") as handle:
+        ret2 = qcel.models.AtomicResult.parse_stream(handle)
+    assert ret2.compare(ret)
+    assert ret2.wavefunction.scf_orbitals_a.flags.writeable
+
+
+def test_wavefunction_lazy(wavefunction_data_fixture, tmp_path):
+    ret = qcel.models.AtomicResult(**wavefunction_data_fixture)
+    (tmp_path / "wfn.npz").write_bytes(ret.serialize("npz-ext"))
+
+    ret2 = qcel.models.AtomicResult.parse_file(tmp_path / "wfn.npz", lazy=True)
+    assert ret2.compare(ret)
+    base = ret2.wavefunction.scf_orbitals_a
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, mmap.mmap)
+
+    with pytest.raises(TypeError) as e:
+        qcel.models.AtomicResult.parse_file(tmp_path / "wfn.npz", encoding="msgpack-ext", lazy=True)
+    assert "requires the 'npz-ext' encoding" in str(e.value)
+
+
+@using_msgpack
+def test_wavefunction_compressed(wavefunction_data_fixture, tmp_path):
+    ret = qcel.models.AtomicResult(**wavefunction_data_fixture)
+
+    # encoding detected from the magic bytes
+    blob = ret.serialize("msgpack-ext+gzip")
+    assert blob.startswith(b"\x1f\x8b")
+    assert qcel.models.AtomicResult.parse_raw(blob).compare(ret)
+
+    (tmp_path / "wfn.json.xz").write_bytes(ret.serialize("json+xz"))
+    assert qcel.models.AtomicResult.parse_file(tmp_path / "wfn.json.xz").compare(ret)
+
+
 def test_wavefunction_matrix_size_error(wavefunction_data_fixture):
     wavefunction_data_fixture["wavefunction"]["scf_orbitals_a"] = np.random.rand(2, 2)
     with pytest.raises(ValueError) as e:
@@ -397,6 +444,145 @@ def test_optimization_trajectory_protocol(keep, indices, optimization_data_fixtu
         assert result.return_result == index
 
 
+@pytest.mark.parametrize("encoding", serialize_extensions)
+def test_wavefunction_trusted(wavefunction_data_fixture, encoding):
+    wavefunction_data_fixture["driver"] = "gradient"
+    wavefunction_data_fixture["return_result"] = np.random.rand(9)
+    wavefunction_data_fixture["properties"] = {"calcinfo_natom": 3, "scf_dipole_moment": [0.1, 0.2, 0.3]}
+    ret = qcel.models.AtomicResult(**wavefunction_data_fixture)
+    blob = ret.serialize(encoding)
+
+    ret2 = qcel.models.AtomicResult.parse_raw(blob, encoding=encoding, trusted=True)
+    assert ret2.compare(ret)
+    assert ret2.serialize("json") == ret.serialize("json")
+    assert ret2.__fields_set__ == qcel.models.AtomicResult.parse_raw(blob, encoding=encoding).__fields_set__
+
+    # nested models are built, enums and arrays are cast and reshaped
+    assert isinstance(ret2.molecule, qcel.models.Molecule)
+    assert isinstance(ret2.wavefunction.basis, basis.BasisSet)
+    assert ret2.driver is qcel.models.DriverEnum.gradient
+    assert ret2.return_result.shape == (3, 3)
+    assert ret2.molecule.geometry.shape == (3, 3)
+    assert ret2.properties.scf_dipole_moment.shape == (3,)
+    assert ret2.wavefunction.scf_orbitals_a.shape == (ret.wavefunction.basis.nbf,) * 2
+
+
+def test_optimization_trusted(optimization_data_fixture):
+    opt = qcel.models.OptimizationResult(**optimization_data_fixture)
+
+    opt2 = qcel.models.OptimizationResult.parse_raw(opt.serialize("json"), trusted=True)
+    assert opt2.compare(opt)
+    assert all(isinstance(result, qcel.models.AtomicResult) for result in opt2.trajectory)
+
+    # array casts still check their input
+    data = opt.dict()
+    data["final_molecule"]["geometry"] = [0.0, 1.0]
+    with pytest.raises(ValueError):
+        qcel.models.OptimizationResult.parse_obj(data, trusted=True)
+
+
+def test_trusted_extra_keys(optimization_data_fixture):
+    opt = qcel.models.OptimizationResult(**optimization_data_fixture)
+
+    # forbidden extras are rejected as in normal parsing
+    data = opt.dict()
+    data["final_molecule"]["spam"] = 1
+    for trusted in [False, True]:
+        with pytest.raises(ValueError, match="extra fields not permitted"):
+            qcel.models.OptimizationResult.parse_obj(data, trusted=trusted)
+
+    # allowed extras are kept as in normal parsing
+    data = {**opt.provenance.dict(), "spam": 1}
+    for trusted in [False, True]:
+        prov = qcel.models.Provenance.parse_obj(data, trusted=trusted)
+        assert prov.dict()["spam"] == 1
+        assert "spam" in prov.__fields_set__
+
+
+@pytest.mark.parametrize("encoding", serialize_extensions)
+def test_optimization_dedup_molecules(optimization_data_fixture, encoding):
+    moved = optimization_data_fixture["initial_molecule"].copy(update={"geometry": np.ones((3, 3))})
+    optimization_data_fixture["trajectory"][1]["molecule"] = moved
+    opt = qcel.models.OptimizationResult(**optimization_data_fixture)
+
+    blob = opt.serialize(encoding, dedup_molecules=True)
+    if "+" not in encoding:
+        assert len(blob) < len(opt.serialize(encoding))
+
+    data = qcel.util.deserialize(blob, encoding)
+    assert len(data["molecule_topologies"]) == 1
+    assert set(data["trajectory"][1]["molecule"]) == {"topology", "geometry"}
+
+    for trusted in [False, True]:
+        opt2 = qcel.models.OptimizationResult.parse_raw(blob, encoding=encoding, trusted=trusted)
+        assert opt2.compare(opt)
+        assert opt2.trajectory[1].molecule == moved
+
+
+def test_torsiondrive_dedup_molecules(optimization_data_fixture):
+    opt = qcel.models.OptimizationResult(**optimization_data_fixture)
+    molecule = opt.initial_molecule
+    td = qcel.models.procedures.TorsionDriveResult(
+        keywords={"dihedrals": [(0, 1, 2, 0)], "grid_spacing": [90]},
+        input_specification={"model": {"method": "UFF"}},
+        initial_molecule=[molecule],
+        optimization_spec={"procedure": "geometric"},
+        final_energies={"0": 0.0, "90": 1.0},
+        final_molecules={"0": molecule, "90": molecule},
+        optimization_history={"0": [opt], "90": [opt, opt]},
+        success=True,
+        provenance={"creator": "qcel"},
+    )
+
+    blob = td.serialize("json", dedup_molecules=True)
+    assert len(qcel.util.deserialize(blob, "json")["molecule_topologies"]) == 1
+
+    td2 = qcel.models.procedures.TorsionDriveResult.parse_raw(blob)
+    assert td2.compare(td)
+
+
+@using_msgpack
+def test_optimization_trajectory_stream(optimization_data_fixture, tmp_path):
+    opt = qcel.models.OptimizationResult(**optimization_data_fixture)
+    input_data = {k: optimization_data_fixture[k] for k in ["initial_molecule", "input_specification"]}
+    path = tmp_path / "opt.traj"
+
+    with open(path, "wb") as handle:
+        writer = qcel.models.OptimizationTrajectoryWriter(handle, input_data)
+        for result, energy in zip(opt.trajectory[:3], opt.energies):
+            writer.append(result, energy)
+
+    with open(path, "rb") as tail:
+        reader = qcel.models.OptimizationTrajectoryReader(tail)
+        assert len(reader.trajectory) == 3
+        partial = reader.result()
+        assert partial.energies == opt.energies[:3]
+        assert partial.final_molecule == opt.trajectory[2].molecule
+        assert not partial.success and not reader.complete
+
+        # continue after a restart, leaving the last record half written
+        with open(path, "ab") as handle:
+            writer = qcel.models.OptimizationTrajectoryWriter(handle)
+            writer.append(opt.trajectory[3], opt.energies[3])
+            writer.update(final_molecule=opt.final_molecule, success=True, provenance=opt.provenance)
+            blob = opt.trajectory[4].serialize("msgpack-ext")
+            handle.write(blob[:100])
+
+        assert reader.read() == 1
+        assert reader.complete
+
+        with open(path, "ab") as handle:
+            handle.truncate(handle.tell() - 100)
+            qcel.models.OptimizationTrajectoryWriter(handle).append(opt.trajectory[4], opt.energies[4])
+
+        assert reader.read() == 1
+
+    assert reader.result().compare(opt)
+
+    with pytest.raises(ValueError):
+        writer.append(opt.trajectory[0])
+
+
 @pytest.mark.parametrize(
     "default, defined, default_result, defined_result",
     [(None, None, True, None), (False, {"a": True}, False, {"a": True})],
@@ -529,6 +715,37 @@ def test_model_dictable(result_data_fixture, optimization_data_fixture, smodel):
     assert model(**instance.dict())
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"exclude": {"provenance", "stdout"}},
+        {"exclude_unset": True},
+        {"exclude_unset": False},
+        {"exclude_none": True},
+        {"by_alias": True},
+        {"encoding": "json"},
+    ],
+)
+def test_model_dict_compiled(wavefunction_data_fixture, optimization_data_fixture, monkeypatch, kwargs):
+    helium = qcel.models.Molecule(symbols=["He"], geometry=[0, 0, 0])
+    wavefunction_data_fixture["extras"] = {"nested": {"list": [1, (2, 3)]}, "mol": helium}
+    optimization_data_fixture["trajectory"].append(wavefunction_data_fixture)
+    opt = qcel.models.OptimizationResult(**optimization_data_fixture)
+    computed = opt.dict(**kwargs)
+
+    # pydantic's generic traversal throughout
+    monkeypatch.setattr(basemodels, "_get_serializer", lambda cls: SimpleNamespace(supported=False))
+    expected = opt.dict(**kwargs)
+
+    assert compare_recursive(expected, computed)
+    assert list(computed) == list(expected)
+    assert list(computed["trajectory"][-1]) == list(expected["trajectory"][-1])
+    assert list(computed["trajectory"][-1]["molecule"]) == list(expected["trajectory"][-1]["molecule"])
+    assert computed["trajectory"][-1]["extras"] == expected["trajectory"][-1]["extras"]
+    assert computed["energies"] is not opt.energies
+
+
 def test_result_model_deprecations(result_data_fixture, optimization_data_fixture):
     with pytest.warns(DeprecationWarning):
         qcel.models.ResultProperties(scf_one_electron_energy="-5.0")
@@ -9,7 +9,7 @@ import pytest
 import qcelemental as qcel
 from qcelemental.exceptions import NotAnElementError
 from qcelemental.models import Molecule
-from qcelemental.testing import compare, compare_values
+from qcelemental.testing import compare, compare_recursive, compare_values
 
 from .addons import serialize_extensions, using_msgpack, using_nglview
 
@@ -105,6 +105,189 @@ def test_hash_canary():
     assert frag_1.get_hash() == "bdc1f75bd1b7b999ff24783d7c1673452b91beb9"  # pragma: allowlist secret
 
 
+def test_hash_binary():
+    assert water_dimer_minima.get_hash(2) == "dfeac33ff8bc4317cde357c5ed4885575733421e"  # pragma: allowlist secret
+    assert water_dimer_minima.get_hash(1) == water_dimer_minima.get_hash()
+    assert water_dimer_minima.get_hash(2) != water_dimer_minima.get_hash(1)
+
+    # same identity decisions as the text hash
+    assert Molecule(**water_dimer_minima.dict()).get_hash(2) == water_dimer_minima.get_hash(2)
+    assert water_dimer_minima.scramble(do_resort=False)[0].get_hash(2) != water_dimer_minima.get_hash(2)
+
+    ghost = water_dimer_minima.get_fragment(0, 1)
+    assert ghost.get_hash(2) != water_dimer_minima.get_fragment([0, 1]).get_hash(2)
+
+    with pytest.raises(ValueError) as e:
+        water_dimer_minima.get_hash(3)
+    assert "hash version 3 not understood" in str(e.value)
+
+
+@pytest.mark.parametrize("hash_version", [1, 2])
+def test_get_hashes(hash_version):
+    mols = [water_dimer_minima, water_molecule, water_dimer_minima.orient_molecule(), water_molecule.scramble()[0]]
+
+    ref = [mol.get_hash(hash_version) for mol in mols]
+    assert Molecule.get_hashes(mols, hash_version=hash_version) == ref
+    assert Molecule.get_hashes(iter(mols), hash_version) == ref
+
+
+def test_get_hashes_topology_groups(monkeypatch):
+    from qcelemental.models import molecule
+
+    waters = [Molecule(**{**water_molecule.dict(), "geometry": water_molecule.geometry + shift}) for shift in range(3)]
+    cation = Molecule(**{**water_molecule.dict(), "molecular_charge": 1, "molecular_multiplicity": 2})
+    heavy = Molecule(**{**water_molecule.dict(), "masses": [15.99491462, 2.01410178, 2.01410178]})
+    mols = waters + [cation, heavy, waters[0]]
+    ref = [mol.get_hash(2) for mol in mols]
+    assert len(set(ref)) == 5
+
+    calls = []
+    binary_hashes = molecule._binary_hashes
+    monkeypatch.setattr(
+        molecule,
+        "_binary_hashes",
+        lambda mol, geoms, *args: calls.append(len(geoms)) or binary_hashes(mol, geoms, *args),
+    )
+    assert Molecule.get_hashes(mols) == ref
+    assert sorted(calls) == [1, 1, 4]
+
+
+def test_derived_property_cache():
+    mol = Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 3])
+
+    assert mol.masses is mol.masses
+    assert mol.get_hash() is mol.get_hash()
+    assert mol.get_molecular_formula() == "He2"
+    with pytest.raises(ValueError):
+        mol.masses[0] = 1.0
+
+    # cache never serialized
+    assert "_cache" not in mol.dict()
+    assert "_cache" not in mol.json()
+
+    # cache not carried into updated copies
+    mol2 = mol.copy(update={"geometry": np.array([[0, 0, 0], [0, 0, 4.0]])})
+    assert mol2.get_hash() != mol.get_hash()
+    assert mol2.get_hash() == Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 4]).get_hash()
+
+    # stored fields are not frozen
+    mol3 = Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 3], masses=[3.0, 4.0])
+    assert mol3.masses.flags.writeable
+
+    # each caller gets its own list of fragments, so mutating it leaves later lookups intact
+    frags = mol.fragments
+    frags.append(np.array([5]))
+    assert len(mol.fragments) == 1
+    with pytest.raises(ValueError):
+        mol.fragments[0][0] = 1
+
+
+def test_from_arrays_fast():
+    ref = water_dimer_minima
+    mol = Molecule.from_arrays_fast(
+        ref.symbols,
+        ref.geometry.ravel(),
+        atomic_numbers=ref.atomic_numbers,
+        masses=ref.masses,
+        fragments=ref.fragments,
+        fragment_charges=ref.fragment_charges,
+        fragment_multiplicities=ref.fragment_multiplicities,
+        name=ref.name,
+        fix_com=ref.fix_com,
+        fix_orientation=ref.fix_orientation,
+    )
+
+    assert mol.validated
+    assert mol.get_hash() == ref.get_hash()
+    assert mol == ref
+    assert compare_recursive(ref.dict(exclude={"provenance"}), mol.dict(exclude={"provenance"}))
+    assert mol.provenance.routine == "qcelemental.models.molecule"
+    assert Molecule(**mol.dict()) == mol
+
+
+def test_from_arrays_fast_defaults():
+    ref = Molecule(symbols=["he", "Ne"], geometry=[0, 0, 0, 0, 0, 3], real=[True, False])
+    mol = Molecule.from_arrays_fast(["he", "Ne"], [[0, 0, 0], [0, 0, 3]], real=[True, False])
+
+    assert compare_recursive(ref.dict(exclude={"provenance"}), mol.dict(exclude={"provenance"}))
+    assert mol.get_hash() == ref.get_hash()
+
+    mol = Molecule.from_arrays_fast(["He", "He"], [0, 0, 0, 0, 0, 3], masses=[3.01602932, 4.00260325413])
+    assert mol.masses[0] == 3.01602932
+    assert mol.mass_numbers.tolist() == [3, 4]
+
+    mol = Molecule.from_arrays_fast(["He", "He"], [0, 0, 0, 0, 0, 3], masses=[3.1, 4.00260325413])
+    assert mol.mass_numbers.tolist() == [-1, 4]
+
+
+@pytest.mark.parametrize(
+    "masses",
+    [
+        [2.01410177812, 1.00782503223, 3.0160293201, 4.00260325413],
+        [2.0, 1.00782503223, 3.0160293201, 4.00260325413],
+    ],
+)
+def test_from_arrays_fast_isotopes_fragments(masses):
+    kwargs = {
+        "symbols": ["H", "H", "He", "He"],
+        "geometry": [0, 0, 0, 0, 0, 1.4, 0, 0, 5, 0, 0, 9],
+        "masses": masses,
+        "fragments": [[0, 1], [2], [3]],
+        "fragment_charges": [0, 0, 0],
+        "fragment_multiplicities": [1, 1, 1],
+    }
+    ref = Molecule(**kwargs)
+    mol = Molecule.from_arrays_fast(**kwargs)
+
+    assert compare_recursive(ref.dict(exclude={"provenance"}), mol.dict(exclude={"provenance"}))
+    assert mol.get_hash() == ref.get_hash()
+
+
+def test_from_arrays_fast_passthrough():
+    kwargs = {"connectivity": [(2, 1, 2), (1, 0, 1)], "atom_labels": ["a", "b", "c"], "comment": "chain"}
+    ref = Molecule(symbols=["He"] * 3, geometry=[0, 0, 0, 0, 0, 3, 0, 0, 6], **kwargs)
+    mol = Molecule.from_arrays_fast(["He"] * 3, [0, 0, 0, 0, 0, 3, 0, 0, 6], **kwargs)
+
+    assert "connectivity" not in mol.__dict__ and "atom_labels" not in mol.__dict__
+    assert {"connectivity_", "atom_labels_", "comment"} <= mol.__fields_set__
+    assert mol.__dict__["connectivity_"] == ref.__dict__["connectivity_"]
+    assert mol.__dict__["atom_labels_"].dtype == ref.__dict__["atom_labels_"].dtype
+    assert compare_recursive(ref.dict(exclude={"provenance"}), mol.dict(exclude={"provenance"}))
+    assert mol.get_hash() == ref.get_hash()
+
+    mol = Molecule.from_arrays_fast(["He"] * 3, [0, 0, 0, 0, 0, 3, 0, 0, 6], connectivity_=[(0, 1, 1)])
+    assert mol.connectivity == [(0, 1, 1.0)]
+
+
+@pytest.mark.parametrize(
+    "kwargs,error",
+    [
+        ({"geometry": [0, 0, 0, 1]}, "Geometry must be castable to shape"),
+        ({"atomic_numbers": [2, 2]}, "Atomic numbers do not match symbols"),
+        ({"symbols": ["He", "Xx"]}, "Symbols not all elements"),
+        ({"masses": [4.0]}, "Masses must be same number of entries"),
+        ({"fragments": [[0], [0]], "fragment_charges": [0, 0], "fragment_multiplicities": [1, 1]}, "exactly once"),
+        ({"fragments": [[0], [1]]}, "Fragment charges and multiplicities are required"),
+        ({"fragments": [[0], [1]], "fragment_charges": [0, 1], "fragment_multiplicities": [1, 1]}, "Inconsistent"),
+        ({"molecular_charge": 1}, "Inconsistent or unspecified chg/mult"),
+        ({"molecular_multiplicity": 0.5}, "Multiplicity must be positive"),
+        ({"spam": 1}, "Unknown Molecule fields"),
+        ({"fragments": [[1, 0]]}, "Fragments must be contiguous"),
+        ({"fragments": [[1], [0]], "fragment_charges": [0, 0], "fragment_multiplicities": [1, 1]}, "contiguous"),
+        ({"fragments_": [[0, 1]]}, "must be passed as argument fragments"),
+        ({"atom_labels": ["a"]}, "Atom labels must be same number of entries"),
+        ({"connectivity": [(0, 2, 1)]}, "Connectivity indices must be atoms"),
+    ],
+)
+def test_from_arrays_fast_errors(kwargs, error):
+    kwargs = {"symbols": ["He", "Ne"], "geometry": [0, 0, 0, 0, 0, 3], **kwargs}
+
+    with pytest.raises(qcel.ValidationError) as e:
+        Molecule.from_arrays_fast(**kwargs)
+
+    assert error in str(e.value)
+
+
 def test_molecule_np_constructors():
     """
     Neon tetramer fun
@@ -251,7 +434,13 @@ def test_to_string():
 
 @pytest.mark.parametrize(
     "dtype, filext",
-    [("json", "json"), ("xyz", "xyz"), ("numpy", "npy"), pytest.param("msgpack", "msgpack", marks=using_msgpack)],
+    [
+        ("json", "json"),
+        ("xyz", "xyz"),
+        ("numpy", "npy"),
+        pytest.param("msgpack", "msgpack", marks=using_msgpack),
+        ("npz-ext", "npz"),
+    ],
 )
 def test_to_from_file_simple(tmp_path, dtype, filext):
     benchmol = Molecule.from_data(
@@ -280,7 +469,13 @@ def test_to_from_file_complex(tmp_path, dtype):
 
 
 @pytest.mark.parametrize(
-    "dtype, filext", [("json", "json"), ("xyz+", "xyz"), pytest.param("msgpack", "msgpack", marks=using_msgpack)]
+    "dtype, filext",
+    [
+        ("json", "json"),
+        ("xyz+", "xyz"),
+        pytest.param("msgpack", "msgpack", marks=using_msgpack),
+        ("npz-ext", "npz"),
+    ],
 )
 def test_to_from_file_charge_spin(tmp_path, dtype, filext):
     benchmol = Molecule.from_data(
@@ -677,6 +872,12 @@ def test_nuclearrepulsionenergy_nelectrons():
     assert compare_values(4.275210518, mol.nuclear_repulsion_energy(ifr=0), "M1", atol=1.0e-5)
     assert compare_values(16.04859029, mol.nuclear_repulsion_energy(ifr=1), "M2", atol=1.0e-5)
 
+    nrem = mol.nuclear_repulsion_energy_matrix()
+    assert compare_values(4.275210518, nrem[0, 0], "M1 matrix", atol=1.0e-5)
+    assert compare_values(16.04859029, nrem[1, 1], "M2 matrix", atol=1.0e-5)
+    assert compare_values(34.60370459 - 4.275210518 - 16.04859029, nrem[0, 1], "IE matrix", atol=1.0e-5)
+    assert compare_values(nrem[0, 1], nrem[1, 0], "IE matrix symm", atol=1.0e-12)
+
     assert compare(20, mol.nelectrons(), "D")
     assert compare(10, mol.nelectrons(ifr=0), "M1")
     assert compare(10, mol.nelectrons(ifr=1), "M2")
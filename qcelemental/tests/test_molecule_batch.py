@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+import qcelemental as qcel
+from qcelemental.models import Molecule, MoleculeBatch
+
+from .addons import serialize_extensions, using_msgpack
+
+water_dimer = Molecule.from_data(
+    """
+    0 1
+    O  -1.551007  -0.114520   0.000000
+    H  -1.934259   0.762503   0.000000
+    H  -0.599677   0.040712   0.000000
+    --
+    O   1.350625   0.111469   0.000000
+    H   1.680398  -0.373741  -0.758561
+    H   1.680398  -0.373741   0.758561
+    """,
+    dtype="psi4",
+)
+
+
+@pytest.fixture(scope="module")
+def conformers():
+    np.random.seed(12)
+    return [water_dimer] + [water_dimer.scramble(do_resort=False, do_shift=True)[0] for _ in range(4)]
+
+
+@pytest.fixture(scope="module")
+def batch(conformers):
+    return MoleculeBatch.from_molecules(conformers)
+
+
+def test_batch_views(batch, conformers):
+    assert len(batch) == 5
+    assert batch.geometries.shape == (5, 6, 3)
+    assert repr(batch) == "MoleculeBatch(formula='H4O2', nconf=5)"
+
+    for mol, ref in zip(batch.molecules(), conformers):
+        assert isinstance(mol, Molecule)
+        assert mol == ref
+        assert np.shares_memory(mol.geometry, batch.geometries)
+
+
+@pytest.mark.parametrize("hash_version", [1, 2])
+def test_batch_hash(batch, conformers, hash_version):
+    assert batch.get_hash(hash_version) == [mol.get_hash(hash_version) for mol in conformers]
+
+
+@pytest.mark.parametrize("args", [{}, {"ifr": 1}, {"real_only": False}])
+def test_batch_nuclear_repulsion_energy(batch, conformers, args):
+    ref = [mol.nuclear_repulsion_energy(**args) for mol in conformers]
+    assert np.allclose(ref, batch.nuclear_repulsion_energy(**args))
+    for chunk in [1, 5, 30]:
+        assert np.allclose(ref, batch.nuclear_repulsion_energy(**args, chunk=chunk))
+
+
+def test_batch_orient(batch, conformers):
+    oriented = batch.orient()
+    assert oriented.get_hash(1) == [mol.orient_molecule().get_hash() for mol in conformers]
+
+
+def test_batch_measure(batch, conformers):
+    measurements = [[0, 1], [0, 1, 2], [5, 3, 0, 1]]
+    ref = [mol.measure(measurements) for mol in conformers]
+    assert np.allclose(ref, batch.measure(measurements))
+
+    assert np.allclose(
+        [mol.measure([1, 0, 2], degrees=False) for mol in conformers], batch.measure([1, 0, 2], degrees=False)
+    )
+
+    with pytest.raises(ValueError):
+        batch.measure([0, 6])
+
+
+@pytest.mark.parametrize("encoding", serialize_extensions)
+def test_batch_serialization(batch, encoding):
+    blob = batch.serialize(encoding)
+    batch2 = MoleculeBatch.parse_raw(blob, encoding=encoding)
+
+    assert batch2.geometries.shape == batch.geometries.shape
+    assert batch2.get_hash() == batch.get_hash()
+
+
+@using_msgpack
+def test_batch_msgpackext_zero_copy(batch):
+    obj = qcel.util.deserialize(batch.serialize("msgpack-ext"), "msgpack-ext")
+    batch2 = MoleculeBatch(**obj)
+
+    # validation keeps the decoded buffer
+    assert np.shares_memory(batch2.geometries, obj["geometries"])
+
+
+def test_batch_mismatched_topology():
+    other = water_dimer.get_fragment(0, 1)
+    other = Molecule(**{**other.dict(), "geometry": water_dimer.geometry})
+
+    with pytest.raises(ValueError) as e:
+        MoleculeBatch.from_molecules([water_dimer, other])
+
+    assert "differs from Molecule 0" in str(e.value)
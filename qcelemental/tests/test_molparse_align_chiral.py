@@ -3,8 +3,6 @@
 import qcelemental as qcel
 from qcelemental.testing import compare, compare_values
 
-from .addons import using_networkx
-
 do_plot = False
 verbose = 4
 run_mirror = True
@@ -33,7 +31,6 @@ Cl    -0.845116    -1.497706    -0.341045
 )
 
 
-@using_networkx()
 def test_simpleS():
     mol, data = simpleS.align(simpleR, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror)
     assert compare_values(1.093e-4, data["rmsd"], "bromochlorofluoromethane R, S", atol=1.0e-4)
@@ -121,7 +118,6 @@ Br     2.010793     1.836814     1.833496
 )
 
 
-@using_networkx()
 def test_clbrbutSS():
     mol, data = clbrbutSS.align(
         clbrbutRR, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror
@@ -130,7 +126,6 @@ def test_clbrbutSS():
     assert compare(True, data["mill"].mirror, "2-chloro-3-bromobutane RR, SS enantiomers")
 
 
-@using_networkx()
 def test_clbrbutSR_vs_RR():
     mol, data = clbrbutSR.align(
         clbrbutRR, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror
@@ -138,7 +133,6 @@ def test_clbrbutSR_vs_RR():
     assert compare_values(1.095, data["rmsd"], "2-chloro-3-bromobutane RR, SR", atol=1.0)
 
 
-@using_networkx()
 def test_clbrbutRS():
     mol, data = clbrbutRS.align(
         clbrbutRR, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror
@@ -146,7 +140,6 @@ def test_clbrbutRS():
     assert compare_values(1.092, data["rmsd"], "2-chloro-3-bromobutane RR, RS", atol=1.0)
 
 
-@using_networkx()
 def test_clbrbutSR_vs_RS():
     mol, data = clbrbutSR.align(
         clbrbutRS, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror
@@ -236,7 +229,6 @@ Br     2.011720    -1.821637     1.845756
 )
 
 
-@using_networkx()
 def test_dibromobutRS_RR():
     mol, data = dibromobutRS.align(
         dibromobutRR, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror
@@ -244,7 +236,6 @@ def test_dibromobutRS_RR():
     assert compare_values(1.562, data["rmsd"], "2,3-dibromobutane RR, RS", atol=1.0e-1)
 
 
-@using_networkx()
 def test_dibromobutSS_RR():
     mol, data = dibromobutSS.align(
         dibromobutRR, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror
@@ -253,7 +244,6 @@ def test_dibromobutSS_RR():
     assert compare(True, data["mill"].mirror, "2,3-dibromobutane RR, SS enantiomers")
 
 
-@using_networkx()
 def test_dibromobutRS_SS():
     mol, data = dibromobutRS.align(
         dibromobutSS, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=run_mirror
@@ -261,7 +251,6 @@ def test_dibromobutRS_SS():
     assert compare_values(1.560, data["rmsd"], "2,3-dibromobutane SS, RS", atol=1.0e-1)
 
 
-@using_networkx()
 def test_dibromobutRS_SR_nomirror():
     # Table satisfied by non-mirror identical, but 787 finds even better match
     mol, data = dibromobutRS.align(
@@ -271,7 +260,6 @@ def test_dibromobutRS_SR_nomirror():
     assert compare(False, data["mill"].mirror, "2,3-dibromobutane SR, RS identical (force non-mirror)")
 
 
-@using_networkx()
 def test_dibromobutRS_SR():
     mol, data = dibromobutRS.align(
         dibromobutSR, do_plot=do_plot, verbose=verbose, uno_cutoff=uno_cutoff, run_mirror=True
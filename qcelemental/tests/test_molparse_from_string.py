@@ -1495,6 +1495,7 @@ def test_tooclose_error():
         qcelemental.molparse.from_string(subject)
 
     assert "too close" in str(e.value)
+    assert "[(0, 1, 0.05" in str(e.value)
 
 
 def test_cartbeforezmat_error():
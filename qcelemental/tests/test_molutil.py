@@ -1,3 +1,5 @@
+import concurrent.futures
+import itertools
 import math
 import pprint
 
@@ -12,7 +14,7 @@ import pytest
 import qcelemental as qcel
 from qcelemental.testing import compare, compare_molrecs, compare_recursive, compare_values
 
-from .addons import drop_qcsk, using_networkx
+from .addons import drop_qcsk
 
 pp = pprint.PrettyPrinter(width=120)
 
@@ -40,7 +42,6 @@ H    -0.8103758    2.3643033   -2.0618643
 """
 
 
-@using_networkx
 def test_scramble_descrambles_plain():
     s22_12 = qcel.models.Molecule.from_data(ss22_12)
 
@@ -87,7 +88,6 @@ Cl    -0.845465     1.497406    -0.341118
 )
 
 
-@using_networkx
 def test_scramble_descrambles_chiral():
     chiral.scramble(
         do_shift=True, do_rotate=True, do_resort=True, do_plot=False, verbose=0, do_mirror=False, do_test=True
@@ -140,7 +140,6 @@ units ang
 ref_rmsd = math.sqrt(2.0 * 0.2 * 0.2 / 3.0)  # RMSD always in Angstroms
 
 
-@using_networkx
 def test_error_bins_b787():
     oco10 = qcel.models.Molecule.from_data(soco10)
     oco12 = qcel.models.Molecule.from_data(s18ooc12)
@@ -151,7 +150,6 @@ def test_error_bins_b787():
     assert "atom subclasses unequal" in str(e.value)
 
 
-@using_networkx
 def test_error_nat_b787():
     oco10 = qcel.models.Molecule.from_data(soco10)
     oco12 = qcel.models.Molecule.from_data(sooco12)
@@ -176,7 +174,6 @@ def test_mill_rot_error():
     assert "Rotation must be castable to shape" in str(e.value)
 
 
-@using_networkx
 def test_b787():
     oco10 = qcel.molparse.from_string(soco10)
     oco12 = qcel.molparse.from_string(sooc12)
@@ -197,7 +194,6 @@ def test_b787():
     assert compare_values(ref_rmsd, rmsd, "known rmsd B787", atol=1.0e-6)
 
 
-@using_networkx
 def test_b787_atomsmap():
     oco10 = qcel.molparse.from_string(soco10)
     oco12 = qcel.molparse.from_string(soco12)
@@ -210,7 +206,6 @@ def test_b787_atomsmap():
     assert compare_values(ref_rmsd, rmsd, "known rmsd B787", atol=1.0e-6)
 
 
-@using_networkx
 def test_model_b787():
     oco10 = qcel.models.Molecule.from_data(soco10)
     oco12 = qcel.models.Molecule.from_data(sooc12)
@@ -220,6 +215,42 @@ def test_model_b787():
     assert compare_values(ref_rmsd, data["rmsd"], "known rmsd qcel.models.Molecule.align", atol=1.0e-6)
 
 
+def test_model_align_many():
+    s22_12 = qcel.models.Molecule.from_data(ss22_12)
+    oco10 = qcel.models.Molecule.from_data(soco10)
+    distorted = [
+        s22_12.copy(update={"geometry": s22_12.geometry + np.random.default_rng(seed).normal(0, 0.05 * seed, (20, 3))})
+        for seed in range(1, 4)
+    ]
+    cmol, _ = s22_12.scramble(do_shift=True, do_rotate=True, do_resort=True, do_test=False)
+    library = [distorted[2], oco10, distorted[0], distorted[1]]
+
+    amol, table = cmol.align_many(library, exhaustive=True)
+    table_exhaustive = table
+    assert [row["index"] for row in table] == [2, 3, 0, 1]
+    assert table[-1]["rmsd"] is None and table[-1]["lower_bound"] == np.inf
+    for row in table[:3]:
+        _, data = cmol.align(library[row["index"]])
+        assert compare_values(data["rmsd"], row["rmsd"], atol=1.0e-6)
+        assert row["lower_bound"] <= row["rmsd"]
+    assert compare_values(library[2].geometry, amol.geometry, atol=0.5)
+
+    # the runners-up cannot beat the best, so are not aligned
+    _, table = cmol.align_many(library)
+    assert table[0]["index"] == 2
+    assert sum(row["rmsd"] is not None for row in table) < 3
+
+    amol, table = cmol.align_many([s22_12, oco10], mols_align=True)
+    assert table[0]["rmsd"] < 1.0e-3
+    assert compare_values(s22_12.geometry, amol.geometry, atol=1.0e-4)
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        _, ptable = cmol.align_many(library, exhaustive=True, executor=executor)
+    assert [row["index"] for row in ptable] == [2, 3, 0, 1]
+    for row, prow in zip(table_exhaustive, ptable):
+        assert row["rmsd"] == prow["rmsd"]
+
+
 def test_error_kabsch():
     with pytest.raises(qcel.ValidationError) as e:
         qcel.molutil.kabsch_align([1, 2, 3], [4, 5, 6], weight=7)
@@ -227,7 +258,6 @@ def test_error_kabsch():
     assert "for kwarg 'weight'" in str(e.value)
 
 
-@using_networkx
 def test_kabsch_identity():
     oco10 = qcel.molparse.from_string(soco10)
     oco12 = qcel.molparse.from_string(soco10)
@@ -242,6 +272,121 @@ def test_kabsch_identity():
     assert compare_values(np.zeros(3), shift, "identical COM")
 
 
+def test_kabsch_batch():
+    rng = np.random.default_rng(7)
+    rgeom = rng.normal(size=(9, 3))
+    cgeoms = np.stack(
+        [rgeom[rng.permutation(9)] @ qcel.util.random_rotation_matrix() + rng.normal(size=3) for _ in range(5)]
+        + [rgeom @ qcel.util.random_rotation_matrix(), rgeom]
+    )
+
+    rmsds, rots, shifts = qcel.molutil.kabsch_align_batch(rgeom, cgeoms)
+
+    assert rmsds.shape == (7,) and rots.shape == (7, 3, 3) and shifts.shape == (7, 3)
+    for cgeom, rmsd, rot, shift in zip(cgeoms, rmsds, rots, shifts):
+        ermsd, erot, eshift = qcel.molutil.kabsch_align(rgeom, cgeom)
+        assert compare_values(ermsd, rmsd, atol=1.0e-8)
+        assert compare_values(erot, rot, atol=1.0e-8)
+        assert compare_values(eshift, shift, atol=1.0e-8)
+    assert compare_values(np.zeros(2), rmsds[-2:], atol=1.0e-8)
+    assert compare_values(np.identity(3), rots[-1])
+
+    lrmsds, lrots, lshifts = qcel.molutil.kabsch_align_batch(rgeom.tolist(), cgeoms.tolist())
+    assert compare_values(rmsds, lrmsds, atol=1.0e-12)
+    assert compare_values(rots, lrots, atol=1.0e-12)
+    assert compare_values(shifts, lshifts, atol=1.0e-12)
+
+
+def test_kabsch_orderings_bound():
+    from qcelemental.molutil.align import _kabsch_orderings, _RMSDBound
+
+    rng = np.random.default_rng(11)
+    rgeom = rng.normal(size=(6, 3))
+    cgeom = rgeom[[1, 0, 2, 3, 5, 4]] @ qcel.util.random_rotation_matrix() + rng.normal(scale=0.1, size=(6, 3))
+    classes = [(np.arange(6), np.array(list(itertools.permutations(range(6)))))]
+
+    full = _kabsch_orderings(rgeom, [cgeom], classes, _RMSDBound(), 0.0, 0, 720)
+    assert np.all(np.isfinite(full))
+
+    # with a bound, skipped orderings are exactly those that could not have beaten it
+    bound = _RMSDBound(np.sort(full.ravel())[20])
+    pruned = _kabsch_orderings(rgeom, [cgeom], classes, bound, 0.0, 0, 720)
+    kept = np.isfinite(pruned)
+    assert compare_values(full[kept], pruned[kept], atol=1.0e-12)
+    assert np.all(full[~kept] > np.sort(full.ravel())[20])
+    assert (~kept).sum() > 0
+    assert bound.value == full.min()
+
+    # orderings that would converge are never skipped
+    floor = np.sort(full.ravel())[40]
+    pruned = _kabsch_orderings(rgeom, [cgeom], classes, _RMSDBound(0.0), floor, 0, 720)
+    assert np.all(np.isfinite(pruned[full <= floor]))
+
+
+def test_ordering_product():
+    from qcelemental.molutil.align import _CandidateStream, _ordering_chunks, _ordering_product
+
+    classes = [
+        (np.array([0, 3]), np.array([[0, 3], [3, 0]])),
+        (np.array([1, 2, 4]), np.array(list(itertools.permutations([1, 2, 4])))),
+        (np.array([5]), np.array([[5]])),
+    ]
+    expected = []
+    for cpmut in itertools.product(*[candidates for _, candidates in classes]):
+        atpat = [None] * 6
+        for (ridx, _), group in zip(classes, cpmut):
+            for idx, at in zip(ridx, group):
+                atpat[idx] = at
+        expected.append(atpat)
+
+    chunks = list(itertools.islice(_ordering_chunks(), 3))
+    assert chunks == [(0, 8), (8, 24), (24, 56)]
+    orderings = np.concatenate([_ordering_product(classes, start, stop) for start, stop in chunks])
+    assert orderings.tolist() == expected
+
+    # leading class drawn from a generator only as far as the orderings reach
+    stream = _CandidateStream(iter(classes[0][1].tolist()), 2)
+    streamed = [(classes[0][0], stream)] + classes[1:]
+    assert _ordering_product(streamed, 0, 4).tolist() == expected[:4]
+    assert len(stream) == 1
+    orderings = np.concatenate([_ordering_product(streamed, start, stop) for start, stop in chunks])
+    assert orderings.tolist() == expected
+    assert len(stream) == 2
+
+
+@pytest.mark.parametrize("run_mirror", [False, True])
+def test_model_align_parallel(run_mirror):
+    ch4 = qcel.models.Molecule.from_data(
+        """
+        C  0.00  0.00  0.00
+        H  0.63  0.63  0.63
+        H -0.63 -0.63  0.63
+        H -0.63  0.63 -0.63
+        H  0.63 -0.63 -0.63
+        """
+    )
+    perm = [3, 0, 4, 2, 1]
+    cmol = qcel.models.Molecule(
+        symbols=ch4.symbols[perm],
+        geometry=ch4.geometry[perm] @ qcel.util.random_rotation_matrix(),
+        fix_com=True,
+        fix_orientation=True,
+    )
+
+    # many orderings tie under the symmetry, so the winner is decided by search order
+    kwargs = {"run_to_completion": True, "mols_align": True, "run_mirror": run_mirror}
+    _, serial = cmol.align(ch4, **kwargs)
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        _, threaded = cmol.align(ch4, executor=executor, **kwargs)
+    _, pooled = cmol.align(ch4, nprocs=2, **kwargs)
+
+    for data in [threaded, pooled]:
+        assert data["rmsd"] == serial["rmsd"]
+        assert data["mill"].atommap.tolist() == serial["mill"].atommap.tolist()
+        assert data["mill"].mirror == serial["mill"].mirror
+        assert compare_values(serial["mill"].rotation, data["mill"].rotation, atol=1.0e-12)
+
+
 trop_cs = qcel.models.Molecule.from_data(
     """
      C        -3.19247825     2.43488661     0.00000000
@@ -285,7 +430,6 @@ trop_gs_c2v = qcel.models.Molecule.from_data(
 )
 
 
-@using_networkx
 def test_tropolone_b787():
     mol, data = trop_cs.align(trop_gs_c2v, do_plot=False, verbose=0, uno_cutoff=0.5)
     assert compare_values(0.1413, data["rmsd"], "cs<-->c2v tropolones align", atol=1.0e-2)
@@ -753,7 +897,6 @@ Rotation:
     assert compare_values(c4_hooh_hess, p2chess, atol=1.0e-4)
 
 
-@using_networkx
 def test_vector_gradient_align():
     # HOOH TS (optimized to be very nearly planar)
     p4_hooh_xyz = """
@@ -904,11 +1047,30 @@ def test_vector_gradient_align():
         ((["C", "Unknown"], [0, 0, 0, 0, 0, 3]), {}, [(0, 1)]),
     ],
 )
-def test_guess_connectivity(args, kwargs, ans):
-    computed = qcel.molutil.guess_connectivity(*args, **kwargs)
+@pytest.mark.parametrize("method", ["cells", "pairwise"])
+def test_guess_connectivity(args, kwargs, ans, method):
+    computed = qcel.molutil.guess_connectivity(*args, **kwargs, method=method)
     assert compare(computed, ans)
 
 
+@pytest.mark.parametrize("nat,box", [(0, 1.0), (1, 1.0), (40, 5.0), (500, 30.0), (300, 1000.0)])
+def test_guess_connectivity_cells_vs_pairwise(nat, box):
+    np.random.seed(nat)
+    symbols = np.random.choice(["H", "C", "N", "O", "Cl", "Zr"], size=nat)
+    geometry = np.random.rand(nat, 3) * box
+
+    pairwise = qcel.molutil.guess_connectivity(symbols, geometry, method="pairwise")
+    cells = qcel.molutil.guess_connectivity(symbols, geometry)
+    assert cells == pairwise
+
+
+def test_guess_connectivity_error():
+    with pytest.raises(ValueError) as e:
+        qcel.molutil.guess_connectivity(["C", "C"], [0, 0, 0, 0, 0, 3], method="spam")
+
+    assert "Connectivity method 'spam' not understood" in str(e.value)
+
+
 @pytest.mark.parametrize(
     "input,order,expected",
     [
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import qcelemental as qcel
+from qcelemental.util import np_lapjv
+from qcelemental.util.scipy_hungarian import linear_sum_assignment as munkres
+
+from .addons import using_scipy
+
+
+@pytest.fixture(params=["numpy", pytest.param("scipy", marks=using_scipy)])
+def solver(request, monkeypatch):
+    if request.param == "numpy":
+        monkeypatch.setattr(np_lapjv, "which_import", lambda *args, **kwargs: False)
+    return np_lapjv.linear_sum_assignment
+
+
+def test_linear_sum_assignment(solver):
+    # fmt: off
+    data = [
+        # Square
+        ([[400, 150, 400],
+          [400, 450, 600],
+          [300, 225, 300]],
+         [150, 400, 300]),
+
+        # Rectangular variant
+        ([[400, 150, 400, 1],
+          [400, 450, 600, 2],
+          [300, 225, 300, 3]],
+         [150, 2, 300]),
+
+        # Square
+        ([[10, 10, 8],
+          [9, 8, 1],
+          [9, 7, 4]],
+         [10, 1, 7]),
+
+        # Rectangular variant
+        ([[10, 10, 8, 11],
+          [9, 8, 1, 1],
+          [9, 7, 4, 10]],
+         [10, 1, 4]),
+
+        # n == 2, m == 0 matrix
+        ([[], []],
+         []),
+    ]
+    # fmt: on
+
+    for cost_matrix, expected_cost in data:
+        cost_matrix = np.array(cost_matrix)
+        (row_ind, col_ind), reduced_cost_matrix = solver(cost_matrix, return_cost=True)
+        assert_array_equal(row_ind, np.sort(row_ind))
+        assert_array_equal(expected_cost, cost_matrix[row_ind, col_ind])
+        assert reduced_cost_matrix.shape == cost_matrix.shape
+        assert np.all(reduced_cost_matrix >= 0.0)
+        assert_array_equal(0.0, reduced_cost_matrix[row_ind, col_ind])
+
+        cost_matrix = cost_matrix.T
+        (row_ind, col_ind), reduced_cost_matrix = solver(cost_matrix, return_cost=True)
+        assert_array_equal(row_ind, np.sort(row_ind))
+        assert_array_equal(np.sort(expected_cost), np.sort(cost_matrix[row_ind, col_ind]))
+        assert_array_equal(0.0, reduced_cost_matrix[row_ind, col_ind])
+
+
+@pytest.mark.parametrize("shape", [(7, 7), (5, 9), (9, 5), (40, 40)])
+def test_linear_sum_assignment_random(solver, shape):
+    rng = np.random.default_rng(11)
+    for cost_matrix in [rng.normal(size=shape), rng.integers(0, 4, shape)]:
+        row_ind, col_ind = solver(cost_matrix)
+        optimum = cost_matrix[munkres(cost_matrix)].sum()
+        assert np.isclose(cost_matrix[row_ind, col_ind].sum(), optimum)
+
+        # every assignment of zero reduced cost is optimal
+        (row_ind, col_ind), reduced = solver(cost_matrix, return_cost=True)
+        if cost_matrix.shape[0] > cost_matrix.shape[1]:
+            cost_matrix, reduced = cost_matrix.T, reduced.T
+        cmplt = qcel.util.linear_sum_assignment(reduced)
+        assert np.isclose(reduced[cmplt].sum(), 0.0)
+        assert np.isclose(cost_matrix[cmplt].sum(), optimum)
+
+
+def test_linear_sum_assignment_input_validation(solver):
+    with pytest.raises(ValueError):
+        solver([1, 2, 3])
+
+    C = [[1, 2, 3], [4, 5, 6]]
+    assert_array_equal(solver(C), solver(np.asarray(C)))
+
+    I = np.identity(3)
+    assert_array_equal(solver(I.astype(bool)), solver(I))
+    with pytest.raises(ValueError):
+        solver(I.astype(str))
+
+    I[0][0] = np.nan
+    with pytest.raises(ValueError):
+        solver(I)
+
+    I = np.identity(3)
+    I[1][1] = np.inf
+    with pytest.raises(ValueError):
+        solver(I)
@@ -1,6 +1,7 @@
 import os
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 import qcelemental
@@ -269,3 +270,36 @@ def test_periodic_table_comparison():
     from qcelemental.periodic_table import run_comparison
 
     run_comparison()
+
+
+def test_to_array_matches_scalar():
+    atoms = ["H", "D", "he4", "cL37", "oxygen", "U", "x", "c"] * 3
+    pt = qcelemental.periodictable
+
+    assert np.array_equal(pt.to_mass_array(atoms), [pt.to_mass(at) for at in atoms])
+    assert np.array_equal(pt.to_A_array(atoms), [pt.to_A(at) for at in atoms])
+    assert np.array_equal(pt.to_Z_array(atoms), [pt.to_Z(at) for at in atoms])
+    assert pt.to_E_array(atoms).tolist() == [pt.to_E(at) for at in atoms]
+
+
+def test_to_array_shape():
+    pt = qcelemental.periodictable
+
+    assert pt.to_Z_array([["H", "O"], ["C", "N"]]).tolist() == [[1, 8], [6, 7]]
+    assert pt.to_mass_array([]).shape == (0,)
+    assert pt.to_E_array(np.array([1, 6, 8])).tolist() == ["H", "C", "O"]
+    assert np.array_equal(pt.to_mass_array(np.array([1, 6])), [1.00782503223, 12.0])
+
+
+@pytest.mark.parametrize(
+    "inp,strict",
+    [
+        (["H", "Cz"], False),
+        ([1, 300], False),
+        ([-1], False),
+        (["H", "D"], True),
+    ],
+)
+def test_to_Z_array_error(inp, strict):
+    with pytest.raises(NotAnElementError):
+        qcelemental.periodictable.to_Z_array(inp, strict=strict)
@@ -1,3 +1,9 @@
+import gzip
+import io
+import json
+import mmap
+import tracemalloc
+import zipfile
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -11,7 +17,7 @@ except ImportError:  # Will also trap ModuleNotFoundError
 import qcelemental as qcel
 from qcelemental.testing import compare_recursive, compare_values
 
-from .addons import serialize_extensions
+from .addons import serialize_extensions, using_msgpack, using_orjson
 
 
 @pytest.fixture(scope="function")
@@ -157,6 +163,70 @@ def test_distance():
     assert np.allclose(np_dist, ee_dist)
 
 
+@pytest.mark.parametrize("block_size", [1, 3, 512])
+def test_nuclear_repulsion_matrix(block_size):
+    geom = np.random.rand(11, 3) * 6
+    Z = np.random.randint(0, 4, size=11).astype(float)
+    fragments = [np.arange(0, 4), np.arange(4, 9), np.arange(9, 11)]
+
+    ref = np.zeros((3, 3))
+    at2fr = np.concatenate([np.full(len(fr), ifr) for ifr, fr in enumerate(fragments)])
+    for i in range(11):
+        for j in range(i):
+            e = Z[i] * Z[j] / np.linalg.norm(geom[i] - geom[j])
+            ref[at2fr[i], at2fr[j]] += e
+            if at2fr[i] != at2fr[j]:
+                ref[at2fr[j], at2fr[i]] += e
+
+    nrem = qcel.util.nuclear_repulsion_matrix(geom, Z, fragments, block_size=block_size)
+    assert np.allclose(ref, nrem)
+
+    nre = qcel.util.nuclear_repulsion_matrix(geom, Z, block_size=block_size)
+    assert nre.shape == (1, 1)
+    assert compare_values(np.sum(np.triu(ref)), nre[0, 0])
+
+
+@pytest.mark.parametrize(
+    "nat,box,cutoff", [(0, 1.0, 0.1), (1, 1.0, 0.1), (60, 4.0, 0.5), (400, 10.0, 0.3), (50, 1.0e4, 1.0)]
+)
+def test_close_contacts(nat, box, cutoff):
+    np.random.seed(nat)
+    geom = np.random.rand(nat, 3) * box
+
+    ref = []
+    for i in range(nat):
+        for j in range(i + 1, nat):
+            dist = np.linalg.norm(geom[i] - geom[j])
+            if dist < cutoff:
+                ref.append((i, j, dist))
+
+    contacts = qcel.util.close_contacts(geom, cutoff)
+    assert [c[:2] for c in contacts] == [r[:2] for r in ref]
+    assert compare_values([r[2] for r in ref], [c[2] for c in contacts], atol=1.0e-12)
+
+    assert qcel.util.close_contacts(geom.ravel(), 0.0) == []
+
+
+def test_close_contacts_spread():
+    # cell indices along each axis far beyond int64 products if not compacted
+    geom = np.array([[0.0, 0.0, 0.0], [0.05, 0.0, 0.0], [1.0e15, 1.0e15, 1.0e15], [1.0e15, 1.0e15, 1.0e15 + 0.06]])
+    contacts = qcel.util.close_contacts(geom, 0.1)
+    assert [c[:2] for c in contacts] == [(0, 1), (2, 3)]
+
+    # cells a few layers apart must not become adjacent, nor adjacent ones drift apart
+    geom = np.array([[0.0, 0.0, 0.0], [0.35, 0.0, 0.0], [0.39, 0.0, 0.0], [5.0, 0.0, 0.0]])
+    assert [c[:2] for c in qcel.util.close_contacts(geom, 0.1)] == [(1, 2)]
+
+
+def test_close_contacts_nonfinite():
+    with pytest.raises(ValueError) as e:
+        qcel.util.close_contacts([[0, 0, 0], [np.nan, 0, 0], [0, 0, 0.05]], 0.1)
+    assert "finite" in str(e.value)
+
+    with pytest.raises(qcel.ValidationError):
+        qcel.molparse.from_arrays(geom=[0, 0, 0, np.inf, 0, 0], elez=[1, 1])
+
+
 def test_angle():
     def _test_angle(p1, p2, p3, value, degrees=True):
         tmp = qcel.util.compute_angle(p1, p2, p3, degrees=degrees)
@@ -255,6 +325,16 @@ def test_dihedral2():
     _test_dihedral(p7, p5, p4, p1, -177.63641151521261)
 
 
+def test_dihedral_rows():
+    p1 = np.array([[0, 0, 0], [0, 0, 0], [0, 4, 0], [0, 0, 0]])
+    p2 = np.array([[0, 2, 0]] * 4)
+    p3 = np.array([[2, 2, 0]] * 4)
+    p4 = np.array([[2, 0, 0], [2, 4, 0], [2, 2, -2], [2, 2, 2]])
+
+    ret = qcel.util.compute_dihedral(p1, p2, p3, p4, degrees=True)
+    assert compare_values([0, 180, -90, -90], ret, label="test_dihedral_rows")
+
+
 def test_auto_gen_doc(doc_fixture):
     assert "this is complicated" not in doc_fixture.__doc__
     qcel.util.auto_gen_docs_on_demand(doc_fixture, allow_failure=False, ignore_reapply=False)
@@ -310,3 +390,261 @@ def test_auto_gen_doc_delete(doc_fixture):
 def test_serialization(obj, encoding):
     new_obj = qcel.util.deserialize(qcel.util.serialize(obj, encoding=encoding), encoding=encoding)
     assert compare_recursive(obj, new_obj)
+
+
+@pytest.mark.parametrize("encoding", serialize_extensions)
+def test_detect_encoding(encoding):
+    blob = qcel.util.serialize({"a": np.random.rand(3, 4), "b": "x"}, encoding)
+    detected = qcel.util.detect_encoding(blob)
+
+    base, _, codec = encoding.partition("+")
+    assert detected.partition("+")[2] == codec
+    assert detected.partition("+")[0] == {"json-ext": "json", "msgpack": "msgpack-ext"}.get(base, base)
+    assert compare_recursive(qcel.util.deserialize(blob, detected), qcel.util.deserialize(blob, encoding))
+
+
+@pytest.mark.parametrize("encoding", ["json-ext", pytest.param("msgpack-ext", marks=using_msgpack)])
+def test_compressed_shuffle(encoding):
+    obj = {"a": np.linspace(0.0, 1.0, 20000).reshape(100, 200), "b": np.arange(9, dtype=">i2"), "c": np.ones(3, "S1")}
+    blob = qcel.util.serialize(obj, encoding + "+gzip")
+
+    # smooth data compresses far better once its bytes are grouped by significance
+    unshuffled = qcel.util.serialize(obj, encoding)
+    unshuffled = gzip.compress(unshuffled.encode() if isinstance(unshuffled, str) else unshuffled)
+    assert len(blob) < 0.8 * len(unshuffled)
+
+    new_obj = qcel.util.deserialize(blob, encoding + "+gzip")
+    assert compare_recursive(obj, new_obj)
+    assert new_obj["a"].flags.c_contiguous
+
+
+def test_compressed_errors():
+    with pytest.raises(KeyError) as e:
+        qcel.util.serialize({"a": 1}, "npz-ext+gzip")
+    assert "can not be compressed" in str(e.value)
+
+    with pytest.raises(KeyError) as e:
+        qcel.util.serialize({"a": 1}, "json+snappy")
+    assert "Compression 'snappy' not understood" in str(e.value)
+
+
+@pytest.fixture(params=["json", pytest.param("orjson", marks=using_orjson)])
+def json_backend(request):
+    backend = qcel.util.get_json_backend()
+    qcel.util.set_json_backend(request.param)
+    yield request.param
+    qcel.util.set_json_backend(backend)
+
+
+@pytest.mark.parametrize("encoding", ["json", "json-ext"])
+def test_json_backend(json_backend, encoding):
+    obj = {
+        "a": np.random.rand(3, 4),
+        "b": [np.float64(1.5), np.arange(3, dtype=np.uint16), np.array(["a", "b"]), np.array(5)],
+        "c": {1: "\u0394", "d": None, "e": (True, 2**40)},
+    }
+    blob = qcel.util.serialize(obj, encoding)
+    new_obj = qcel.util.deserialize(blob, encoding)
+    assert qcel.util.get_json_backend() == json_backend
+
+    # same document as with the standard library
+    qcel.util.set_json_backend("json")
+    reference = qcel.util.serialize(obj, encoding)
+    assert json.loads(blob) == json.loads(reference)
+    assert compare_recursive(qcel.util.deserialize(reference, encoding), new_obj)
+
+
+def test_json_backend_fallback(json_backend):
+    obj = qcel.util.json_loads('{"a": NaN, "b": [-Infinity]}')
+    assert np.isnan(obj["a"]) and obj["b"] == [-np.inf]
+
+    assert qcel.util.json_loads(qcel.util.json_dumps({"a": 2**70})) == {"a": 2**70}
+
+    with pytest.raises(TypeError):
+        qcel.util.json_dumps({"a": np.float32(1.0)})
+
+
+@pytest.mark.parametrize("encoding", ["json", "json-ext"])
+def test_json_backend_nonfinite(json_backend, encoding):
+    obj = {"a": float("nan"), "b": [np.inf, 1.0, None], "c": np.array([1.0, -np.inf]), "d": np.float64("nan")}
+    new_obj = qcel.util.deserialize(qcel.util.serialize(obj, encoding), encoding)
+    assert np.isnan(new_obj["a"]) and np.isnan(new_obj["d"])
+    assert new_obj["b"] == [np.inf, 1.0, None]
+    assert list(new_obj["c"]) == [1.0, -np.inf]
+
+    props = qcel.models.AtomicResultProperties(return_energy=float("nan"), calcinfo_nbasis=4)
+    new_props = qcel.models.AtomicResultProperties.parse_raw(props.serialize("json"), encoding="json")
+    assert np.isnan(new_props.return_energy)
+
+
+def test_json_backend_default():
+    backend = qcel.util.get_json_backend()
+    qcel.util.set_json_backend(None)
+    assert qcel.util.get_json_backend() == "json"
+    qcel.util.set_json_backend(backend)
+
+
+def test_json_backend_unknown():
+    with pytest.raises(KeyError) as e:
+        qcel.util.set_json_backend("yaml")
+    assert "JSON backend 'yaml' not understood" in str(e.value)
+
+
+@using_msgpack
+@pytest.mark.parametrize("dtype", ["<f8", ">f8", "<c16", "<i4", "<u2"])
+def test_msgpackext_views(dtype):
+    arr = np.arange(24, dtype=dtype).reshape(2, 3, 4)
+    blob = qcel.util.msgpackext_dumps({"a": arr})
+
+    view = qcel.util.msgpackext_loads(blob)["a"]
+    assert isinstance(view.base, bytes)
+    assert view.flags.aligned
+    assert not view.flags.writeable
+    assert compare_recursive(arr, view)
+
+    copied = qcel.util.msgpackext_loads(blob, writeable=True)["a"]
+    assert copied.flags.aligned
+    copied[0, 0, 0] = 7
+    assert copied[0, 0, 0] == 7
+
+
+@using_msgpack
+@pytest.mark.parametrize("writeable", [False, True])
+def test_msgpackext_write_isolation(writeable):
+    arr = np.arange(12.0).reshape(3, 4)
+    blob = qcel.util.msgpackext_dumps({"a": arr, "b": [arr]})
+    source = bytes(blob)
+
+    new_obj = qcel.util.msgpackext_loads(blob, writeable=writeable)
+    for decoded in (new_obj["a"], new_obj["b"][0]):
+        if not writeable:
+            with pytest.raises(ValueError, match="read-only"):
+                decoded[0, 0] = -1.0
+            decoded = np.array(decoded)
+        decoded[0, 0] = -1.0
+        assert decoded[0, 0] == -1.0
+    assert new_obj["a"][0, 0] == (-1.0 if writeable else 0.0)
+
+    stream = io.BytesIO(blob)
+    streamed = qcel.util.msgpackext_load(stream)
+    streamed["a"][0, 0] = streamed["b"][0][0, 0] = -1.0
+
+    assert blob == source == stream.getvalue()
+    assert compare_recursive(arr, qcel.util.msgpackext_loads(blob)["a"])
+
+
+@using_msgpack
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": np.random.rand(3, 4), "b": np.arange(5, dtype=np.int16), "c": np.array(4.0), "d": {}, "e": []},
+        [1, -3, 2**40, -(2**40), 1.5, "x" * 40, "y" * 300, "z" * 70000, None, True, False, np.random.rand(70000)],
+        {"a": [np.ones((2, 2), dtype=complex), {"b": np.array(["a", "bc"])}]},
+    ],
+)
+def test_msgpackext_stream(obj):
+    stream = io.BytesIO()
+    qcel.util.msgpackext_dump(obj, stream)
+    assert stream.getvalue() == qcel.util.msgpackext_dumps(obj)
+
+    stream.write(b"trailing")
+    stream.seek(0)
+    assert compare_recursive(obj, qcel.util.msgpackext_load(stream))
+    assert stream.read() == b"trailing"
+
+
+@using_msgpack
+def test_msgpackext_stream_chunked(monkeypatch):
+    from qcelemental.util import serialization
+
+    monkeypatch.setattr(serialization, "_msgpack_max_bin", 7)
+    obj = {"a": np.random.rand(3, 4), "b": np.arange(10.0), "c": np.arange(3, dtype=np.int8)}
+
+    stream = io.BytesIO()
+    qcel.util.msgpackext_dump(obj, stream, chunk_size=5)
+    stream.seek(0)
+    new_obj = qcel.util.msgpackext_load(stream)
+
+    assert compare_recursive(obj, new_obj)
+    assert compare_recursive(obj, qcel.util.msgpackext_loads(stream.getvalue()))
+    assert new_obj["a"].flags.writeable
+
+
+class _TrickleStream(io.BytesIO):
+    # Hands out at most a few bytes per read, like a pipe or socket
+    def read(self, size=-1):
+        return super().read(min(size, 3) if size >= 0 else 3)
+
+    def readinto(self, buffer):
+        return super().readinto(memoryview(buffer)[:3])
+
+
+@using_msgpack
+def test_msgpackext_stream_short_reads():
+    obj = {"a": "x" * 70000, "b": np.random.rand(5, 7), "c": ["y" * 300, 2**40]}
+    blob = qcel.util.msgpackext_dumps(obj)
+
+    assert compare_recursive(obj, qcel.util.msgpackext_load(_TrickleStream(blob)))
+
+    with pytest.raises(EOFError, match="bytes short"):
+        qcel.util.msgpackext_load(_TrickleStream(blob[:40000]))
+
+
+@using_msgpack
+def test_msgpackext_stream_memory(tmp_path):
+    arr = np.random.rand(1000, 1000)
+
+    tracemalloc.start()
+    with open(tmp_path / "arr.msgpack", "wb") as handle:
+        qcel.util.msgpackext_dump({"arr": arr}, handle)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < arr.nbytes / 10
+
+    tracemalloc.start()
+    with open(tmp_path / "arr.msgpack", "rb") as handle:
+        new_arr = qcel.util.msgpackext_load(handle)["arr"]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 1.1 * arr.nbytes
+    assert np.array_equal(arr, new_arr)
+
+
+def test_npzext_container():
+    obj = {
+        "a": np.random.rand(3, 4),
+        "f": np.asfortranarray(np.random.rand(3, 5)),
+        "b": [1.5, "x", np.arange(7, dtype=np.int16), np.array(["H", "He"])],
+        "c": np.array(4.0),
+    }
+    blob = qcel.util.npzext_dumps(obj)
+
+    # scalars stay readable JSON, arrays are aligned, memory-mappable npy members
+    with zipfile.ZipFile(io.BytesIO(blob)) as archive:
+        assert archive.namelist() == ["data.json", "arr_0.npy", "arr_1.npy", "arr_2.npy", "arr_3.npy"]
+        assert '"c": 4.0' in archive.read("data.json").decode()
+        for zinfo in archive.infolist()[1:]:
+            assert zinfo.compress_type == zipfile.ZIP_STORED
+    assert np.array_equal(np.load(io.BytesIO(blob))["arr_1"], obj["f"])
+
+    new_obj = qcel.util.npzext_loads(blob)
+    assert compare_recursive(obj, new_obj)
+    assert new_obj["f"].flags.f_contiguous
+    for arr in [new_obj["a"], new_obj["f"], new_obj["b"][2]]:
+        assert arr.base is not None
+        assert arr.flags.aligned
+        assert (arr.__array_interface__["data"][0] - new_obj["a"].__array_interface__["data"][0]) % 64 == 0
+
+
+def test_npzext_load_mmap(tmp_path):
+    obj = {"a": np.random.rand(3, 4), "b": [1.5, np.arange(7, dtype=np.int16)]}
+    (tmp_path / "obj.npz").write_bytes(qcel.util.npzext_dumps(obj))
+
+    with open(tmp_path / "obj.npz", "rb") as handle:
+        new_obj = qcel.util.npzext_load(handle)
+
+    # arrays outlive the file handle as views into the read-only mapping
+    assert compare_recursive(obj, new_obj)
+    for arr in [new_obj["a"], new_obj["b"][1]]:
+        assert isinstance(arr.base, mmap.mmap)
+        assert not arr.flags.writeable
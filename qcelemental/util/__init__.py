@@ -10,22 +10,32 @@ from .misc import (
     distance_matrix,
     filter_comments,
     measure_coordinates,
+    nuclear_repulsion_matrix,
     standardize_efp_angles_units,
     unnp,
     update_with_error,
 )
+from .neighbors import cell_list_pairs, close_contacts
 from .np_blockwise import blockwise_contract, blockwise_expand
+from .np_lapjv import linear_sum_assignment
 from .np_rand3drot import random_rotation_matrix
-from .scipy_hungarian import linear_sum_assignment
 from .serialization import (
     deserialize,
+    detect_encoding,
+    get_json_backend,
     json_dumps,
     json_loads,
     jsonext_dumps,
     jsonext_loads,
     msgpack_dumps,
     msgpack_loads,
+    msgpackext_dump,
     msgpackext_dumps,
+    msgpackext_load,
     msgpackext_loads,
+    npzext_dumps,
+    npzext_load,
+    npzext_loads,
     serialize,
+    set_json_backend,
 )
@@ -510,31 +510,198 @@ def uno(edges, match=None, verbose=1):
     "Algorithms for Enumerating All Perfect, Maximum and Maximal Matchings
     in Bipartite Graphs" by Takeaki UNO
 
-    """
-    import networkx as nx
+    Matchings are generated lazily, the given (or a found) `match` first, so a
+    caller may stop after the first few. Runs on a dense boolean adjacency matrix
+    with an explicit stack; requires neither networkx nor recursion.
 
-    if match is None:
-        p_match = None
-    else:
-        p_match = {(1, m[0]): (0, m[1]) for m in match}
-        p_m_inv = {(0, m[1]): (1, m[0]) for m in match}
-        p_match.update(p_m_inv)
+    Parameters
+    ----------
+    edges : list of tuple
+        Edges (a, b) of the graph, each joining node a of the first part to node b
+        of the second.
+    match : list of tuple, optional
+        Edges of a maximum matching. Found by augmenting paths if not given.
+    verbose : int, optional
+        Quantity of printing.
+
+    Yields
+    ------
+    list of tuple
+        Edges (a, b) of a maximum matching, sorted.
 
-    p_edges = [[(1, e[0]), (0, e[1])] for e in edges]
+    """
+    edges = [tuple(e) for e in edges]
     if verbose >= 2:
         print("Edges:")
-        for e in p_edges:
+        for e in edges:
             print("\t", e)
 
-    g = nx.Graph()
-    for e in p_edges:
-        g.add_node(e[0], bipartite=0)
-        g.add_node(e[1], bipartite=1)
-        if verbose >= 2:
-            print("  Node:", e[0], e[1])
-    g.add_edges_from(p_edges)
+    left = sorted(set(e[0] for e in edges))
+    right = sorted(set(e[1] for e in edges))
+    lidx = {a: i for i, a in enumerate(left)}
+    ridx = {b: j for j, b in enumerate(right)}
 
-    all_matches = _enumMaximumMatching(g, starter_match=p_match)
-    p_all_matches = [sorted([(pt[0][1], pt[1][1]) for pt in am]) for am in all_matches]
+    adj = np.zeros((len(left), len(right)), dtype=bool)
+    for a, b in edges:
+        adj[lidx[a], ridx[b]] = True
 
-    return p_all_matches
+    mate = np.full(len(left), -1)
+    if match is None:
+        mate = _augment_matching(adj, mate)
+    else:
+        for a, b in match:
+            mate[lidx[a]] = ridx[b]
+
+    for mm in _enum_maximum_matchings(adj, mate):
+        matched = np.flatnonzero(mm >= 0)
+        yield sorted((left[i], right[j]) for i, j in zip(matched, mm[matched]))
+
+
+def _augment_matching(adj, mate):
+    """Grows matching `mate` (partner in the second part of each node in the first,
+    or -1) of the graph `adj` to a maximum matching by augmenting paths (Kuhn)."""
+
+    nl, nr = adj.shape
+    mate = mate.copy()
+    mate_r = np.full(nr, -1)
+    mate_r[mate[mate >= 0]] = np.flatnonzero(mate >= 0)
+
+    for root in np.flatnonzero(mate == -1):
+        # breadth-first search for a free node in the second part
+        parent = np.full(nr, -1)
+        frontier = [root]
+        free = -1
+        while frontier and free == -1:
+            following = []
+            for i in frontier:
+                reach = np.flatnonzero(adj[i] & (parent == -1))
+                parent[reach] = i
+                unmatched = reach[mate_r[reach] == -1]
+                if len(unmatched):
+                    free = unmatched[0]
+                    break
+                following.extend(mate_r[reach])
+            frontier = following
+
+        # flip the matching along the path back to `root`
+        j = free
+        while j != -1:
+            i = parent[j]
+            mate_r[j] = i
+            mate[i], j = j, mate[i]
+
+    return mate
+
+
+def _alternating_cycle(adj, mate, alive_l):
+    """Nodes of the first part, in order, of a cycle alternating between matching
+    and other edges of graph `adj` restricted to `alive_l`, or None if none exists."""
+
+    nodes = np.flatnonzero(alive_l & (mate >= 0))
+    # arc a -> b where node a's partner is adjacent to node b
+    arcs = adj[nodes][:, mate[nodes]].T
+    np.fill_diagonal(arcs, False)
+
+    # strip nodes without arcs to the rest, which cannot lie on a cycle, until a core remains
+    core = np.ones(len(nodes), dtype=bool)
+    while True:
+        arcs &= core
+        stripped = core & arcs.any(axis=1)
+        if not stripped.any():
+            return None
+        if (stripped == core).all():
+            break
+        core = stripped
+
+    # every core node has an arc within the core, so walking them must close a cycle
+    seen = {}
+    a = int(np.argmax(core))
+    while a not in seen:
+        seen[a] = len(seen)
+        a = int(np.argmax(arcs[a]))
+    walk = list(seen)
+    return nodes[walk[seen[a] :]]
+
+
+def _alternating_path(adj, mate, alive_l, alive_r):
+    """Edge (i, j) not in matching `mate` of graph `adj` restricted to `alive_l` and
+    `alive_r` that may replace the matching edge at one of its ends, its other end
+    being uncovered, or None if none exists."""
+
+    matched_r = np.zeros(adj.shape[1], dtype=bool)
+    matched_r[mate[mate >= 0]] = True
+    if not (alive_l & (mate == -1)).any() and not (alive_r & ~matched_r).any():
+        return None
+
+    # uncovered i in the first part next to a covered j
+    for i in np.flatnonzero(alive_l & (mate == -1)):
+        reach = np.flatnonzero(adj[i] & alive_r & matched_r)
+        if len(reach):
+            return i, reach[0]
+
+    # uncovered j in the second part next to a covered i
+    for j in np.flatnonzero(alive_r & ~matched_r):
+        reach = np.flatnonzero(adj[:, j] & alive_l & (mate >= 0))
+        if len(reach):
+            return reach[0], j
+
+    return None
+
+
+def _enum_maximum_matchings(adj, mate):
+    """Generates all maximum matchings of the bipartite graph `adj`, starting from
+    maximum matching `mate` (partner in the second part of each node in the first,
+    or -1), by Uno's binary partition. Subproblems are pruned from `adj` in place and
+    restored as the explicit stack unwinds."""
+
+    alive_l = np.ones(adj.shape[0], dtype=bool)
+    alive_r = np.ones(adj.shape[1], dtype=bool)
+
+    def apply(op, value):
+        kind, i, j = op
+        if kind == "plus":
+            # keep edge e, dropping its ends
+            alive_l[i] = alive_r[j] = value
+        else:
+            # drop edge e
+            adj[i, j] = value
+
+    yield mate.copy()
+
+    stack = [("visit", mate)]
+    while stack:
+        action, item = stack.pop()
+        if action == "apply":
+            apply(item, False)
+            continue
+        if action == "undo":
+            apply(item, True)
+            continue
+
+        mate = item
+        cycle = _alternating_cycle(adj, mate, alive_l)
+        if cycle is not None:
+            # swap the matching around the cycle; e is a matching edge on it
+            new_mate = mate.copy()
+            new_mate[np.append(cycle[1:], cycle[0])] = mate[cycle]
+            e = (cycle[0], mate[cycle[0]])
+            with_e, without_e = mate, new_mate
+        else:
+            path = _alternating_path(adj, mate, alive_l, alive_r)
+            if path is None:
+                continue
+            # move the matching edge at one end of e onto e
+            i, j = path
+            new_mate = mate.copy()
+            new_mate[mate == j] = -1
+            new_mate[i] = j
+            e = (i, j)
+            with_e, without_e = new_mate, mate
+
+        yield new_mate
+
+        # matchings without e first, then those with e
+        for op, child in [(("plus",) + e, with_e), (("minus",) + e, without_e)]:
+            stack.append(("undo", op))
+            stack.append(("visit", child))
+            stack.append(("apply", op))
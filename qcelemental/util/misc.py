@@ -13,10 +13,71 @@ def distance_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
 
     """
     assert a.shape[1] == b.shape[1], """Inner dimensions do not match"""
-    distm = np.zeros([a.shape[0], b.shape[0]])
-    for i in range(a.shape[0]):
-        distm[i] = np.linalg.norm(a[i] - b, axis=1)
-    return distm
+    diff = a[:, None, :] - b[None, :, :]
+    return np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+
+
+def nuclear_repulsion_matrix(
+    geom: np.ndarray, Z: np.ndarray, fragments: List[np.ndarray] = None, *, block_size: int = 512
+) -> np.ndarray:
+    r"""Nuclear repulsion energy partitioned into intra- and inter-fragment contributions.
+
+    Parameters
+    ----------
+    geom : np.ndarray
+        (nat, 3) Cartesian coordinates [a0].
+    Z : np.ndarray
+        (nat,) Effective nuclear charges. Atoms with zero charge (e.g., ghosts) are skipped.
+    fragments : list of array-like, optional
+        Atom indices of each fragment. If not provided, all atoms are one fragment.
+        Atoms not present in any fragment are skipped.
+    block_size : int, optional
+        Number of atoms per block of the pairwise distance evaluation, so that working
+        memory scales as ``block_size**2`` rather than ``nat**2``.
+
+    Returns
+    -------
+    np.ndarray
+        (nfr, nfr) symmetric array whose diagonal holds the NRE within each fragment and
+        whose off-diagonal ``[i, j]`` holds the NRE between fragments ``i`` and ``j``.
+        The total NRE is the sum of the upper triangle, including the diagonal.
+
+    """
+    geom = np.asarray(geom, dtype=float).reshape(-1, 3)
+    Z = np.asarray(Z, dtype=float)
+    nat = geom.shape[0]
+
+    if fragments is None:
+        fragments = [np.arange(nat)]
+    nfr = len(fragments)
+
+    at2fr = np.full(nat, -1, dtype=int)
+    for ifr, fr in enumerate(fragments):
+        at2fr[np.asarray(fr, dtype=int)] = ifr
+
+    keep = np.nonzero((Z != 0.0) & (at2fr >= 0))[0]
+    geom, Z, at2fr = geom[keep], Z[keep], at2fr[keep]
+    nkeep = len(keep)
+
+    nrem = np.zeros(nfr * nfr)
+    for start1 in range(0, nkeep, block_size):
+        blk1 = slice(start1, min(start1 + block_size, nkeep))
+        for start2 in range(0, start1 + 1, block_size):
+            blk2 = slice(start2, min(start2 + block_size, nkeep))
+
+            with np.errstate(divide="ignore"):
+                epair = np.outer(Z[blk1], Z[blk2]) / distance_matrix(geom[blk1], geom[blk2])
+            if start1 == start2:
+                # diagonal block: strictly lower triangle, each pair once
+                epair = np.tril(epair, k=-1)
+
+            frpair = at2fr[blk1, None] * nfr + at2fr[None, blk2]
+            nrem += np.bincount(frpair.ravel(), weights=epair.ravel(), minlength=nfr * nfr)
+
+    nrem = nrem.reshape(nfr, nfr)
+    nrem = nrem + nrem.T
+    nrem[np.diag_indices(nfr)] *= 0.5
+    return nrem
 
 
 def update_with_error(a: Dict, b: Dict, path=None) -> Dict:
@@ -299,14 +360,14 @@ def compute_dihedral(points1, points2, points3, points4, *, degrees: bool = Fals
     v3 = points4 - points3
 
     # Normalize the central vector
-    v2 = v2 / _norm(v2)
+    v2 = v2 / _norm(v2)[:, None]
 
     # v = projection of b0 onto plane perpendicular to b1
     #   = b0 minus component that aligns with b1
     # w = projection of b2 onto plane perpendicular to b1
     #   = b2 minus component that aligns with b1
-    v = v1 - np.einsum("ij,ij->i", v1, v1) * v2
-    w = v3 - np.einsum("ij,ij->i", v3, v2) * v2
+    v = v1 - np.einsum("ij,ij->i", v1, v1)[:, None] * v2
+    w = v3 - np.einsum("ij,ij->i", v3, v2)[:, None] * v2
 
     # angle between v and w in a plane is the torsion angle
     # v and w may not be normalized but that's fine since tan is y/x
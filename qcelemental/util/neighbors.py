@@ -0,0 +1,105 @@
+import itertools
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+__all__ = ["cell_list_pairs", "close_contacts"]
+
+
+def cell_list_pairs(geometry: np.ndarray, edge: float) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    r"""Candidate atom pairs from a cell list, for neighbor searches with a cutoff no larger than `edge`.
+
+    Atoms are binned into cubic cells of side `edge`, and only atoms in the same or adjacent cells are paired,
+    so the work scales linearly with the number of atoms at fixed density. Every pair closer than `edge` is
+    generated exactly once, along with some farther pairs that the caller filters.
+
+    Parameters
+    ----------
+    geometry : np.ndarray
+        (nat, 3) Cartesian coordinates. Must be finite.
+    edge : float
+        Cell side length; must be at least the largest cutoff the caller applies. Must be positive.
+
+    Yields
+    ------
+    iat, jat : Tuple[np.ndarray, np.ndarray]
+        Arrays of atom indices with ``iat < jat`` elementwise, one block per neighbor-cell offset.
+
+    Raises
+    ------
+    ValueError
+        If `geometry` has non-finite coordinates.
+
+    """
+    geometry = np.asarray(geometry, dtype=float).reshape(-1, 3)
+    if not np.all(np.isfinite(geometry)):
+        raise ValueError("Geometry must be finite.")
+    if geometry.shape[0] < 2:
+        return
+
+    # Bin atoms into cells. Runs of empty cell layers along each axis shrink to one empty layer, so
+    #   adjacent layers stay adjacent while cell keys stay below (2 nat)^3 however spread out the atoms are
+    cells = np.empty(geometry.shape, dtype=np.int64)
+    for k in range(3):
+        layers, inverse = np.unique(np.floor((geometry[:, k] - geometry[:, k].min()) / edge), return_inverse=True)
+        cells[:, k] = np.concatenate(([0], np.cumsum(np.minimum(np.diff(layers), 2.0)))).astype(np.int64)[inverse]
+    dims = cells.max(axis=0) + 1
+
+    # group atoms by cell, sorted
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(keys, kind="stable")
+    ukeys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    ucells = cells[order[starts]]
+
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        # occupied neighbor cell of each occupied cell, if any
+        ncells = ucells + offset
+        inside = np.all((ncells >= 0) & (ncells < dims), axis=1)
+        nkeys = (ncells[:, 0] * dims[1] + ncells[:, 1]) * dims[2] + ncells[:, 2]
+        loc = np.searchsorted(ukeys, nkeys).clip(max=len(ukeys) - 1)
+        acell = np.nonzero(inside & (ukeys[loc] == nkeys))[0]
+        bcell = loc[acell]
+
+        # every atom of cell a against every atom of cell b
+        na, nb = counts[acell], counts[bcell]
+        block = na * nb
+        if not block.sum():
+            continue
+        ipair = np.repeat(np.arange(len(acell)), block)
+        local = np.arange(block.sum()) - np.repeat(np.cumsum(block) - block, block)
+        iat = order[starts[acell][ipair] + local // nb[ipair]]
+        jat = order[starts[bcell][ipair] + local % nb[ipair]]
+
+        upper = iat < jat
+        yield iat[upper], jat[upper]
+
+
+def close_contacts(geometry: np.ndarray, cutoff: float) -> List[Tuple[int, int, float]]:
+    r"""Pairs of atoms closer than `cutoff`, found in linear time with a cell list.
+
+    Parameters
+    ----------
+    geometry : array-like
+        (nat, 3) or (3 * nat,) Cartesian coordinates.
+    cutoff : float
+        Distance, in the units of `geometry`, below which a pair is reported.
+
+    Returns
+    -------
+    List[Tuple[int, int, float]]
+        ``(i, j, distance)`` for every pair with ``i < j`` and ``distance < cutoff``, sorted by `i` then `j`.
+
+    """
+    geometry = np.asarray(geometry, dtype=float).reshape(-1, 3)
+    if not cutoff > 0.0:
+        return []
+
+    metric = cutoff**2
+    contacts = []
+    for iat, jat in cell_list_pairs(geometry, cutoff):
+        diffs = geometry[iat] - geometry[jat]
+        dists = np.einsum("ij,ij->i", diffs, diffs)
+        close = dists < metric
+        contacts.extend(zip(iat[close].tolist(), jat[close].tolist(), (dists[close] ** 0.5).tolist()))
+
+    return sorted(contacts)
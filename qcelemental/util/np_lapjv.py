@@ -0,0 +1,187 @@
+import numpy as np
+
+from .importing import which_import
+
+
+def linear_sum_assignment(cost_matrix, return_cost=False):
+    r"""Solve the linear sum assignment problem.
+
+    Finds a complete assignment of rows ("workers") to columns ("jobs") of
+    minimal total cost ``cost_matrix[row_ind, col_ind].sum()``, exactly like
+    :py:func:`scipy.optimize.linear_sum_assignment`, including for rectangular
+    matrices. Unlike it, also optionally returns the reduced cost matrix
+    needed to enumerate all optimal assignments.
+
+    Dispatches to SciPy when available and otherwise runs a NumPy
+    shortest augmenting path (Jonker-Volgenant) solver. Both run in
+    O(n^3) but with small constants, unlike the pure-Python Munkres of
+    :py:func:`qcelemental.util.scipy_hungarian.linear_sum_assignment`.
+
+    Parameters
+    ----------
+    cost_matrix : array
+        The cost matrix of the bipartite graph.
+    return_cost : bool, optional
+        If True, also return the reduced cost matrix ``C - u[:, None] - v[None, :]``
+        for optimal dual potentials ``u`` and ``v``. It is nonnegative and zero on
+        the returned assignment and on every other optimal assignment, so these
+        are exactly the perfect matchings among its zeros.
+
+    Returns
+    -------
+    row_ind, col_ind : array
+        An array of row indices and one of corresponding column indices giving
+        the optimal assignment. The row indices will be sorted; in the case of a
+        square cost matrix they will be equal to ``numpy.arange(cost_matrix.shape[0])``.
+    (row_ind, col_ind), cost
+        Only provided if `return_cost` is True.
+
+    Notes
+    -----
+    * Jonker & Volgenant, Computing 38, 325-340 (1987) https://doi.org/10.1007/BF02278710
+    * Crouse, IEEE Trans. Aerosp. Electron. Syst. 52, 1679-1696 (2016) https://doi.org/10.1109/TAES.2016.140952
+
+    """
+    cost_matrix = np.asarray(cost_matrix)
+    if len(cost_matrix.shape) != 2:
+        raise ValueError("expected a matrix (2-d array), got a %r array" % (cost_matrix.shape,))
+
+    if not (np.issubdtype(cost_matrix.dtype, np.number) or cost_matrix.dtype == np.dtype(bool)):
+        raise ValueError("expected a matrix containing numerical entries, got %s" % (cost_matrix.dtype,))
+
+    if np.any(np.isinf(cost_matrix) | np.isnan(cost_matrix)):
+        raise ValueError("matrix contains invalid numeric entries")
+
+    # The algorithm expects at least as many columns as rows in the cost matrix.
+    cost = cost_matrix.astype(float)
+    transposed = cost.shape[1] < cost.shape[0]
+    if transposed:
+        cost = cost.T
+
+    if 0 in cost.shape:
+        col4row = np.zeros(0, dtype=int)
+        u, v = np.zeros(cost.shape[0]), np.zeros(cost.shape[1])
+    elif which_import("scipy", return_bool=True):
+        from scipy.optimize import linear_sum_assignment as scipy_linear_sum_assignment
+
+        _, col4row = scipy_linear_sum_assignment(cost)
+        if return_cost:
+            u, v = _assignment_duals(cost, col4row)
+    else:
+        col4row, u, v = _lapjv(cost)
+
+    if transposed:
+        order = np.argsort(col4row)
+        row_ind, col_ind = col4row[order], order
+    else:
+        row_ind, col_ind = np.arange(len(col4row)), col4row
+
+    if not return_cost:
+        return row_ind, col_ind
+
+    reduced_cost = cost - u[:, None] - v[None, :]
+    np.maximum(reduced_cost, 0.0, out=reduced_cost)
+    reduced_cost[np.arange(len(col4row)), col4row] = 0.0
+    if transposed:
+        reduced_cost = reduced_cost.T
+
+    return (row_ind, col_ind), reduced_cost
+
+
+def _lapjv(cost):
+    """Shortest augmenting path solution of the (nr, nc) `cost` assignment, nr <= nc.
+
+    Returns the column of each row and the dual potentials of rows and columns.
+
+    """
+    nr, nc = cost.shape
+
+    # shift to nonnegative costs, so zero potentials are dual feasible; every row is
+    #   assigned, so the shift changes no assignment and cancels in the reduced costs
+    shift = cost.min()
+    cost = cost - shift
+    u = np.zeros(nr)
+    v = np.zeros(nc)
+    col4row = np.full(nr, -1)
+    row4col = np.full(nc, -1)
+
+    if nr == nc:
+        # column reduction, then assign each column's cheapest row while still free
+        v = cost.min(axis=0)
+        for j, i in enumerate(cost.argmin(axis=0)):
+            if col4row[i] == -1:
+                col4row[i] = j
+                row4col[j] = i
+
+    for cur_row in np.flatnonzero(col4row == -1):
+        # Dijkstra over columns from `cur_row` on the reduced costs, until a free column is reached
+        shortest = np.full(nc, np.inf)
+        path = np.full(nc, -1)
+        SR = np.zeros(nr, dtype=bool)
+        SC = np.zeros(nc, dtype=bool)
+        min_val = 0.0
+        i = cur_row
+        sink = -1
+        while sink == -1:
+            SR[i] = True
+            reduced = min_val + cost[i] - u[i] - v
+            update = ~SC & (reduced < shortest)
+            path[update] = i
+            shortest[update] = reduced[update]
+
+            remaining = np.where(SC, np.inf, shortest)
+            min_val = remaining.min()
+            closest = np.flatnonzero(remaining == min_val)
+            free = closest[row4col[closest] == -1]
+            j = free[0] if len(free) else closest[0]
+
+            SC[j] = True
+            if row4col[j] == -1:
+                sink = j
+            else:
+                i = row4col[j]
+
+        # update potentials, keeping the reduced costs nonnegative and assigned ones zero
+        u[cur_row] += min_val
+        SR[cur_row] = False
+        u[SR] += min_val - shortest[col4row[SR]]
+        v[SC] -= min_val - shortest[SC]
+
+        # augment along the path back to `cur_row`
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == cur_row:
+                break
+
+    return col4row, u + shift, v
+
+
+def _assignment_duals(cost, col4row):
+    """Dual potentials of rows and columns certifying the optimal assignment `col4row`
+    of the (nr, nc) `cost`, nr <= nc.
+
+    Potentials of columns are shortest path distances over the edges "row i moves
+    from its column to column j", which have no negative cycles when the assignment
+    is optimal. Relaxations run for all columns at once (Bellman-Ford), from the
+    rows whose column was lowered in the previous pass.
+
+    """
+    nr, nc = cost.shape
+    rows = np.arange(nr)
+    weight = cost - cost[rows, col4row][:, None]
+
+    v = np.minimum(weight.min(axis=0), 0.0)
+    active = rows
+    for _ in range(nr):
+        relaxed = np.minimum(v, (v[col4row[active]][:, None] + weight[active]).min(axis=0))
+        lowered = relaxed < v
+        if not lowered.any():
+            break
+        v = relaxed
+        active = rows[lowered[col4row]]
+    u = cost[rows, col4row] - v[col4row]
+
+    return u, v
@@ -1,5 +1,14 @@
+import bz2
+import io
 import json
-from typing import Any, Union
+import lzma
+import math
+import mmap
+import struct
+import zipfile
+import zlib
+from functools import partial
+from typing import IO, Any, Callable, Dict, Optional, Type, Union
 
 import numpy as np
 
@@ -15,12 +24,33 @@ try:
 except ModuleNotFoundError:
     pass
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    pass
+
 _msgpack_which_msg = "Please install via `conda install msgpack-python`."
+_orjson_which_msg = "Please install via `conda install orjson` or `pip install orjson`."
+_zstd_which_msg = "Please install via `conda install zstandard` or `pip install zstandard`."
+_lz4_which_msg = "Please install via `conda install lz4` or `pip install lz4`."
+
+
+def _byte_shuffle(arr: np.ndarray) -> bytes:
+    r"""Bytes of `arr` regrouped by position within each element: every first byte, then every second byte, etc.
+    Slowly varying data, such as densities and orbitals, becomes long runs that compress well."""
+    return np.ascontiguousarray(arr).view(np.uint8).reshape(-1, arr.dtype.itemsize).T.tobytes()
+
+
+def _byte_unshuffle(data: bytes, dtype: str) -> np.ndarray:
+    r"""Flat, writeable array of `dtype` from the output of :func:`_byte_shuffle`."""
+    dtype = np.dtype(dtype)
+    return np.frombuffer(data, dtype=np.uint8).reshape(dtype.itemsize, -1).T.copy().view(dtype).ravel()
+
 
 ## MSGPackExt
 
 
-def msgpackext_encode(obj: Any) -> Any:
+def msgpackext_encode(obj: Any, *, shuffle: bool = False) -> Any:
     r"""
     Encodes an object using pydantic and NumPy array serialization techniques suitable for msgpack.
 
@@ -28,6 +58,8 @@ def msgpackext_encode(obj: Any) -> Any:
     ----------
     obj : Any
         Any object that can be serialized with pydantic and NumPy encoding techniques.
+    shuffle : bool, optional
+        If True, array data with multi-byte elements is stored byte-shuffled, which helps later compression.
 
     Returns
     -------
@@ -43,9 +75,13 @@ def msgpackext_encode(obj: Any) -> Any:
 
     if isinstance(obj, np.ndarray):
         if obj.shape:
-            data = {b"_nd_": True, b"dtype": obj.dtype.str, b"data": np.ascontiguousarray(obj).tobytes()}
+            shuffle = shuffle and obj.dtype.itemsize > 1
+            raw = _byte_shuffle(obj) if shuffle else np.ascontiguousarray(obj).tobytes()
+            data = {b"_nd_": True, b"dtype": obj.dtype.str, b"data": raw}
             if len(obj.shape) > 1:
                 data[b"shape"] = obj.shape
+            if shuffle:
+                data[b"shuffle"] = True
             return data
 
         else:
@@ -55,7 +91,7 @@ def msgpackext_encode(obj: Any) -> Any:
     return obj
 
 
-def msgpackext_decode(obj: Any) -> Any:
+def msgpackext_decode(obj: Any, *, writeable: bool = False) -> Any:
     r"""
     Decodes a msgpack objects from a dictionary representation.
 
@@ -63,6 +99,10 @@ def msgpackext_decode(obj: Any) -> Any:
     ----------
     obj : Any
         An encoded object, likely a dictionary.
+    writeable : bool, optional
+        If False (default), NumPy arrays are zero-copy, read-only views of the msgpack binary payload,
+        guaranteed aligned for their dtype. Writes raise rather than reach the payload; ``np.array(arr)``
+        gives a private copy to modify. If True, each array is copied once into writeable memory.
 
     Returns
     -------
@@ -71,7 +111,19 @@ def msgpackext_decode(obj: Any) -> Any:
     """
 
     if b"_nd_" in obj:
-        arr = np.frombuffer(obj[b"data"], dtype=obj[b"dtype"])
+        data = obj[b"data"]
+        if isinstance(data, list):
+            # chunked framing from msgpackext_dump
+            data = b"".join(data)
+        if b"shuffle" in obj:
+            arr = _byte_unshuffle(data, obj[b"dtype"])
+            arr.flags.writeable = writeable
+        else:
+            arr = np.frombuffer(data, dtype=obj[b"dtype"])
+            if writeable or not arr.flags.aligned:
+                # NumPy allocations are aligned
+                arr = arr.copy()
+                arr.flags.writeable = writeable
         if b"shape" in obj:
             arr.shape = obj[b"shape"]
 
@@ -80,7 +132,7 @@ def msgpackext_decode(obj: Any) -> Any:
     return obj
 
 
-def msgpackext_dumps(data: Any) -> bytes:
+def msgpackext_dumps(data: Any, *, shuffle: bool = False) -> bytes:
     r"""Safe serialization of a Python object to msgpack binary representation using all known encoders.
     For NumPy, encodes a specialized object format to encode all shape and type data.
 
@@ -88,6 +140,8 @@ def msgpackext_dumps(data: Any) -> bytes:
     ----------
     data : Any
         A encodable python object.
+    shuffle : bool, optional
+        If True, array data is byte-shuffled (see :func:`msgpackext_encode`) for better compression.
 
     Returns
     -------
@@ -96,16 +150,22 @@ def msgpackext_dumps(data: Any) -> bytes:
     """
     which_import("msgpack", raise_error=True, raise_msg=_msgpack_which_msg)
 
-    return msgpack.dumps(data, default=msgpackext_encode, use_bin_type=True)
+    return msgpack.dumps(data, default=partial(msgpackext_encode, shuffle=shuffle), use_bin_type=True)
 
 
-def msgpackext_loads(data: bytes) -> Any:
+def msgpackext_loads(data: bytes, *, writeable: bool = False) -> Any:
     r"""Deserializes a msgpack byte representation of known objects into those objects.
 
     Parameters
     ----------
     data : bytes
         The serialized msgpack byte array.
+    writeable : bool, optional
+        By default, NumPy arrays are aligned, read-only views onto the single buffer msgpack allocates for each
+        payload, so decoding costs no copies beyond msgpack's own, and model validation keeps the views as-is.
+        Writing to such a view raises instead of touching the payload, so arrays to be modified in place are
+        copied on write with ``np.array(arr)``. If True, every array is
+        copied into writeable memory during decoding instead.
 
     Returns
     -------
@@ -114,13 +174,368 @@ def msgpackext_loads(data: bytes) -> Any:
     """
     which_import("msgpack", raise_error=True, raise_msg=_msgpack_which_msg)
 
-    return msgpack.loads(data, object_hook=msgpackext_decode, raw=False)
+    return msgpack.loads(data, object_hook=partial(msgpackext_decode, writeable=writeable), raw=False)
+
+
+## MSGPackExt streams
+
+# largest msgpack bin payload; bigger arrays are framed as an array of bins
+_msgpack_max_bin = 2**32 - 1
+
+# msgpack type byte -> (bytes of length field, fixed payload length) for the variable-length types
+_msgpack_var = {
+    0xC4: (1, 0),  # bin 8
+    0xC5: (2, 0),  # bin 16
+    0xC6: (4, 0),  # bin 32
+    0xC7: (1, 1),  # ext 8
+    0xC8: (2, 1),  # ext 16
+    0xC9: (4, 1),  # ext 32
+    0xD9: (1, 0),  # str 8
+    0xDA: (2, 0),  # str 16
+    0xDB: (4, 0),  # str 32
+}
+# msgpack type byte -> payload length for the fixed-length types
+_msgpack_fixed = {
+    0xC0: 0,  # nil
+    0xC2: 0,  # false
+    0xC3: 0,  # true
+    0xCA: 4,  # float 32
+    0xCB: 8,  # float 64
+    0xCC: 1,  # uint 8
+    0xCD: 2,  # uint 16
+    0xCE: 4,  # uint 32
+    0xCF: 8,  # uint 64
+    0xD0: 1,  # int 8
+    0xD1: 2,  # int 16
+    0xD2: 4,  # int 32
+    0xD3: 8,  # int 64
+    0xD4: 2,  # fixext 1
+    0xD5: 3,  # fixext 2
+    0xD6: 5,  # fixext 4
+    0xD7: 9,  # fixext 8
+    0xD8: 17,  # fixext 16
+}
+_msgpack_uint = {1: ">B", 2: ">H", 4: ">I"}
+
+
+def _write_msgpack_bin(stream: IO[bytes], data: memoryview, chunk_size: int) -> None:
+    nbytes = data.nbytes
+    if nbytes < 2**8:
+        stream.write(struct.pack(">BB", 0xC4, nbytes))
+    elif nbytes < 2**16:
+        stream.write(struct.pack(">BH", 0xC5, nbytes))
+    else:
+        stream.write(struct.pack(">BI", 0xC6, nbytes))
+    for start in range(0, nbytes, chunk_size):
+        stream.write(data[start : start + chunk_size])
+
+
+def _write_msgpackext(stream: IO[bytes], packer: "msgpack.Packer", obj: Any, chunk_size: int) -> None:
+    if isinstance(obj, dict):
+        stream.write(packer.pack_map_header(len(obj)))
+        for key, value in obj.items():
+            stream.write(packer.pack(key))
+            _write_msgpackext(stream, packer, value, chunk_size)
+
+    elif isinstance(obj, (list, tuple)):
+        stream.write(packer.pack_array_header(len(obj)))
+        for value in obj:
+            _write_msgpackext(stream, packer, value, chunk_size)
+
+    elif isinstance(obj, np.ndarray) and obj.shape:
+        # same layout as msgpackext_encode, except that chunked arrays give their shape ahead of the data
+        chunked = obj.nbytes > _msgpack_max_bin
+        stream.write(packer.pack_map_header(4 if (len(obj.shape) > 1 or chunked) else 3))
+        stream.write(packer.pack(b"_nd_"))
+        stream.write(packer.pack(True))
+        stream.write(packer.pack(b"dtype"))
+        stream.write(packer.pack(obj.dtype.str))
+        if chunked:
+            stream.write(packer.pack(b"shape"))
+            stream.write(packer.pack(obj.shape))
+        stream.write(packer.pack(b"data"))
+
+        if obj.flags.c_contiguous:
+            data = memoryview(obj.reshape(-1)).cast("B")
+        else:
+            # contiguous copy of the whole array; rare for model fields
+            data = memoryview(np.ascontiguousarray(obj).reshape(-1)).cast("B")
+        if chunked:
+            frames = range(0, data.nbytes, _msgpack_max_bin)
+            stream.write(packer.pack_array_header(len(frames)))
+            for start in frames:
+                _write_msgpack_bin(stream, data[start : start + _msgpack_max_bin], chunk_size)
+        else:
+            _write_msgpack_bin(stream, data, chunk_size)
+            if len(obj.shape) > 1:
+                stream.write(packer.pack(b"shape"))
+                stream.write(packer.pack(obj.shape))
+
+    else:
+        stream.write(packer.pack(obj))
+
+
+def _read_exact(stream: IO[bytes], nbytes: int) -> bytes:
+    chunks = []
+    remaining = nbytes
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            raise EOFError(f"Stream ended {remaining} bytes short of a complete msgpack object.")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _readinto_exact(stream: IO[bytes], buffer: np.ndarray) -> None:
+    view = memoryview(buffer).cast("B")
+    filled = 0
+    while filled < view.nbytes:
+        if hasattr(stream, "readinto"):
+            nread = stream.readinto(view[filled:])
+        else:
+            chunk = stream.read(view.nbytes - filled)
+            nread = len(chunk)
+            view[filled : filled + nread] = chunk
+        if not nread:
+            raise EOFError(f"Stream ended {view.nbytes - filled} bytes short of a complete msgpack object.")
+        filled += nread
+
+
+def _read_msgpack_length(stream: IO[bytes], nbytes: int) -> int:
+    return struct.unpack(_msgpack_uint[nbytes], _read_exact(stream, nbytes))[0]
+
+
+def _read_msgpack_payload(stream: IO[bytes], header: Dict[bytes, Any]) -> Any:
+    # Array payload, a bin or array of bins, read straight into one new buffer
+    code = _read_exact(stream, 1)[0]
+
+    if code in (0xC4, 0xC5, 0xC6):
+        buffer = np.empty(_read_msgpack_length(stream, _msgpack_var[code][0]), dtype=np.uint8)
+        _readinto_exact(stream, buffer)
+        return buffer
+
+    elif 0x90 <= code <= 0x9F or code in (0xDC, 0xDD):
+        nframes = code & 0x0F if code <= 0x9F else _read_msgpack_length(stream, 2 if code == 0xDC else 4)
+        if b"shape" not in header:
+            return np.concatenate([_read_msgpack_payload(stream, {}) for _ in range(nframes)])
+
+        buffer = np.empty(int(np.prod(header[b"shape"])) * np.dtype(header[b"dtype"]).itemsize, dtype=np.uint8)
+        filled = 0
+        for _ in range(nframes):
+            code = _read_exact(stream, 1)[0]
+            if code not in (0xC4, 0xC5, 0xC6):
+                raise ValueError(f"Expected a msgpack bin in chunked array data, found type byte {code:#x}.")
+            nbytes = _read_msgpack_length(stream, _msgpack_var[code][0])
+            _readinto_exact(stream, buffer[filled : filled + nbytes])
+            filled += nbytes
+        return buffer
+
+    return _read_msgpackext(stream, code)
+
+
+def _read_msgpackext(stream: IO[bytes], code: Optional[int] = None) -> Any:
+    # Pull parser. Containers are walked here so that array payloads can be read straight into their final
+    # buffer; every other object is read whole and handed to msgpack.
+    if code is None:
+        code = _read_exact(stream, 1)[0]
+
+    if 0x80 <= code <= 0x8F or code in (0xDE, 0xDF):
+        size = code & 0x0F if code <= 0x8F else _read_msgpack_length(stream, 2 if code == 0xDE else 4)
+        obj = {}
+        for _ in range(size):
+            key = _read_msgpackext(stream)
+            if key == b"data" and b"_nd_" in obj:
+                obj[key] = _read_msgpack_payload(stream, obj)
+            else:
+                obj[key] = _read_msgpackext(stream)
+        if b"_nd_" in obj:
+            data = obj[b"data"]
+            arr = data.view(obj[b"dtype"]) if isinstance(data, np.ndarray) else np.frombuffer(data, obj[b"dtype"])
+            if b"shape" in obj:
+                arr.shape = obj[b"shape"]
+            return arr
+        return obj
+
+    elif 0x90 <= code <= 0x9F or code in (0xDC, 0xDD):
+        size = code & 0x0F if code <= 0x9F else _read_msgpack_length(stream, 2 if code == 0xDC else 4)
+        return [_read_msgpackext(stream) for _ in range(size)]
+
+    blob = bytes([code])
+    if code in _msgpack_var:
+        lenlen, extra = _msgpack_var[code]
+        length = _read_exact(stream, lenlen)
+        blob += length + _read_exact(stream, struct.unpack(_msgpack_uint[lenlen], length)[0] + extra)
+    elif 0xA0 <= code <= 0xBF:
+        blob += _read_exact(stream, code & 0x1F)
+    elif code in _msgpack_fixed:
+        blob += _read_exact(stream, _msgpack_fixed[code])
+    elif code == 0xC1:
+        raise ValueError("Invalid msgpack type byte 0xc1.")
+
+    return msgpack.unpackb(blob, raw=False)
+
+
+def msgpackext_dump(data: Any, stream: IO[bytes], *, chunk_size: int = 2**24) -> None:
+    r"""Serializes a Python object to a binary stream in the msgpack-ext format of :func:`msgpackext_dumps`.
+
+    Array payloads are written straight from the array memory in `chunk_size` pieces, so no serialized copy
+    of the data is ever held in memory. Arrays larger than the 4 GiB msgpack limit are framed as a list of bins.
+
+    Parameters
+    ----------
+    data : Any
+        A encodable python object.
+    stream : IO[bytes]
+        A writeable binary file-like object, such as an open file or ``socket.makefile("wb")``.
+    chunk_size : int, optional
+        Largest single write to `stream`, in bytes.
+    """
+    which_import("msgpack", raise_error=True, raise_msg=_msgpack_which_msg)
+
+    packer = msgpack.Packer(default=msgpackext_encode, use_bin_type=True)
+    _write_msgpackext(stream, packer, data, chunk_size)
+
+
+def msgpackext_load(stream: IO[bytes]) -> Any:
+    r"""Deserializes one object in the msgpack-ext format from a binary stream.
+
+    Each array payload is read directly into a single, aligned, writeable array, so peak memory is about the
+    size of the decoded object. Reads exactly one object, leaving `stream` positioned after it.
+
+    Parameters
+    ----------
+    stream : IO[bytes]
+        A readable binary file-like object, such as an open file or ``socket.makefile("rb")``.
+
+    Returns
+    -------
+    Any
+        The deserialized Python objects.
+    """
+    which_import("msgpack", raise_error=True, raise_msg=_msgpack_which_msg)
+
+    return _read_msgpackext(stream)
+
+
+## JSON backends
+
+_json_backends = ["json", "orjson"]
+# Engine behind the 'json' and 'json-ext' encodings, see `set_json_backend`
+_json_backend = "json"
+
+
+def get_json_backend() -> str:
+    r"""Name of the library that currently reads and writes the 'json' and 'json-ext' encodings.
+
+    Returns
+    -------
+    str
+        One of {'json', 'orjson'}.
+    """
+
+    return _json_backend
+
+
+def set_json_backend(backend: Optional[str] = None) -> None:
+    r"""Selects the library that reads and writes the 'json' and 'json-ext' encodings.
+
+    Parameters
+    ----------
+    backend : str, optional
+        'json' for the standard library, the default, or 'orjson', which is several times faster, especially
+        for writing floating-point data. If None, reverts to the default.
+
+    Notes
+    -----
+    Both backends produce equivalent documents, but not identical text: orjson writes compact separators and
+    leaves non-ASCII characters unescaped. Documents that orjson can not write faithfully (e.g., integers beyond
+    64 bits, or NaN and infinities, which it would write as ``null``) or read (e.g., ``NaN``) fall back to the
+    standard library, which writes and reads the non-standard ``NaN`` and ``Infinity``.
+    """
+
+    global _json_backend
+
+    if backend is None:
+        backend = "json"
+    elif backend not in _json_backends:
+        raise KeyError(f"JSON backend '{backend}' not understood, valid options: {_json_backends}")
+    elif backend == "orjson":
+        which_import("orjson", raise_error=True, raise_msg=_orjson_which_msg)
+
+    _json_backend = backend
+
+
+def _orjson_default(encoder: json.JSONEncoder, obj: Any) -> Any:
+    # orjson leaves float subclasses such as np.float64 to the default, unlike the standard library
+    if isinstance(obj, float):
+        return float(obj)
+    return encoder.default(obj)
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    # whether `obj` holds NaN or infinite floats, which orjson would write as null
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    elif isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    elif isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind in "fc":
+        return not np.all(np.isfinite(obj))
+    elif isinstance(obj, (np.floating, np.complexfloating)):
+        return not np.isfinite(obj)
+    return False
+
+
+def _json_object_hook(obj: Any, object_hook: Callable[[Dict[str, Any]], Any]) -> Any:
+    # applies `object_hook` to every JSON object, innermost first, as json.loads does
+    if isinstance(obj, dict):
+        return object_hook({k: _json_object_hook(v, object_hook) for k, v in obj.items()})
+    elif isinstance(obj, list):
+        return [_json_object_hook(v, object_hook) for v in obj]
+    return obj
+
+
+def _json_dumps(data: Any, encoder: Type[json.JSONEncoder], **kwargs: Any) -> str:
+    if _json_backend == "orjson":
+        try:
+            blob = orjson.dumps(
+                data, default=partial(_orjson_default, encoder(**kwargs)), option=orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass  # the standard library writes it or raises the error
+        else:
+            # NaN and infinities come out as null, so only then look for them, to write them instead
+            if b"null" not in blob or not _has_nonfinite(data):
+                return blob.decode()
+
+    return json.dumps(data, cls=encoder, **kwargs)
+
+
+def _json_loads(data: Union[str, bytes], object_hook: Callable[[Dict[str, Any]], Any]) -> Any:
+    if _json_backend == "orjson":
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # the standard library reads it or raises the error
+        else:
+            # only array objects need the hook, so skip walking documents that have none
+            if ("_nd_" if isinstance(data, str) else b"_nd_") in data:
+                obj = _json_object_hook(obj, object_hook)
+            return obj
+
+    return json.loads(data, object_hook=object_hook)
 
 
 ## JSON Ext
 
 
 class JSONExtArrayEncoder(json.JSONEncoder):
+    def __init__(self, *args, shuffle: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shuffle = shuffle
+
     def default(self, obj: Any) -> Any:
         try:
             return pydantic_encoder(obj)
@@ -129,9 +544,13 @@ class JSONExtArrayEncoder(json.JSONEncoder):
 
         if isinstance(obj, np.ndarray):
             if obj.shape:
-                data = {"_nd_": True, "dtype": obj.dtype.str, "data": np.ascontiguousarray(obj).tobytes().hex()}
+                shuffle = self.shuffle and obj.dtype.itemsize > 1
+                raw = _byte_shuffle(obj) if shuffle else np.ascontiguousarray(obj).tobytes()
+                data = {"_nd_": True, "dtype": obj.dtype.str, "data": raw.hex()}
                 if len(obj.shape) > 1:
                     data["shape"] = obj.shape
+                if shuffle:
+                    data["shuffle"] = True
                 return data
 
             else:
@@ -143,7 +562,10 @@ class JSONExtArrayEncoder(json.JSONEncoder):
 
 def jsonext_decode(obj: Any) -> Any:
     if "_nd_" in obj:
-        arr = np.frombuffer(bytes.fromhex(obj["data"]), dtype=obj["dtype"])
+        if "shuffle" in obj:
+            arr = _byte_unshuffle(bytes.fromhex(obj["data"]), obj["dtype"])
+        else:
+            arr = np.frombuffer(bytes.fromhex(obj["data"]), dtype=obj["dtype"])
         if "shape" in obj:
             arr.shape = obj["shape"]
 
@@ -152,7 +574,7 @@ def jsonext_decode(obj: Any) -> Any:
     return obj
 
 
-def jsonext_dumps(data: Any) -> str:
+def jsonext_dumps(data: Any, *, shuffle: bool = False) -> str:
     r"""Safe serialization of Python objects to JSON string representation using all known encoders.
     The JSON serializer uses a custom array syntax rather than flat JSON lists.
 
@@ -160,6 +582,8 @@ def jsonext_dumps(data: Any) -> str:
     ----------
     data : Any
         A encodable python object.
+    shuffle : bool, optional
+        If True, array data with multi-byte elements is stored byte-shuffled, which helps later compression.
 
     Returns
     -------
@@ -167,7 +591,7 @@ def jsonext_dumps(data: Any) -> str:
         A JSON representation of the data.
     """
 
-    return json.dumps(data, cls=JSONExtArrayEncoder)
+    return _json_dumps(data, JSONExtArrayEncoder, shuffle=shuffle)
 
 
 def jsonext_loads(data: Union[str, bytes]) -> Any:
@@ -184,7 +608,155 @@ def jsonext_loads(data: Union[str, bytes]) -> Any:
         The deserialized Python objects.
     """
 
-    return json.loads(data, object_hook=jsonext_decode)
+    return _json_loads(data, jsonext_decode)
+
+
+## NPZ Ext
+
+# Archive member holding everything but the arrays
+_npzext_json = "data.json"
+# Member data offsets are padded to this many bytes, so arrays mapped from the archive are aligned
+_npzext_align = 64
+# ZIP extra-field id for alignment padding, as used by Android's zipalign
+_npzext_pad_id = 0xD935
+
+
+class NPZExtArrayEncoder(json.JSONEncoder):
+    r"""JSON encoder that sets aside each array for its own archive member, leaving a reference in its place.
+    After encoding, ``arrays`` holds ``(member name, array)`` pairs in order.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.arrays = []
+
+    def default(self, obj: Any) -> Any:
+        try:
+            return pydantic_encoder(obj)
+        except TypeError:
+            pass
+
+        if isinstance(obj, np.ndarray):
+            if obj.shape and not obj.dtype.hasobject:
+                name = f"arr_{len(self.arrays)}.npy"
+                self.arrays.append((name, obj))
+                return {"_nd_": True, "npy": name}
+
+            else:
+                # Converts np.array(5) -> 5
+                return obj.tolist()
+
+        return json.JSONEncoder.default(self, obj)
+
+
+def _npzext_member_array(archive: zipfile.ZipFile, buffer: Any, name: str) -> np.ndarray:
+    r"""Array of the ``.npy`` member `name` of `archive`, a view into `buffer` (the archive's bytes) if stored."""
+
+    zinfo = archive.getinfo(name)
+    with archive.open(zinfo) as member:
+        version = np.lib.format.read_magic(member)
+        if zinfo.compress_type != zipfile.ZIP_STORED or version not in [(1, 0), (2, 0)]:
+            member.seek(0)
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+        read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+        shape, fortran_order, dtype = read_header(member)
+        header_size = member.tell()
+
+    # local file header: 30 fixed bytes, then file name and extra field
+    local = bytes(buffer[zinfo.header_offset : zinfo.header_offset + 30])
+    name_size, extra_size = struct.unpack("<HH", local[26:30])
+    offset = zinfo.header_offset + 30 + name_size + extra_size + header_size
+
+    return np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset, order="F" if fortran_order else "C")
+
+
+def _npzext_decode_archive(buffer: Any, stream: Optional[IO[bytes]] = None) -> Any:
+    r"""Decodes the archive whose bytes are `buffer`, read through `stream` if given, else through `buffer`."""
+    with zipfile.ZipFile(io.BytesIO(buffer) if stream is None else stream) as archive:
+
+        def npzext_decode(obj: Any) -> Any:
+            if "_nd_" in obj:
+                return _npzext_member_array(archive, buffer, obj["npy"])
+            return obj
+
+        return json.loads(archive.read(_npzext_json), object_hook=npzext_decode)
+
+
+def npzext_dumps(data: Any) -> bytes:
+    r"""Safe serialization of a Python object to a ZIP container, with all known encoders. NumPy arrays are
+    stored uncompressed as separate ``.npy`` members aligned for memory mapping, and the rest of the object is
+    stored as a JSON member in which each array is replaced by a reference to its member.
+
+    Parameters
+    ----------
+    data : Any
+        A encodable python object.
+
+    Returns
+    -------
+    bytes
+        The ZIP archive in bytes. Readable with :func:`numpy.load` and any ZIP tool.
+    """
+
+    encoder = NPZExtArrayEncoder()
+    text = encoder.encode(data)
+
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        archive.writestr(_npzext_json, text)
+
+        for name, arr in encoder.arrays:
+            zinfo = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            zinfo.file_size = arr.nbytes + 4 * _npzext_align  # upper bound on the npy header, for zip64
+            zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+            # pad the local header so that member data, and so array data after the aligned npy header, is aligned
+            fixed = stream.tell() + 30 + len(name.encode()) + 4 + (20 if zip64 else 0)
+            zinfo.extra = struct.pack("<HH", _npzext_pad_id, -fixed % _npzext_align) + bytes(-fixed % _npzext_align)
+
+            with archive.open(zinfo, mode="w") as member:
+                np.lib.format.write_array(member, arr, allow_pickle=False)
+
+    return stream.getvalue()
+
+
+def npzext_loads(data: bytes) -> Any:
+    r"""Deserializes a ZIP container from :func:`npzext_dumps` into Python objects.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized ZIP archive.
+
+    Returns
+    -------
+    Any
+        The deserialized Python objects. NumPy arrays are zero-copy, read-only views into `data`.
+    """
+
+    return _npzext_decode_archive(data)
+
+
+def npzext_load(stream: IO[bytes]) -> Any:
+    r"""Deserializes a ZIP container from :func:`npzext_dumps` by memory-mapping an open file rather than
+    reading it.
+
+    Parameters
+    ----------
+    stream : IO[bytes]
+        A binary file object backed by a real file (one with ``fileno()``), such as ``open(path, "rb")``. It
+        may be closed once this function returns.
+
+    Returns
+    -------
+    Any
+        The deserialized Python objects. NumPy arrays are read-only views into a read-only mapping of the file,
+        so only the JSON member and array headers are read here; array data is paged in from disk when it is
+        first touched, and the mapping is released with the last array that refers to it.
+    """
+
+    return _npzext_decode_archive(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ), stream)
 
 
 ## JSON
@@ -220,7 +792,7 @@ def json_dumps(data: Any) -> str:
         A JSON representation of the data.
     """
 
-    return json.dumps(data, cls=JSONArrayEncoder)
+    return _json_dumps(data, JSONArrayEncoder)
 
 
 def json_loads(data: str) -> Any:
@@ -238,7 +810,7 @@ def json_loads(data: str) -> Any:
     """
 
     # Doesn't hurt anything to try to load JSONext as well
-    return json.loads(data, object_hook=jsonext_decode)
+    return _json_loads(data, jsonext_decode)
 
 
 ## MSGPack
@@ -313,9 +885,112 @@ def msgpack_loads(data: str) -> Any:
     return msgpack.loads(data, object_hook=msgpackext_decode, raw=False)
 
 
+## Compression
+
+# Leading bytes of each compressed format
+_codec_magic = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+    "lz4": b"\x04\x22\x4d\x18",
+}
+# Encodings that may be compressed, as '<encoding>+<codec>'
+_compressible = ["json", "json-ext", "msgpack", "msgpack-ext"]
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        # zlib with a gzip header, written without a timestamp so output is reproducible
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    elif codec == "bz2":
+        return bz2.compress(data)
+    elif codec == "xz":
+        return lzma.compress(data)
+    elif codec == "zstd":
+        if which_import("compression.zstd", return_bool=True):
+            from compression import zstd  # Python 3.14+
+
+            return zstd.compress(data)
+        which_import("zstandard", raise_error=True, raise_msg=_zstd_which_msg)
+        import zstandard
+
+        return zstandard.compress(data)
+    elif codec == "lz4":
+        which_import("lz4", raise_error=True, raise_msg=_lz4_which_msg)
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    else:
+        raise KeyError(f"Compression '{codec}' not understood, valid options: {list(_codec_magic)}")
+
+
+def _decompress(data: bytes, codec: str, max_length: int = -1) -> bytes:
+    r"""Decompresses `data`, or, if `max_length` is positive, at most its first `max_length` bytes."""
+    if codec == "gzip":
+        return zlib.decompress(data, 47) if max_length < 0 else zlib.decompressobj(47).decompress(data, max_length)
+    elif codec == "bz2":
+        return bz2.decompress(data) if max_length < 0 else bz2.BZ2Decompressor().decompress(data, max_length)
+    elif codec == "xz":
+        return lzma.decompress(data) if max_length < 0 else lzma.LZMADecompressor().decompress(data, max_length)
+    elif codec == "zstd":
+        if which_import("compression.zstd", return_bool=True):
+            from compression import zstd  # Python 3.14+
+
+            return zstd.decompress(data) if max_length < 0 else zstd.ZstdDecompressor().decompress(data, max_length)
+        which_import("zstandard", raise_error=True, raise_msg=_zstd_which_msg)
+        import zstandard
+
+        if max_length < 0:
+            return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            return reader.read(max_length)
+    elif codec == "lz4":
+        which_import("lz4", raise_error=True, raise_msg=_lz4_which_msg)
+        import lz4.frame
+
+        return lz4.frame.LZ4FrameDecompressor().decompress(data, max_length)
+    else:
+        raise KeyError(f"Compression '{codec}' not understood, valid options: {list(_codec_magic)}")
+
+
 ## Helper functions
 
 
+def detect_encoding(blob: Union[str, bytes]) -> str:
+    r"""Identifies the encoding of a serialized blob from its leading bytes.
+
+    Parameters
+    ----------
+    blob : Union[str, bytes]
+        The serialized data.
+
+    Returns
+    -------
+    str
+        'json' for JSON text (including 'json-ext', which decodes alike), 'npz-ext' for ZIP containers, and
+        otherwise 'msgpack-ext' (which also decodes 'msgpack'). Compressed data is identified from the start
+        of its decompressed content and suffixed '+<codec>', e.g., 'msgpack-ext+zstd'. Pickles are never
+        detected.
+    """
+
+    if isinstance(blob, str):
+        return "json"
+
+    for codec, magic in _codec_magic.items():
+        if blob.startswith(magic):
+            head = _decompress(blob, codec, max_length=64)
+            return ("json" if head.lstrip()[:1] in [b"{", b"["] else "msgpack-ext") + "+" + codec
+
+    if blob.startswith(b"PK\x03\x04"):
+        return "npz-ext"
+    elif blob.lstrip()[:1] in [b"{", b"["]:
+        return "json"
+    else:
+        return "msgpack-ext"
+
+
 def serialize(data: Any, encoding: str) -> Union[str, bytes]:
     r"""Encoding Python objects using the provided encoder.
 
@@ -324,14 +999,29 @@ def serialize(data: Any, encoding: str) -> Union[str, bytes]:
     data : Any
         A encodable python object.
     encoding : str
-        The type of encoding to perform: {'json', 'json-ext', 'msgpack-ext'}
+        The type of encoding to perform: {'json', 'json-ext', 'msgpack', 'msgpack-ext', 'npz-ext'}, or any but
+        'npz-ext' compressed as '<encoding>+<codec>' with codec {'gzip', 'bz2', 'xz', 'zstd', 'lz4'}, e.g.,
+        'msgpack-ext+zstd'. 'zstd' needs Python 3.14 or the zstandard package, 'lz4' the lz4 package. Arrays in
+        compressed 'json-ext' and 'msgpack-ext' are byte-shuffled first.
 
     Returns
     -------
     Union[str, bytes]
-        A serialized representation of the data.
+        A serialized representation of the data. Compressed encodings are bytes.
 
     """
+    base, plus, codec = encoding.lower().partition("+")
+    if plus:
+        if base == "json-ext":
+            blob = jsonext_dumps(data, shuffle=True)
+        elif base == "msgpack-ext":
+            blob = msgpackext_dumps(data, shuffle=True)
+        elif base in _compressible:
+            blob = serialize(data, base)
+        else:
+            raise KeyError(f"Encoding '{base}' can not be compressed, valid options: {_compressible}")
+        return _compress(blob.encode() if isinstance(blob, str) else blob, codec)
+
     if encoding.lower() == "json":
         return json_dumps(data)
     elif encoding.lower() == "json-ext":
@@ -340,8 +1030,12 @@ def serialize(data: Any, encoding: str) -> Union[str, bytes]:
         return msgpack_dumps(data)
     elif encoding.lower() == "msgpack-ext":
         return msgpackext_dumps(data)
+    elif encoding.lower() == "npz-ext":
+        return npzext_dumps(data)
     else:
-        raise KeyError(f"Encoding '{encoding}' not understood, valid options: 'json', 'json-ext', 'msgpack-ext'")
+        raise KeyError(
+            f"Encoding '{encoding}' not understood, valid options: 'json', 'json-ext', 'msgpack-ext', 'npz-ext'"
+        )
 
 
 def deserialize(blob: Union[str, bytes], encoding: str) -> Any:
@@ -352,13 +1046,22 @@ def deserialize(blob: Union[str, bytes], encoding: str) -> Any:
     blob : Union[str, bytes]
         The serialized data.
     encoding : str
-        The type of encoding of the blob: {'json', 'json-ext', 'msgpack'}
+        The type of encoding of the blob: {'json', 'json-ext', 'msgpack', 'msgpack-ext', 'npz-ext'}, or a
+        compressed '<encoding>+<codec>' as in :func:`serialize`. See :func:`detect_encoding` to identify it.
 
     Returns
     -------
     Any
         The deserialized Python objects.
     """
+    base, plus, codec = encoding.lower().partition("+")
+    if plus:
+        if base not in _compressible:
+            raise KeyError(f"Encoding '{base}' can not be compressed, valid options: {_compressible}")
+        assert isinstance(blob, bytes)
+        blob = _decompress(blob, codec)
+        return deserialize(blob.decode() if base == "json" else blob, base)
+
     if encoding.lower() == "json":
         assert isinstance(blob, str)
         return json_loads(blob)
@@ -371,7 +1074,11 @@ def deserialize(blob: Union[str, bytes], encoding: str) -> Any:
     elif encoding.lower() in ["msgpack-ext"]:
         assert isinstance(blob, bytes)
         return msgpackext_loads(blob)
+    elif encoding.lower() in ["npz-ext"]:
+        assert isinstance(blob, bytes)
+        return npzext_loads(blob)
     else:
         raise KeyError(
-            f"Encoding '{encoding}' not understood, valid options: 'json', 'json-ext', 'msgpack', 'msgpack-ext'"
+            f"Encoding '{encoding}' not understood, valid options: 'json', 'json-ext', 'msgpack', 'msgpack-ext', "
+            "'npz-ext'"
         )
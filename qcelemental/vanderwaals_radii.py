@@ -8,6 +8,7 @@ from typing import Dict, Union
 
 from .datum import Datum, print_variables
 from .exceptions import DataUnavailableError
+from .lazy import LazySingleton
 from .periodic_table import periodictable
 
 
@@ -171,4 +172,4 @@ class VanderWaalsRadii:
 
 
 # singleton
-vdwradii = VanderWaalsRadii("MANTINA2009")
+vdwradii = LazySingleton(VanderWaalsRadii, "MANTINA2009")